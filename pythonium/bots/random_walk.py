@@ -1,5 +1,3 @@
-import random
-
 from ..player import AbstractPlayer
 from ..ship import Ship
 
@@ -17,7 +15,9 @@ class Player(AbstractPlayer):
 
         for ship in my_ships:
             nearby_planets = galaxy.nearby_planets(ship.position, ship.speed)
-            destination = random.choice(nearby_planets)
+            destination = nearby_planets[
+                self.rng.integers(len(nearby_planets))
+            ]
             ship.target = destination.position
 
         return galaxy
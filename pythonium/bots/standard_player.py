@@ -1,5 +1,3 @@
-import random
-
 import attr
 
 from ..player import AbstractPlayer
@@ -70,9 +68,13 @@ class Player(AbstractPlayer):
                     if not p.player and p.id not in visited_planets
                 ]
                 if unknown_nearby_planets:
-                    destination = random.choice(unknown_nearby_planets)
+                    destination = unknown_nearby_planets[
+                        self.rng.integers(len(unknown_nearby_planets))
+                    ]
                 else:
-                    destination = random.choice(nearby_planets)
+                    destination = nearby_planets[
+                        self.rng.integers(len(nearby_planets))
+                    ]
 
                 ship.target = destination.position
 
@@ -80,7 +82,7 @@ class Player(AbstractPlayer):
             planet.taxes = context.get("tolerable_taxes")
             planet.new_mines = planet.can_build_mines()
 
-            if random.random() > self.tenacity:
+            if self.rng.random() > self.tenacity:
                 next_ship = context["ship_types"]["carrier"]
             else:
                 next_ship = context["ship_types"]["war"]
@@ -15,6 +15,10 @@ ship_speed = 80
 planet_max_mines = 500
 taxes_collection_factor = 0.2
 max_clans_in_planet = 10000
+planets_per_grid_cell = 4
+# "entity" logs one event per entity affected by an order, "summary" logs
+# the per turn and player aggregates of those events
+events_granularity = "entity"
 font_path = "font/jmh_typewriter.ttf"
 
 
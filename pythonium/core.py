@@ -1,22 +1,30 @@
+import copy
 import uuid
 from abc import ABC
-from typing import NewType, Tuple
+from typing import NewType, Optional, Tuple
 
 import attr
 
 Position = NewType("Position", Tuple[int, int])
 
 
-@attr.s
+@attr.s(slots=True, weakref_slot=False)
 class StellarThing(ABC):
     position: Position = attr.ib(converter=Position)
     """
     Position of the `StellarThing` in (x, y) coordinates.
+
+    Once the thing is in a :class:`Galaxy`, ships must be moved with
+    :meth:`Galaxy.move_ship` or :meth:`Galaxy.move_ships`. Assigning the position
+    directly leaves the galaxy indexes out of date.
     """
 
-    id: uuid = attr.ib(factory=uuid.uuid4)
+    id: int = attr.ib(default=None)
     """
-    Unique identifier for the `StellarThing`
+    Unique identifier for the `StellarThing`.
+
+    A dense integer assigned by the :class:`Galaxy` when the thing is added to it,
+    so it can be used to index array-backed state. ``None`` until then.
     """
 
     player: str = attr.ib(default=None)
@@ -24,5 +32,33 @@ class StellarThing(ABC):
     The owner of the ``StellarThing`` or ``None`` if no one owns it.
     """
 
+    _uuid: Optional[uuid.UUID] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+
+    @property
+    def uuid(self) -> uuid.UUID:
+        """
+        Universally unique label for the `StellarThing`, generated the first time
+        is requested.
+
+        Meant to identify the thing outside the engine (logs, files, etc). The
+        engine itself only uses :attr:`id`.
+        """
+        if self._uuid is None:
+            self._uuid = uuid.uuid4()
+        return self._uuid
+
     def move(self, position: Position) -> None:
         raise NotImplementedError
+
+    def __deepcopy__(self, memo):
+        # Copy the slots one by one. It is much faster than the generic
+        # ``__reduce_ex__`` protocol that ``copy.deepcopy`` uses otherwise.
+        cls = self.__class__
+        clone = object.__new__(cls)
+        memo[id(self)] = clone
+        for field in cls.__attrs_attrs__:
+            value = getattr(self, field.name)
+            object.__setattr__(clone, field.name, copy.deepcopy(value, memo))
+        return clone
@@ -1,5 +1,16 @@
-from itertools import groupby
-from typing import Dict, Iterable, Iterator, List, Set, Tuple
+import math
+from collections import Counter
+from types import MappingProxyType
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import numpy as np
 
@@ -8,6 +19,89 @@ from .core import Position, StellarThing
 from .explosion import Explosion
 from .planet import Planet
 from .ship import Ship
+from .spatial import SpatialGrid
+from .state import GalaxyState
+from .views import PlanetView, ShipView
+
+NO_PLAYER = -1
+"""
+Handle of the player of the things that do not belong to any player.
+See :meth:`Galaxy.get_player_handle`
+"""
+
+
+def group_ships(
+    positions: np.ndarray, owners: np.ndarray, attacks: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Group ships by position, and the ships of each position by owner.
+
+    Ships do not need to be sorted: groups are numbered in order of first
+    appearance, so the results do not depend on where each ship is in the arrays.
+
+    :param positions: Array of shape ``(N, 2)`` with the position of each ship
+    :param owners: Player handle of each ship (see :meth:`Galaxy.get_player_handle`)
+    :param attacks: Attack of each ship
+
+    Return a dict of arrays with:
+
+    * ``group``: Group of each ship
+    * ``first``: First ship of each group
+    * ``players``: Amount of players (ignoring :data:`NO_PLAYER`) in each group
+    * ``attack``: Total attack in each group
+    * ``pairs_group``, ``pairs_owner``, ``pairs_attack``: Total attack of each \
+        owner in each group, sorted by group and first appearance of the owner
+    """
+    if not len(owners):
+        empty = np.empty(0, dtype=np.int64)
+        return {
+            "group": empty,
+            "first": empty,
+            "players": empty,
+            "attack": empty,
+            "pairs_group": empty,
+            "pairs_owner": empty,
+            "pairs_attack": empty,
+        }
+
+    _, first, inverse = np.unique(
+        positions, axis=0, return_index=True, return_inverse=True
+    )
+    inverse = inverse.reshape(-1)
+    # Renumber the groups in order of first appearance
+    appearance = np.argsort(first, kind="stable")
+    rank = np.empty_like(appearance)
+    rank[appearance] = np.arange(len(appearance))
+    group = rank[inverse]
+    first = first[appearance]
+    groups_count = len(first)
+
+    # One key per (group, owner) pair. Owners are shifted to skip NO_PLAYER.
+    width = owners.max() + 2
+    keys = group * width + owners + 1
+    pairs, pairs_first, pairs_inverse = np.unique(
+        keys, return_index=True, return_inverse=True
+    )
+    pairs_attack = np.bincount(
+        pairs_inverse.reshape(-1), weights=attacks, minlength=len(pairs)
+    ).astype(np.int64)
+    pairs_order = np.lexsort((pairs_first, pairs // width))
+    pairs_group = (pairs // width)[pairs_order]
+    pairs_owner = (pairs % width - 1)[pairs_order]
+
+    return {
+        "group": group,
+        "first": first,
+        "players": np.bincount(
+            pairs_group[pairs_owner != NO_PLAYER], minlength=groups_count
+        ),
+        "attack": np.bincount(
+            group, weights=attacks, minlength=groups_count
+        ).astype(np.int64),
+        "pairs_group": pairs_group,
+        "pairs_owner": pairs_owner,
+        "pairs_attack": pairs_attack[pairs_order],
+    }
 
 
 class Galaxy:
@@ -44,11 +138,6 @@ class Galaxy:
         Width and height of the galaxy
         """
 
-        self.stellar_things = things
-        """
-        All the things that compounds the galaxy
-        """
-
         self._planets: Dict[Position, Planet] = {}
         """
         All the :class:`Planet` in the galaxy indexed by position
@@ -59,27 +148,234 @@ class Galaxy:
         A list with all the :class:`Ship` in the galaxy
         """
 
+        self._ships_tuple: Optional[Tuple[Ship, ...]] = None
+        """
+        Read-only copy of ``_ships`` returned by :attr:`ships`, or ``None`` if it
+        is out of date
+        """
+
+        self._generation: int = 0
+        """
+        Counter of mutations of the galaxy. See :attr:`generation`
+        """
+
+        self._stellar_things: Tuple[int, List[StellarThing]] = (-1, [])
+        """
+        Cached list of all the things in the galaxy, and the generation in which
+        was built
+        """
+
         self.explosions: List[Explosion] = explosions or []
         """
         A list with all the recent :class:`Explosion`.
         """
 
+        self._planets_by_id: Dict[int, Planet] = {}
+        """
+        All the :class:`Planet` in the galaxy indexed by id
+        """
+
+        self._ships_by_id: Dict[int, Ship] = {}
+        """
+        All the :class:`Ship` in the galaxy indexed by id
+        """
+
+        self._ships_by_position: Dict[Position, List[Ship]] = {}
+        """
+        All the :class:`Ship` in the galaxy grouped by position
+        """
+
+        self._planets_by_player: Dict[str, Dict[int, Planet]] = {}
+        """
+        All the :class:`Planet` in the galaxy grouped by owner, and indexed by id
+        """
+
+        self._ocuped_planets: Dict[int, Planet] = {}
+        """
+        All the :class:`Planet` in the galaxy that have an owner, indexed by id
+        """
+
+        self._ships_by_player: Dict[str, Dict[int, Ship]] = {}
+        """
+        All the :class:`Ship` in the galaxy grouped by owner, and indexed by id
+        """
+
+        self._ships_types_by_player: Dict[str, Counter] = {}
+        """
+        Amount of ships of each type name that belong to each player
+        """
+
+        self._next_id: int = (
+            max((t.id for t in things if t.id is not None), default=-1) + 1
+        )
+        """
+        Id to assign to the next thing without id added to the galaxy
+        """
+
+        self._players: List[str] = []
+        """
+        Known players, indexed by its handle
+        """
+
+        self._players_handles: Dict[str, int] = {}
+        """
+        Handle of each known player, indexed by the player name
+        """
+
+        self._changes: List[Set[Position]] = []
+        """
+        Positions changed since they were read by each tracker.
+        See :meth:`track_changes`
+        """
+
+        self._state: GalaxyState = None
+        """
+        State of the planets of the galaxy, built the first time it is requested.
+        See :attr:`state`
+        """
+
+        self._changed_planets: Set[int] = set()
+        """
+        Ids of the planets that changed since :attr:`state` was refreshed
+        """
+
+        for thing in things:
+            self._assign_id(thing)
+            if isinstance(thing, (Planet, PlanetView)):
+                self._planets[thing.position] = thing
+                self._planets_by_id[thing.id] = thing
+                self._index_planet_player(thing)
+            elif isinstance(thing, (Ship, ShipView)):
+                self._ships.append(thing)
+                self._index_ship(thing)
+
+        self._planets_by_index: List[Planet] = []
+        """
+        All the :class:`Planet` in the galaxy, in the same order as the rows of
+        ``_planets_positions``
+        """
+
+        self._planets_positions: np.ndarray = None
+        """
+        Array of shape ``(N, 2)`` with the position of each planet in
+        ``_planets_by_index``
+        """
+
+        self._planets_grid: SpatialGrid = None
+        """
+        Spatial index of the planets positions, aligned with ``_planets_by_index``
+        """
+
     @property
-    def planets(self):
-        if not self._planets:
-            planets = filter(
-                lambda t: isinstance(t, Planet), self.stellar_things
-            )
-            self._planets = {p.position: p for p in planets}
-        return self._planets
+    def planets(self) -> Mapping[Position, Planet]:
+        """
+        All the :class:`Planet` in the galaxy indexed by position, in a read-only
+        mapping.
+        """
+        return MappingProxyType(self._planets)
 
     @property
-    def ships(self):
-        if not self._ships:
-            self._ships = list(
-                filter(lambda t: isinstance(t, Ship), self.stellar_things)
+    def ships(self) -> Tuple[Ship, ...]:
+        """
+        A tuple with all the :class:`Ship` in the galaxy
+        """
+        ships = self._ships_tuple
+        if ships is None:
+            ships = self._ships_tuple = tuple(self._ships)
+        return ships
+
+    @property
+    def stellar_things(self) -> List[StellarThing]:
+        """
+        All the things that compounds the galaxy
+        """
+        generation, things = self._stellar_things
+        if generation != self._generation:
+            things = list(self._planets.values()) + self._ships
+            self._stellar_things = (self._generation, things)
+        return things
+
+    @property
+    def generation(self) -> int:
+        """
+        Counter of mutations of the galaxy.
+
+        It increases every time a ship is added, moved or removed, or a planet changes
+        its owner. Caches derived from the galaxy state can store the generation in
+        which they were built and check it to know if they are outdated.
+        """
+        return self._generation
+
+    @property
+    def state(self) -> GalaxyState:
+        """
+        Columnar state of all the planets in the galaxy (no ships).
+
+        The state is built the first time it is requested, and kept across turns.
+        The planets report every change to the galaxy, so each time the state is
+        requested only the rows of the planets that changed are read again.
+
+        Changes done to the state must be written back with
+        :meth:`GalaxyState.commit` before changing the planets again.
+        """
+        if self._state is None:
+            for planet in self._planets.values():
+                if isinstance(planet, Planet):
+                    planet._changes_tracker = self._changed_planets
+            self._state = GalaxyState(
+                self, ships=(), changes=self._changed_planets
             )
-        return self._ships
+        elif self._changed_planets:
+            self._state.planets.refresh(self._changed_planets)
+        self._changed_planets.clear()
+        return self._state
+
+    def _index_planets(self):
+        self._planets_by_index = list(self.planets.values())
+        positions = np.array(
+            [p.position for p in self._planets_by_index], dtype=float
+        ).reshape(-1, 2)
+        positions.setflags(write=False)
+        self._planets_positions = positions
+
+        # Size the cells to hold ``cfg.planets_per_grid_cell`` planets on average
+        area = self.size[0] * self.size[1]
+        cell_size = math.sqrt(
+            area * cfg.planets_per_grid_cell / max(len(positions), 1)
+        )
+        self._planets_grid = SpatialGrid(positions, max(cell_size, 1))
+
+    @property
+    def planets_by_index(self) -> List[Planet]:
+        """
+        All the planets in the galaxy, in the same order as the rows of
+        :attr:`planets_positions` and the columns of :meth:`distances_matrix`.
+        """
+        if self._planets_grid is None:
+            self._index_planets()
+        return self._planets_by_index
+
+    @property
+    def planets_positions(self) -> np.ndarray:
+        """
+        Read-only array of shape ``(N, 2)`` with the position of every planet in
+        :attr:`planets_by_index`.
+
+        Planets never move, so the array is built once, the first time is needed.
+        """
+        if self._planets_grid is None:
+            self._index_planets()
+        return self._planets_positions
+
+    @property
+    def planets_grid(self) -> SpatialGrid:
+        """
+        Spatial index of the planets in the galaxy.
+        Indices are aligned with :attr:`planets_by_index`.
+        """
+        if self._planets_grid is None:
+            self._index_planets()
+        return self._planets_grid
 
     def __str__(self):
         return f"Galaxy(size={self.size}, planets={len(self.planets)})"
@@ -92,11 +388,9 @@ class Galaxy:
         """
         List all the known races that own at least one ship or one planet.
         """
-        return {
-            thing.player
-            for thing in self.stellar_things
-            if thing.player is not None
-        }
+        players = set(self._planets_by_player).union(self._ships_by_player)
+        players.discard(None)
+        return players
 
     @staticmethod
     def compute_distance(a: Position, b: Position) -> float:
@@ -108,21 +402,236 @@ class Galaxy:
         """
         return np.linalg.norm(np.array(a) - np.array(b))
 
+    @staticmethod
+    def compute_distances(
+        a: Iterable[Position], b: Iterable[Position]
+    ) -> np.ndarray:
+        """
+        Compute the distance in ly between every point in ``a`` and every point in ``b``.
+
+        Return an array of shape ``(len(a), len(b))`` where the element ``[i, j]`` is
+        the distance between ``a[i]`` and ``b[j]``.
+
+        :param a: Points of origin to compute the distances
+        :param b: Points of destination to compute the distances
+        """
+        a = np.asarray(a, dtype=float).reshape(-1, 2)
+        b = np.asarray(b, dtype=float).reshape(-1, 2)
+        dx = a[:, np.newaxis, 0] - b[np.newaxis, :, 0]
+        dy = a[:, np.newaxis, 1] - b[np.newaxis, :, 1]
+        return np.sqrt(dx * dx + dy * dy)
+
+    @property
+    def players(self) -> List[str]:
+        """
+        All the players that ever owned something in the galaxy, indexed by its
+        handle. See :meth:`get_player_handle`
+        """
+        return self._players
+
+    def get_player_handle(self, player: Optional[str]) -> int:
+        """
+        Return the integer handle of the ``player``, or :data:`NO_PLAYER` if ``None``.
+
+        Handles are dense integers assigned in order of appearance, so they can be
+        used to index arrays. Unknown players are registered on the fly.
+        """
+        if player is None:
+            return NO_PLAYER
+        handle = self._players_handles.get(player)
+        if handle is None:
+            handle = len(self._players)
+            self._players.append(player)
+            self._players_handles[player] = handle
+        return handle
+
+    def get_player(self, handle: int) -> Optional[str]:
+        """
+        Return the name of the player with the given ``handle``
+        """
+        if handle == NO_PLAYER:
+            return None
+        return self._players[handle]
+
+    def _assign_id(self, thing: StellarThing):
+        if thing.id is None:
+            thing.id = self._next_id
+            self._next_id += 1
+        elif thing.id >= self._next_id:
+            self._next_id = thing.id + 1
+
+    def track_changes(self) -> Set[Position]:
+        """
+        Start to track the changes in the galaxy.
+
+        Return a set that collects the positions where a ship arrived, left, was
+        added or removed, or where a planet changed its owner. The other attributes
+        of ships and planets can change anywhere. The reader must clear the set
+        after processing it.
+        """
+        changes = set()
+        self._changes.append(changes)
+        return changes
+
+    def _track(self, positions: Iterable[Position]):
+        if not self._changes:
+            return
+        positions = set(positions)
+        for changes in self._changes:
+            changes |= positions
+
     def add_ship(self, ship: Ship):
         """
         Add a new ship to the known ships in the galaxy and assign an Id to it.
         """
-        self.stellar_things.append(ship)
-        self._ships = []
+        self._assign_id(ship)
+        self._ships.append(ship)
+        self._ships_tuple = None
+        self._index_ship(ship)
+        self._track((ship.position,))
+        self._generation += 1
+
+    def move_ship(self, ship: Ship, position: Position):
+        """
+        Move the ``ship`` to ``position``.
+
+        Ships must always be moved with this method to keep the index of ships by
+        position updated.
+        """
+        self._track((ship.position, position))
+        self._unindex_ship_position(ship)
+        ship.position = position
+        self._ships_by_position.setdefault(position, []).append(ship)
+        self._generation += 1
+
+    def move_ships(self, ships: List[Ship], positions: List[Position]):
+        """
+        Move each ship in ``ships`` to the position with the same index in
+        ``positions``.
+
+        Equivalent to call :meth:`move_ship` for each ship, but each group of ships
+        by position is rebuilt only once. ``ships`` must not contain duplicates.
+        """
+        if not ships:
+            return
+        moving_ships = set(map(id, ships))
+        ships_by_position = self._ships_by_position
+        origins = {ship.position for ship in ships}
+        self._track(origins)
+        self._track(positions)
+        for position in origins:
+            ships_in_position = ships_by_position[position]
+            if len(ships_in_position) == 1:
+                # The only ship in the position is moving
+                del ships_by_position[position]
+                continue
+            # Compare by identity. Ships with the same attributes are still
+            # different ships
+            remaining_ships = [
+                s for s in ships_in_position if id(s) not in moving_ships
+            ]
+            if remaining_ships:
+                ships_by_position[position] = remaining_ships
+            else:
+                del ships_by_position[position]
+        for ship, position in zip(ships, positions):
+            ship.position = position
+            ships_in_position = ships_by_position.get(position)
+            if ships_in_position is None:
+                ships_by_position[position] = [ship]
+            else:
+                ships_in_position.append(ship)
+        self._generation += 1
+
+    def set_planet_player(self, planet: Planet, player: str):
+        """
+        Change the owner of the ``planet``. ``None`` means that nobody owns it.
+
+        Planets owners must always be changed with this method to keep the index of
+        planets by player updated.
+        """
+        self._unindex_planet_player(planet)
+        planet.player = player
+        self._index_planet_player(planet)
+        self._track((planet.position,))
+        self._generation += 1
+
+    def _index_planet_player(self, planet: Planet):
+        self.get_player_handle(planet.player)
+        self._planets_by_player.setdefault(planet.player, {})[
+            planet.id
+        ] = planet
+        if planet.player is not None:
+            self._ocuped_planets[planet.id] = planet
+
+    def _unindex_planet_player(self, planet: Planet):
+        player_planets = self._planets_by_player.get(planet.player, {})
+        player_planets.pop(planet.id, None)
+        if not player_planets:
+            self._planets_by_player.pop(planet.player, None)
+        self._ocuped_planets.pop(planet.id, None)
+
+    def _index_ship(self, ship: Ship):
+        self.get_player_handle(ship.player)
+        self._ships_by_id[ship.id] = ship
+        self._ships_by_position.setdefault(ship.position, []).append(ship)
+        self._ships_by_player.setdefault(ship.player, {})[ship.id] = ship
+        self._ships_types_by_player.setdefault(ship.player, Counter())[
+            self._ship_type_name(ship)
+        ] += 1
+
+    def _unindex_ship_player(self, ship: Ship):
+        player_ships = self._ships_by_player.get(ship.player, {})
+        if player_ships.pop(ship.id, None) is not None:
+            self._ships_types_by_player[ship.player][
+                self._ship_type_name(ship)
+            ] -= 1
+        if not player_ships:
+            self._ships_by_player.pop(ship.player, None)
+            self._ships_types_by_player.pop(ship.player, None)
+
+    @staticmethod
+    def _ship_type_name(ship: Ship) -> Optional[str]:
+        return ship.type.name if ship.type is not None else None
+
+    def _unindex_ship_position(self, ship: Ship):
+        ships = self._ships_by_position.get(ship.position)
+        if ships is None:
+            return
+        # Compare by identity. Ships with the same attributes are still different ships
+        remaining_ships = [s for s in ships if s is not ship]
+        if remaining_ships:
+            self._ships_by_position[ship.position] = remaining_ships
+        else:
+            del self._ships_by_position[ship.position]
 
     def distances_to_planets(self, point: Position) -> Dict[Position, float]:
         """
         Compute the distance between the ``point`` and all the planets in the galaxy.
         """
+        distances = self.distances_matrix([point])[0]
         return dict(
-            ((p, self.compute_distance(p, point)) for p in self.planets.keys())
+            zip(
+                (p.position for p in self.planets_by_index),
+                distances.tolist(),
+            )
         )
 
+    def distances_matrix(self, points: Iterable[Position]) -> np.ndarray:
+        """
+        Compute the distance between each one of the ``points`` and all the planets
+        in the galaxy.
+
+        Return an array of shape ``(len(points), N)`` where the element ``[i, j]`` is
+        the distance between ``points[i]`` and the planet ``planets_by_index[j]``.
+
+        i.e: The distances between all your ships and all the planets
+
+        >>> ships = list(galaxy.get_player_ships(player_name))
+        >>> distances = galaxy.distances_matrix([s.position for s in ships])
+        """
+        return self.compute_distances(points, self.planets_positions)
+
     def nearby_planets(
         self,
         point: Position,
@@ -131,142 +640,262 @@ class Galaxy:
         """
         Return all the planets that are ``neighborhood`` light-years away or less.
         """
-        distances = self.distances_to_planets(point)
-        return list(
-            filter(
-                lambda p: distances[p.position] <= neighborhood,
-                self.planets.values(),
-            )
-        )
+        indices = self.planets_grid.query_radius(point, neighborhood)
+        return [self.planets_by_index[i] for i in indices.tolist()]
 
     def get_player_planets(self, player: str) -> Iterable[Planet]:
         """
         Returns an iterable for all the known planets that belongs to``player``
         """
-        for planet in filter(
-            lambda p: p.player == player, self.planets.values()
-        ):
+        player_planets = self._planets_by_player.get(player, {})
+        # Iterate over a copy. The owner of the planets can change meanwhile.
+        for planet in list(player_planets.values()):
             yield planet
 
     def get_player_ships(self, player: str) -> Iterable[Ship]:
         """
         Returns an iterable for known ships that belong to ``player``
         """
-        for ship in filter(lambda s: s.player == player, self.ships):
+        player_ships = self._ships_by_player.get(player, {})
+        for ship in list(player_ships.values()):
             yield ship
 
+    def count_player_planets(self, player: str) -> int:
+        """
+        Returns the number of known planets that belong to ``player``
+        """
+        return len(self._planets_by_player.get(player, {}))
+
+    def count_player_ships(self, player: str) -> int:
+        """
+        Returns the number of known ships that belong to ``player``
+        """
+        return len(self._ships_by_player.get(player, {}))
+
+    def count_player_ships_by_type(self, player: str) -> Dict[str, int]:
+        """
+        Returns the number of known ships that belong to ``player``, indexed by the
+        name of the ship type. Types without ships are not included.
+        """
+        ships_types = self._ships_types_by_player.get(player, {})
+        return {name: count for name, count in ships_types.items() if count}
+
     def get_ships_in_deep_space(self) -> Iterable[Ship]:
         """
         Returns an iterable for all the ships that are not located on a planet
         """
-        positions = {n.position for n in self.ships}.difference(
-            set(self.planets.keys())
-        )
-        for ship in filter(lambda s: s.position in positions, self.ships):
-            yield ship
+        planets = self.planets
+        for position, ships in self._ships_by_position.items():
+            if position in planets:
+                continue
+            for ship in ships:
+                yield ship
 
     def get_ships_in_position(self, position: Position) -> Iterable[Ship]:
         """
         Returns an iterable for all the known ships in the given position
         """
-        for ship in filter(lambda s: s.position == position, self.ships):
+        for ship in self._ships_by_position.get(position, []):
             yield ship
 
     def search_ship(self, _id: int) -> Ship:
         """
         Return the ship with ID ``id`` if any and is known
         """
-        match = [ship for ship in self.ships if ship.id == _id]
-        if match:
-            return match.pop()
+        try:
+            return self._ships_by_id.get(_id)
+        except TypeError:
+            # Unhashable ids, like the ones of malformed orders, match no ship
+            return None
 
     def search_planet(self, _id: int) -> Planet:
         """
         Return the planet with ID ``id`` if any
         """
-        match = [
-            planet for planet in self.planets.values() if planet.id == _id
-        ]
-        if match:
-            return match.pop()
+        try:
+            return self._planets_by_id.get(_id)
+        except TypeError:
+            # Unhashable ids, like the ones of malformed orders, match no planet
+            return None
 
     def get_ships_by_position(self) -> Dict[Position, List[Ship]]:
         """
         Returns a dict with ships ordered by position.
         Ships in the same positions are grouped in a list.
         """
-        return dict(
-            (
-                (position, list(ships))
-                for position, ships in groupby(
-                    self.ships, lambda s: s.position
-                )
-            )
-        )
+        return {
+            position: list(ships)
+            for position, ships in self._ships_by_position.items()
+        }
 
     def get_ships_in_planets(self) -> Iterable[Tuple[Planet, List[Ship]]]:
         """
         Return a list of tuples ``(planet, ships)`` where ``planet`` is a :class:`Planet`
         instance and ``ships`` is a list with all the ships located on the planet
         """
-        ships_by_position = self.get_ships_by_position()
-        for position, planet in self.planets.items():
-            ships = ships_by_position.get(position)
-            if not ships:
+        planets = self.planets
+        for position, ships in self._ships_by_position.items():
+            planet = planets.get(position)
+            if planet is None:
                 continue
-            yield planet, ships
+            yield planet, list(ships)
+
+    def _group_ships(self) -> Dict[str, np.ndarray]:
+        """
+        Run :func:`group_ships` over all the ships of the galaxy, in the order of
+        :attr:`ships`. The result includes the ``owner`` of each ship too.
+
+        The ``attack`` of the ships hidden to a player (see
+        :meth:`GameMode.galaxy_for_player`) counts as zero.
+        """
+        ships = self._ships
+        count = len(ships)
+        owners = np.fromiter(
+            (self.get_player_handle(s.player) for s in ships),
+            dtype=np.int64,
+            count=count,
+        )
+        groups = group_ships(
+            np.array([s.position for s in ships], dtype=float).reshape(-1, 2),
+            owners,
+            np.fromiter(
+                (s.attack or 0 for s in ships), dtype=np.int64, count=count
+            ),
+        )
+        groups["owner"] = owners
+        return groups
+
+    def _split_groups(
+        self, groups: Dict[str, np.ndarray], selected: np.ndarray
+    ) -> Iterator[Tuple[int, List[Ship]]]:
+        """
+        Yield each one of the ``selected`` groups with its ships
+        """
+        ships = self._ships
+        group = groups["group"]
+        order = np.argsort(group, kind="stable")
+        ends = np.cumsum(np.bincount(group, minlength=len(groups["first"])))
+        starts = ends - np.bincount(group, minlength=len(ends))
+        for index in selected.tolist():
+            rows = order[starts[index] : ends[index]]
+            yield index, [ships[row] for row in rows.tolist()]
 
     def get_ships_conflicts(self) -> Iterable[List[Ship]]:
         """
         Return all the ships in conflict: Ships with, at last, one enemy ship
         in the same position
         """
-        ships_by_position = [
-            list(ships)
-            for pos, ships in groupby(self.ships, lambda s: s.position)
-        ]
-        # keep only the groups with more than one player
-        for ships in filter(
-            lambda ships: len({s.player for s in ships if s.player}) > 1
-            and any((s.attack for s in ships)),
-            ships_by_position,
-        ):
+        for ships, _ in self.get_ships_conflicts_attacks():
             yield ships
 
+    def get_ships_conflicts_attacks(
+        self,
+    ) -> Iterable[Tuple[List[Ship], Dict[Optional[str], int]]]:
+        """
+        Return all the ships in conflict (see :meth:`get_ships_conflicts`), with
+        the total attack of each player involved in the conflict.
+
+        Players are sorted by first appearance in the list of ships.
+        """
+        groups = self._group_ships()
+        # keep only the groups with more than one player
+        contested = np.flatnonzero(
+            (groups["players"] > 1) & (groups["attack"] > 0)
+        )
+        if not len(contested):
+            return
+
+        pairs_ends = np.cumsum(
+            np.bincount(groups["pairs_group"], minlength=len(groups["first"]))
+        )
+        pairs_owner = groups["pairs_owner"].tolist()
+        pairs_attack = groups["pairs_attack"].tolist()
+        for index, ships in self._split_groups(groups, contested):
+            start = pairs_ends[index - 1] if index else 0
+            end = pairs_ends[index]
+            yield ships, {
+                self.get_player(owner): attack
+                for owner, attack in zip(
+                    pairs_owner[start:end], pairs_attack[start:end]
+                )
+            }
+
     def get_ocuped_planets(self) -> Iterable[Planet]:
         """
         Return all the planets colonized by any race
         """
-        for planet in filter(
-            lambda p: p.player is not None, self.planets.values()
-        ):
+        for planet in list(self._ocuped_planets.values()):
             yield planet
 
     def get_planets_conflicts(self) -> Iterable[Tuple[Planet, List[Ship]]]:
         """
         Return all the planets in conflict: Planets with at least one enemy ship on it
         """
-        ships_by_position = self.get_ships_by_position()
-        destroyed_ships = [e.ship for e in self.explosions]
-        for planet in self.get_ocuped_planets():
-            ships = ships_by_position.get(planet.position)
-            if not ships or not any(
-                s
-                for s in ships
-                if s.player != planet.player and s not in destroyed_ships
-            ):
-                continue
-            yield planet, ships
+        ships = self._ships
+        if not ships:
+            return
+        groups = self._group_ships()
+        planets = self.planets
+        group_planets = [
+            planets.get(ships[row].position)
+            for row in groups["first"].tolist()
+        ]
+        planets_owners = np.fromiter(
+            (
+                self.get_player_handle(planet and planet.player)
+                for planet in group_planets
+            ),
+            dtype=np.int64,
+            count=len(group_planets),
+        )
+
+        destroyed_ships_ids = {e.ship.id for e in self.explosions}
+        group = groups["group"]
+        enemies = (groups["owner"] != planets_owners[group]) & np.fromiter(
+            (s.id not in destroyed_ships_ids for s in ships),
+            dtype=bool,
+            count=len(ships),
+        )
+        contested = np.flatnonzero(
+            (planets_owners != NO_PLAYER)
+            & (np.bincount(group[enemies], minlength=len(group_planets)) > 0)
+        )
+        for index, ships_in_planet in self._split_groups(groups, contested):
+            yield group_planets[index], ships_in_planet
 
     def remove_destroyed_ships(self):
         """
         Remove the destroyed ships from the list
         """
-        explosions_ids = [e.ship.id for e in self.explosions]
-        self.stellar_things = list(
-            filter(
-                lambda things: things.id not in explosions_ids,
-                self.stellar_things,
-            )
-        )
-        self._ships = []
+        self.remove_ships({e.ship.id for e in self.explosions})
+
+    def remove_ships(self, ships_ids: Set[int]):
+        """
+        Remove the ships with id in ``ships_ids`` from the galaxy
+        """
+        if not ships_ids:
+            return
+
+        positions = set()
+        for _id in ships_ids:
+            ship = self._ships_by_id.pop(_id, None)
+            if ship is not None:
+                positions.add(ship.position)
+                self._unindex_ship_player(ship)
+
+        # Rebuild each affected group only once, no matter how many ships exploded
+        for position in positions:
+            remaining_ships = [
+                s
+                for s in self._ships_by_position.get(position, [])
+                if s.id not in ships_ids
+            ]
+            if remaining_ships:
+                self._ships_by_position[position] = remaining_ships
+            else:
+                self._ships_by_position.pop(position, None)
+
+        self._ships[:] = [s for s in self._ships if s.id not in ships_ids]
+        self._ships_tuple = None
+        self._track(positions)
+        self._generation += 1
@@ -7,14 +7,27 @@ import numpy as np
 
 from . import cfg
 from .explosion import Explosion
+from .orders import events
 from .orders import galaxy as galaxy_orders
 from .orders import planet as planet_orders
 from .orders import ship as ship_orders
 from .renderer import GifRenderer
+from .vectors import Transfer
 
 logger = logging.getLogger("game")
 
 
+def _order_sort_key(order):
+    """
+    Sort orders by the id of their object. Orders with malformed ids go last,
+    they are discarded when the orders are validated.
+    """
+    nid = order[1][0]
+    if isinstance(nid, (int, float)):
+        return (0, nid)
+    return (1, 0)
+
+
 class Game:
     def __init__(
         self,
@@ -24,6 +37,7 @@ class Game:
         *,
         renderer=GifRenderer,
         raise_exceptions=False,
+        seed=None,
     ):
         """
         :param name: Name for the galaxy. Also used as game identifier.
@@ -37,6 +51,10 @@ class Game:
         :param raise_exceptions: If ``True`` stop the game if an exception is raised when
             computing player actions. Useful for debuging players.
         :type raise_exceptions: bool
+        :param seed: Seed for the random numbers of the game. Games with the same
+            seed, players and game mode are identical. If ``None`` a random seed
+            is used, and logged when the game starts.
+        :type seed: int
         """
         if len(players) != len({p.name for p in players}):
             raise ValueError("Player names must be unique")
@@ -45,10 +63,27 @@ class Game:
         self.gmode = gmode
         self.players = players
         self.raise_exceptions = raise_exceptions
+
+        # Independent streams for the map, the combats and each player, so a
+        # change in one of them does not alter the others.
+        self.seed_sequence = np.random.SeedSequence(seed)
+        map_seed, combat_seed, *players_seeds = self.seed_sequence.spawn(
+            2 + len(self.players)
+        )
+        self.map_rng = np.random.default_rng(map_seed)
+        self.combat_rng = np.random.default_rng(combat_seed)
+        for player, player_seed in zip(self.players, players_seeds):
+            player.rng = np.random.default_rng(player_seed)
+
         logger.info(
             "Initializing galaxy",
-            extra={"players": len(self.players), "galaxy_name": name},
+            extra={
+                "players": len(self.players),
+                "galaxy_name": name,
+                "seed": self.seed_sequence.entropy,
+            },
         )
+        self.gmode.rng = self.map_rng
         self.galaxy = self.gmode.build_galaxy(name, self.players)
         logger.info("Galaxy initialized")
         sys.stdout.write(f"Running battle in galaxy #{name}\n")
@@ -66,13 +101,10 @@ class Game:
 
         planets_orders = [
             p.get_orders()
-            for p in player_galaxy.planets.values()
-            if p.player == player.name
+            for p in player_galaxy.get_player_planets(player.name)
         ]
         ships_orders = [
-            s.get_orders()
-            for s in player_galaxy.ships
-            if s.player == player.name
+            s.get_orders() for s in player_galaxy.get_player_ships(player.name)
         ]
 
         orders = [
@@ -182,17 +214,17 @@ class Game:
 
             # Sort orders by object id
             for o in orders.values():
-                o.sort(key=lambda x: x[1][0])
+                o.sort(key=_order_sort_key)
 
             self.run_turn(orders)
 
     def run_turn(self, orders):
         """
         Execute turn orders in the following order.
-        1. Ships download transfers :func:`action_ship_transfer`
-        2. Ships upload transfers :func:`action_ship_transfer`
-        3. Mines construction :func:`action_planet_build_mines`
-        4. Taxes changes
+        1. Ships download transfers :func:`transfer_cargo`
+        2. Ships upload transfers :func:`transfer_cargo`
+        3. Mines construction :class:`PlanetsBuildMinesOrder`
+        4. Taxes changes :class:`PlanetsSetTaxesOrder`
         5. Ships movements :func:`action_ship_move`
         6. Resolve ship to ship combats :func:`resolve_ship_to_ship`
         7. Resolve ship to planet combats :func:`resolve_planet_to_ship`
@@ -204,22 +236,24 @@ class Game:
         """
         # 1. Ships download transfers
         # 2. Ships upload transfers
-        self.run_player_action(
-            "ship_transfer", orders.get("ship_transfer", [])
-        )
+        self.transfer_cargo(orders.get("ship_transfer", []))
 
         # 3. Mines construction
-        self.run_player_action(
-            "planet_build_mines", orders.get("planet_build_mines", [])
+        self.run_planets_orders(
+            planet_orders.PlanetsBuildMinesOrder,
+            "planet_build_mines",
+            orders.get("planet_build_mines", []),
         )
 
         # 4. Taxes changes
-        self.run_player_action(
-            "planet_set_taxes", orders.get("planet_set_taxes", [])
+        self.run_planets_orders(
+            planet_orders.PlanetsSetTaxesOrder,
+            "planet_set_taxes",
+            orders.get("planet_set_taxes", []),
         )
 
         # 5. Ship movements
-        self.run_player_action("ship_move", orders.get("ship_move", []))
+        self.move_ships(orders.get("ship_move", []))
 
         # 6. Resolve ship to ship combats
         self.resolve_ships_conflicts()
@@ -238,6 +272,8 @@ class Game:
         # 12. Pythonium extraction
         self.produce_resources()
 
+        events.summary.flush()
+
         self.galaxy.turn += 1
 
     def produce_resources(self):
@@ -245,7 +281,9 @@ class Game:
         order.execute()
 
     def resolve_ships_conflicts(self):
-        order = galaxy_orders.ResolveShipsConflicts(self.galaxy, cfg.tenacity)
+        order = galaxy_orders.ResolveShipsConflicts(
+            self.galaxy, cfg.tenacity, rng=self.combat_rng
+        )
         order.execute()
 
     def resolve_planets_conflicts(self):
@@ -261,6 +299,21 @@ class Game:
         :type orders: tuple
         """
         func = getattr(self, f"action_{name}", None)
+        for obj, args in self.validate_player_orders(name, orders):
+            self.run_action(name, func, obj, args)
+
+    def validate_player_orders(self, name, orders):
+        """
+        Find the object of each order, and check that it belongs to the player
+        that gave the order.
+
+        Yield the object and the arguments of each valid order. Invalid orders are
+        logged and discarded.
+
+        :param name: Name of the action
+        :param orders: List of ``(player, params)`` where ``params`` is the id of \
+            the object followed by the arguments of the action.
+        """
         for player, params in orders:
             if name.startswith("ship"):
                 nid = params[0]
@@ -290,7 +343,7 @@ class Game:
                         "turn": self.galaxy.turn,
                         "player": player.name,
                         "params": params,
-                        "name": name,
+                        "action": name,
                     },
                 )
                 continue
@@ -307,32 +360,92 @@ class Game:
                 )
                 continue
 
-            logger.debug(
-                "Running action for player",
+            yield obj, args
+
+    def run_action(self, name, func, obj, args):
+        """
+        Run the action ``func`` for the object ``obj`` with the arguments ``args``.
+        Errors are logged and ignored.
+        """
+        logger.debug(
+            "Running action for player",
+            extra={
+                "turn": self.galaxy.turn,
+                "player": obj.player,
+                "action": name,
+                "obj": type(obj),
+                "params": args,
+            },
+        )
+
+        try:
+            func(obj, *args)
+        except Exception as e:
+            logger.error(
+                "Unexpected error running player params",
                 extra={
                     "turn": self.galaxy.turn,
                     "player": obj.player,
                     "action": name,
                     "obj": type(obj),
-                    "args": args,
+                    "params": args,
+                    "reason": e,
                 },
             )
 
-            try:
-                func(obj, *args)
-            except Exception as e:
-                logger.error(
-                    "Unexpected error running player params",
-                    extra={
-                        "turn": self.galaxy.turn,
-                        "player": obj.player,
-                        "action": name,
-                        "obj": type(obj),
-                        "args": args,
-                        "reason": e,
-                    },
+    def move_ships(self, orders):
+        """
+        Run all the ``ship_move`` orders at once with :class:`ShipsMoveOrder`.
+        The moves that can not run in batch are executed one by one after.
+        """
+        moves = []
+        for ship, args in self.validate_player_orders("ship_move", orders):
+            if len(args) == 1:
+                moves.append((ship, args[0]))
+            else:
+                # Let it fail as any other invalid action
+                self.run_action("ship_move", self.action_ship_move, ship, args)
+
+        order = ship_orders.ShipsMoveOrder(self.galaxy, moves)
+        order.execute()
+        for ship, target in order.pending:
+            self.run_action(
+                "ship_move", self.action_ship_move, ship, (target,)
+            )
+
+    def transfer_cargo(self, orders):
+        """
+        Run all the ``ship_transfer`` orders at once with
+        :class:`ShipsTransferOrder`. The transfers that can not run in batch are
+        executed one by one after.
+        """
+        transfers = []
+        for ship, args in self.validate_player_orders("ship_transfer", orders):
+            if len(args) == 1 and isinstance(args[0], Transfer):
+                transfers.append((ship, args[0]))
+            else:
+                # Let it fail as any other invalid action
+                self.run_action(
+                    "ship_transfer", self.action_ship_transfer, ship, args
                 )
 
+        order = ship_orders.ShipsTransferOrder(self.galaxy, transfers)
+        order.execute()
+        for ship, transfer in order.pending:
+            self.run_action(
+                "ship_transfer", self.action_ship_transfer, ship, (transfer,)
+            )
+
+    def run_planets_orders(self, order_class, name, orders):
+        """
+        Run all the ``name`` orders at once with ``order_class``, a
+        :class:`PlanetsOrder`. The orders that can not run in batch are executed
+        one by one after.
+        """
+        order = order_class(self.galaxy, orders)
+        order.execute()
+        self.run_player_action(name, order.pending)
+
     def action_ship_move(self, ship, target):
         order = ship_orders.ShipMoveOrder(ship, target)
         order.execute(self.galaxy)
@@ -347,7 +460,7 @@ class Game:
 
     def action_planet_build_ship(self, planet, ship_type):
 
-        ships_count = len(list(self.galaxy.get_player_ships(planet.player)))
+        ships_count = self.galaxy.count_player_ships(planet.player)
         if ships_count >= self.gmode.max_ships:
             logger.warning(
                 "Ships limit reached",
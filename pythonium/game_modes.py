@@ -1,13 +1,16 @@
-import copy
-import random
-from collections import Counter
+from typing import Dict, Optional, Set
+
+import attr
+import numpy as np
 
 from . import cfg
+from .core import Position
 from .galaxy import Galaxy
 from .planet import Planet
 from .ship import Ship
 from .ship_type import ShipType
 from .vectors import Transfer
+from .views import NO_FIELDS, PlanetView, ShipView, ViewsJournal, hide
 
 CLASSIC_MODE_SHIPS = (
     ShipType(
@@ -30,6 +33,79 @@ CLASSIC_MODE_SHIPS = (
 
 CLASSIC_MINE_COST = Transfer(megacredits=3, pythonium=5)
 
+HIDDEN_SHIP_FIELDS = frozenset(
+    (
+        "max_cargo",
+        "max_mc",
+        "attack",
+        "megacredits",
+        "pythonium",
+        "clans",
+        "target",
+        "transfer",
+    )
+)
+"""
+Attributes of the enemy ships that a player can not see
+"""
+
+HIDDEN_PLANET_FIELDS = frozenset(
+    (
+        "static",
+        "temperature",
+        "underground_pythonium",
+        "concentration",
+        "pythonium",
+        "player",
+        "megacredits",
+        "max_happypoints",
+        "happypoints",
+        "clans",
+        "mines",
+        "new_mines",
+        "new_ship",
+        "taxes",
+    )
+)
+"""
+Attributes of the enemy planets that a player can not see, unless it has a ship
+in the planet
+"""
+
+
+@attr.s(auto_attribs=True)
+class PlayerGalaxy:
+    """
+    Galaxy seen by one player, kept from one turn to the next.
+    See :meth:`ClassicMode.galaxy_for_player`
+    """
+
+    source: Galaxy
+    """
+    The galaxy that the player sees
+    """
+
+    galaxy: Galaxy
+    """
+    Views of the things in :attr:`source` that the player can see
+    """
+
+    changes: Set[Position]
+    """
+    Positions changed in :attr:`source` and not updated in :attr:`galaxy` yet.
+    See :meth:`Galaxy.track_changes`
+    """
+
+    journal: ViewsJournal
+    """
+    State shared by the views in :attr:`galaxy`
+    """
+
+    planets_owners: Dict[Position, Optional[str]]
+    """
+    Owner of each planet in :attr:`galaxy`, as the player sees it
+    """
+
 
 class GameMode:
 
@@ -45,12 +121,25 @@ class GameMode:
         self.ship_types = {st.name: st for st in ship_types}
         self.mine_cost = mine_cost
         self.tenacity = tenacity
+        self.rng = np.random.default_rng()
+        """
+        Generador de números aleatorios para construir el mapa. El
+        :class:`Game` lo reemplaza por uno derivado de su semilla antes de
+        llamar a :meth:`build_galaxy`.
+        """
 
     def build_galaxy(self, name, players):
         """
         Fabrica la galaxy
 
-        Retorna una instancia de :class:`Galaxy`
+        Retorna una instancia de :class:`Galaxy`. Los números aleatorios se
+        toman de :attr:`rng`.
+
+        Una vez creada la galaxy, el dueño de los planetas se cambia con
+        :meth:`Galaxy.set_planet_player` y las naves se mueven con
+        :meth:`Galaxy.move_ship`. Si se asigna ``planet.player`` o
+        ``ship.position`` directamente los índices de la galaxy quedan
+        desactualizados.
         """
         raise NotImplementedError("Metodo no implementado")
 
@@ -111,12 +200,14 @@ class ClassicMode(GameMode):
         self.max_turn = max_turn
         self.max_ships = max_ships
         self.winner = None
+        self._players_galaxies: Dict[str, PlayerGalaxy] = {}
 
     def build_galaxy(self, name, players):
         """
         Representa el conjunto de planets en el que se desenvolverá el juego.
 
         """
+        rng = self.rng
         total_pythonium = int(self.pythonium_stock * self.pythonium_in_surface)
         total_underground_pythonium = self.pythonium_stock - total_pythonium
         # 1. Genera los planeras
@@ -124,24 +215,23 @@ class ClassicMode(GameMode):
         # Nos aseguramos de todas las positiones sean únicas.
         positions = set()
         while len(positions) < self.planets_count:
-            pos = (
-                random.randint(0, self.map_size[0] - 10),
-                random.randint(0, self.map_size[1] - 10),
-            )
-            positions.add(pos)
+            x, y = rng.integers(
+                0, (self.map_size[0] - 9, self.map_size[1] - 9)
+            ).tolist()
+            positions.add((x, y))
 
         # Genera comdiciones iniciales aleatorias para el resto de los atributos
         # de los planets
         # 1.b Distribuye el pythonium en superficie
         pythonium_distribution = [
-            round(random.random() * 100) for i in range(self.planets_count)
+            round(d * 100) for d in rng.random(self.planets_count).tolist()
         ]
         coef_pythonium = total_pythonium / sum(pythonium_distribution)
         pythonium = (round(d * coef_pythonium) for d in pythonium_distribution)
         # 1.c Distribuye el pythonium subterraneo
-        underground_pythonium_distribution = [
-            random.random() for i in range(self.planets_count)
-        ]
+        underground_pythonium_distribution = rng.random(
+            self.planets_count
+        ).tolist()
         coef_underground_pythonium = total_underground_pythonium / sum(
             underground_pythonium_distribution
         )
@@ -151,11 +241,11 @@ class ClassicMode(GameMode):
         )
         # 1.d Distribuye las concentraciones de pythonium
         concentrations = (
-            round(random.random(), 2) for i in range(self.planets_count)
+            round(d, 2) for d in rng.random(self.planets_count).tolist()
         )
         # 1.e Genera las temperatures de los planets
         temperatures = (
-            round(random.random() * 100) for i in range(self.planets_count)
+            round(d * 100) for d in rng.random(self.planets_count).tolist()
         )
 
         things = []
@@ -190,6 +280,8 @@ class ClassicMode(GameMode):
         return galaxy
 
     def init_players(self, players, galaxy):
+        rng = self.rng
+
         # 2. Genera las condiciones iniciales de los players.
 
         margins = (galaxy.size[0] * 0.1, galaxy.size[1] * 0.1)
@@ -204,9 +296,9 @@ class ClassicMode(GameMode):
                 )
             nearby_planets = galaxy.nearby_planets(position, 50)
 
-            homeworld = random.choice(nearby_planets)
+            homeworld = nearby_planets[rng.integers(len(nearby_planets))]
 
-            homeworld.player = player.name
+            galaxy.set_planet_player(homeworld, player.name)
             homeworld.clans = self.starting_resources[0]
             homeworld.pythonium = self.starting_resources[1]
             homeworld.megacredits = self.starting_resources[2]
@@ -228,15 +320,26 @@ class ClassicMode(GameMode):
         return galaxy
 
     def galaxy_for_player(self, galaxy, player):
-        # TODO: add the following tests:
-        # * The player can't see enemy ships not located with own ship
-        # * The player can see enemy ships located with any own ship
-        #   or in any own planet
-        # * The player can see any ship in deep space
-
-        player_planets_positions = [
-            p.position for p in galaxy.get_player_planets(player.name)
-        ]
+        """
+        Return the ``galaxy`` as the ``player`` sees it.
+
+        The galaxy of each player is built once, and then updated with the changes
+        of ``galaxy`` since the previous turn. The player gets the same galaxy every
+        turn, without the values that it wrote in the previous turn.
+        """
+        player_galaxy = self._players_galaxies.get(player.name)
+        if player_galaxy is None or player_galaxy.source is not galaxy:
+            player_galaxy = self._build_player_galaxy(galaxy, player.name)
+            self._players_galaxies[player.name] = player_galaxy
+        else:
+            self._update_player_galaxy(player_galaxy, player.name)
+        return player_galaxy.galaxy
+
+    def _build_player_galaxy(self, galaxy, player_name):
+        player_planets_positions = {
+            p.position for p in galaxy.get_player_planets(player_name)
+        }
+        planets = galaxy.planets
         # Player can see ships that:
         # * Belongs to him
         # * Are located in any of his planets.
@@ -244,96 +347,152 @@ class ClassicMode(GameMode):
         visible_ships = [
             ship
             for ship in galaxy.ships
-            if player.name == ship.player
+            if player_name == ship.player
             or ship.position in player_planets_positions
-            or ship.position not in galaxy.planets.keys()
+            or ship.position not in planets
+        ]
+        visible_positions = {ship.position for ship in visible_ships}
+        # Player views read the galaxy state, and keep the changes of the
+        # player for themselves. Nothing is copied until the player writes it.
+        journal = ViewsJournal()
+        ships = [
+            ShipView(
+                ship, self._hidden_ship_fields(ship, player_name), journal
+            )
+            for ship in visible_ships
         ]
-        planets = copy.deepcopy(galaxy.planets)
-        ships = copy.deepcopy(visible_ships)
-
-        # Hide information from ships that are not his own
-        for ship in [ship for ship in ships if ship.player != player.name]:
-            ship.max_cargo = None
-            ship.max_mc = None
-            ship.attack = None
-            ship.megacredits = None
-            ship.pythonium = None
-            ship.clans = None
-            ship.target = None
-            ship.transfer = None
 
         # Hide information of enemy planets and unknown planets
         # (without a player's ship in the planet)
-        for planet in [
-            p
-            for pos, p in planets.items()
-            if p.player != player.name
-            and (
-                p.player is not None
-                and pos not in [n.position for n in visible_ships]
+        planets = {
+            pos: PlanetView(
+                p,
+                self._hidden_planet_fields(
+                    p, player_name, pos in visible_positions
+                ),
+                journal,
             )
-        ]:
-            planet.temperature = None
-            planet.underground_pythonium = None
-            planet.concentration = None
-            planet.pythonium = None
-            planet.player = None
-            planet.megacredits = None
-            planet.max_happypoints = None
-            planet.happypoints = None
-            planet.clans = None
-            planet.mines = None
-            planet.new_mines = None
-            planet.new_ship = None
-            planet.taxes = None
-
-        return Galaxy(
-            turn=galaxy.turn,
-            name=galaxy.name,
-            size=galaxy.size,
-            things=list(planets.values()) + ships,
-            explosions=galaxy.explosions,
+            for pos, p in planets.items()
+        }
+
+        return PlayerGalaxy(
+            source=galaxy,
+            galaxy=Galaxy(
+                turn=galaxy.turn,
+                name=galaxy.name,
+                size=galaxy.size,
+                things=list(planets.values()) + ships,
+                explosions=galaxy.explosions,
+            ),
+            changes=galaxy.track_changes(),
+            journal=journal,
+            planets_owners={pos: p.player for pos, p in planets.items()},
         )
 
+    def _update_player_galaxy(self, player_galaxy, player_name):
+        source = player_galaxy.source
+        galaxy = player_galaxy.galaxy
+        journal = player_galaxy.journal
+        journal.reset()
+        galaxy.turn = source.turn
+        galaxy.explosions = source.explosions
+
+        positions = sorted(player_galaxy.changes)
+        player_galaxy.changes.clear()
+        # Ships that are not visible in its old position, and ships that are
+        # visible in a new position
+        leaving = {}
+        arriving = {}
+        for position in positions:
+            planet = source.planets.get(position)
+            own_planet = planet is not None and planet.player == player_name
+            visible_ships = {
+                ship.id: ship
+                for ship in source.get_ships_in_position(position)
+                if ship.player == player_name or own_planet or planet is None
+            }
+            if planet is not None:
+                self._update_planet_view(
+                    player_galaxy, planet, player_name, bool(visible_ships)
+                )
+            for ship in galaxy.get_ships_in_position(position):
+                if visible_ships.pop(ship.id, None) is None:
+                    leaving[ship.id] = (ship, position)
+            for ship in visible_ships.values():
+                arriving[ship.id] = (ship, position)
+
+        # The galaxy finds each ship by the position where it was indexed, so the
+        # views show that position until they are moved or removed
+        lost_ships = set()
+        for ship_id, (ship, position) in leaving.items():
+            ship.position = position
+            if ship_id in arriving:
+                galaxy.move_ship(ship, arriving.pop(ship_id)[1])
+            else:
+                lost_ships.add(ship_id)
+        galaxy.remove_ships(lost_ships)
+        for ship_id in sorted(arriving):
+            ship = arriving[ship_id][0]
+            galaxy.add_ship(
+                ShipView(
+                    ship, self._hidden_ship_fields(ship, player_name), journal
+                )
+            )
+        journal.reset()
+
+    def _update_planet_view(self, player_galaxy, planet, player_name, watched):
+        position = planet.position
+        hidden = self._hidden_planet_fields(planet, player_name, watched)
+        planet_view = player_galaxy.galaxy.planets[position]
+        hide(planet_view, hidden)
+        owner = planet_view.player
+        shown_owner = player_galaxy.planets_owners[position]
+        if owner != shown_owner:
+            # The galaxy finds the planet by the owner that it used to show
+            planet_view.player = shown_owner
+            player_galaxy.galaxy.set_planet_player(planet_view, owner)
+            player_galaxy.planets_owners[position] = owner
+
+    @staticmethod
+    def _hidden_ship_fields(ship, player_name):
+        if ship.player == player_name:
+            return NO_FIELDS
+        return HIDDEN_SHIP_FIELDS
+
+    @staticmethod
+    def _hidden_planet_fields(planet, player_name, watched):
+        if (
+            planet.player != player_name
+            and planet.player is not None
+            and not watched
+        ):
+            return HIDDEN_PLANET_FIELDS
+        return NO_FIELDS
+
     def has_ended(self, galaxy, t):
         if t >= self.max_turn:
             return True
 
-        planets_score = Counter(
-            (p.player for p in galaxy.planets.values() if p.player is not None)
-        )
         threshold = len(galaxy.planets) * 0.7
-        for name, score in planets_score.items():
-            if score > threshold:
+        for name in galaxy.known_races:
+            if galaxy.count_player_planets(name) > threshold:
                 self.winner = name
                 return True
         return False
 
     def get_score(self, galaxy, players, turn):
-        planets_score = Counter(
-            (p.player for p in galaxy.planets.values() if p.player is not None)
-        )
-
-        ship_scores = {}
-        for ship_type in self.ship_types.values():
-            ship_scores[ship_type.name] = Counter(
-                (
-                    s.player
-                    for s in galaxy.ships
-                    if s.type.name == ship_type.name
-                )
-            )
         score = []
         for player in players:
             name = player.name
             player_score = {
                 "turn": turn,
                 "player": name,
-                "planets": planets_score.get(name, 0),
+                "planets": galaxy.count_player_planets(name),
             }
+            ship_scores = galaxy.count_player_ships_by_type(name)
             total_ships = 0
-            for ship_type_name, ship_type_score in ship_scores.items():
-                ships_count = ship_type_score.get(name, 0)
+            for ship_type_name in self.ship_types.keys():
+                ships_count = ship_scores.get(ship_type_name, 0)
                 total_ships += ships_count
                 player_score[f"ships_{ship_type_name}"] = ships_count
             player_score["total_ships"] = total_ships
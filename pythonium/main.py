@@ -5,7 +5,7 @@ import sys
 import time
 from pathlib import Path
 
-from . import __version__
+from . import __version__, cfg
 from .game import Game
 from .game_modes import ClassicMode
 from .helpers import random_name
@@ -46,6 +46,20 @@ def go():
     parser.add_argument(
         "--galaxy-name", default="", help="An identification for the game"
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for the random numbers of the game. Games with the same "
+        "seed and players are identical.",
+    )
+    parser.add_argument(
+        "--events",
+        choices=("entity", "summary"),
+        default=cfg.events_granularity,
+        help="Log one event per entity affected by the orders, or one summary "
+        "per turn and player. The summaries keep the logs small on big maps.",
+    )
 
     args = parser.parse_args()
 
@@ -53,6 +67,8 @@ def go():
         print("Running 'pythonium' version", __version__)
         return 0
 
+    cfg.events_granularity = args.events
+
     game_mode = ClassicMode()
     galaxy_name = random_name(6)
 
@@ -70,6 +86,7 @@ def go():
         players=players,
         gmode=game_mode,
         raise_exceptions=args.raise_exceptions,
+        seed=args.seed,
     )
     game.play()
 
@@ -111,17 +111,17 @@ class MetricsCollector:
             previous = log["datetime"]
         return data
 
-    def get_events_for_players(self, message, key, data_type=int):
+    def get_summaries_for_players(self, message, key=None, data_type=int):
         """
-        Find metrics related to an event for each player.
-        There can be more than one event for each player per turn.
+        Summarize the events related to ``message`` for each player and turn.
 
-        Return a dict where player names are the keys and values are
-        a list of lists. One list per turn with none event or more.
+        Works with both events granularities (see ``cfg.events_granularity``).
+        Events logged per entity are summarized here, and events already
+        summarized by the orders are merged.
 
-        This is used for example to filter all the pythonium produced in each
-        planet for each player every turn. There are more than one event per
-        turn and player.
+        Return a dict where player names are the keys and values are a list
+        with one summary per turn: a dict with the ``count`` of events and the
+        ``total`` of the values related to ``key``.
         """
         # Filter logs and group by turn
         grouped_logs = groupby(
@@ -130,20 +130,29 @@ class MetricsCollector:
         )
 
         # Create the empty container for each player
-        data = dict((p, [[] for t in self.turns]) for p in self.known_players)
+        data = dict(
+            (p, [{"count": 0, "total": 0} for t in self.turns])
+            for p in self.known_players
+        )
         for turn, logs in grouped_logs:
-            # group by player
             for log in logs:
-                player = log["extras"]["player"]
-                value = data_type(log["extras"][key])
-                data[player][turn + 1].append(value)
+                extras = log["extras"]
+                summary = data[extras["player"]][turn + 1]
+                if "count" in extras:
+                    summary["count"] += int(extras["count"])
+                    value = extras.get(f"{key}_total")
+                else:
+                    summary["count"] += 1
+                    value = extras.get(key)
+                if value is not None:
+                    summary["total"] += data_type(value)
         data["turn"] = self.turns
         return data
 
     def aggregate_events_for_players(self, events, agg):
         """
         Perform aggregation (count, sum, avg, etc) to events metrics for each player
-        ``events`` is the output of ``get_events_for_players``
+        ``events`` is the output of ``get_summaries_for_players``
         """
         data = {
             player: [agg(m) for m in metrics]
@@ -241,48 +250,52 @@ class MetricsCollector:
             "Player orders computed", "orders"
         )
 
+        def count(summary):
+            return summary["count"]
+
+        def total(summary):
+            return summary["total"]
+
+        def avg(summary):
+            return (
+                summary["total"] / summary["count"] if summary["count"] else 0
+            )
+
         # War
+        conquered_planets_summaries = self.get_summaries_for_players(
+            "Planet conquered by force", "clans"
+        )
         conquered_planets = self.aggregate_events_for_players(
-            self.get_events_for_players(
-                message="Planet conquered by force",
-                key="planet",
-                data_type=str,
-            ),
-            len,
+            conquered_planets_summaries, count
         )
         killed_clans = self.aggregate_events_for_players(
-            self.get_events_for_players("Planet conquered by force", "clans"),
-            sum,
+            conquered_planets_summaries, total
         )
         ships_lost = self.aggregate_events_for_players(
-            self.get_events_for_players("Explosion", "ship_type", bool), len
+            self.get_summaries_for_players("Explosion"), count
         )
 
         # Economy
-        dpythonium = self.get_events_for_players(
+        dpythonium = self.get_summaries_for_players(
             "Pythonium change", "dpythonium"
         )
-        dclans = self.get_events_for_players("Population change", "dclans")
-        dmegacredits = self.get_events_for_players(
+        dclans = self.get_summaries_for_players("Population change", "dclans")
+        dmegacredits = self.get_summaries_for_players(
             "Megacredits change", "dmegacredits"
         )
         built_mines = self.aggregate_events_for_players(
-            self.get_events_for_players("New mines", "new_mines"), sum
+            self.get_summaries_for_players("New mines", "new_mines"), total
         )
         built_ships = self.aggregate_events_for_players(
-            self.get_events_for_players("New ship built", "ship_type", bool),
-            len,
+            self.get_summaries_for_players("New ship built"), count
         )
 
-        total_dpythonium = self.aggregate_events_for_players(dpythonium, sum)
-        total_dclans = self.aggregate_events_for_players(dclans, sum)
+        total_dpythonium = self.aggregate_events_for_players(dpythonium, total)
+        total_dclans = self.aggregate_events_for_players(dclans, total)
         total_dmegacredits = self.aggregate_events_for_players(
-            dmegacredits, sum
+            dmegacredits, total
         )
 
-        def avg(i):
-            return sum(i) / len(i) if i else 0
-
         avg_dpythonium = self.aggregate_events_for_players(dpythonium, avg)
         avg_dclans = self.aggregate_events_for_players(dclans, avg)
         avg_dmegacredits = self.aggregate_events_for_players(dmegacredits, avg)
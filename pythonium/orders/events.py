@@ -0,0 +1,124 @@
+import logging
+from typing import Any, Dict, Iterable, Tuple
+
+from .. import cfg
+
+logger = logging.getLogger("game")
+
+ENTITY = "entity"
+"""
+Log one event for each entity affected by an order.
+See :data:`cfg.events_granularity`
+"""
+
+SUMMARY = "summary"
+"""
+Log one event per turn and player with the aggregates of the events of
+the orders. See :data:`cfg.events_granularity`
+"""
+
+
+class EventsSummary:
+    """
+    Per turn and per player aggregates of the events logged by the orders.
+
+    Each summary is logged by :meth:`flush` as a single line with the message of
+    the event and the following extras:
+
+    * ``turn`` and ``player``: The turn and player of the events,
+    * ``count``: How many events were summarized,
+    * ``<value>_total``, ``<value>_min`` and ``<value>_max``: Aggregates of each \
+        value of the events.
+    """
+
+    def __init__(self):
+        self._summaries: Dict[Tuple[str, Any, Any], Dict[str, Any]] = {}
+
+    def __len__(self):
+        return len(self._summaries)
+
+    def add(
+        self, message: str, turn: int, player: str, values: Dict[str, Any]
+    ):
+        """
+        Add one event to the summary of ``message`` for ``turn`` and ``player``
+        """
+        self.add_aggregates(
+            message, turn, player, 1, totals=values, mins=values, maxs=values
+        )
+
+    def add_aggregates(
+        self,
+        message: str,
+        turn: int,
+        player: str,
+        count: int,
+        totals: Dict[str, Any],
+        mins: Dict[str, Any],
+        maxs: Dict[str, Any],
+    ):
+        """
+        Add ``count`` events, already aggregated, to the summary of ``message``
+        for ``turn`` and ``player``
+        """
+        key = (message, turn, player)
+        summary = self._summaries.get(key)
+        if summary is None:
+            summary = self._summaries[key] = {"count": 0}
+        summary["count"] += count
+        for name, value in totals.items():
+            total_key = f"{name}_total"
+            summary[total_key] = summary.get(total_key, 0) + value
+        for name, value in mins.items():
+            min_key = f"{name}_min"
+            summary[min_key] = min(summary.get(min_key, value), value)
+        for name, value in maxs.items():
+            max_key = f"{name}_max"
+            summary[max_key] = max(summary.get(max_key, value), value)
+
+    def flush(self):
+        """
+        Log all the summaries and start over
+        """
+        for (message, turn, player), summary in self._summaries.items():
+            logger.info(
+                message, extra={"turn": turn, "player": player, **summary}
+            )
+        self._summaries = {}
+
+
+summary = EventsSummary()
+"""
+Summary of the events of the current turn
+"""
+
+
+def is_summary() -> bool:
+    """
+    Return ``True`` if the orders must summarize its events
+    """
+    return cfg.events_granularity == SUMMARY
+
+
+def log_event(message: str, extra: Dict[str, Any], values: Iterable[str] = ()):
+    """
+    Log an event of an order with the granularity of
+    :data:`cfg.events_granularity`.
+
+    With :data:`ENTITY` granularity the event is logged as is. With
+    :data:`SUMMARY` granularity it is added to :data:`summary`, and only the
+    extras listed in ``values`` are aggregated.
+
+    :param message: The event message
+    :param extra: The event extras
+    :param values: Numeric extras to aggregate in the summary
+    """
+    if is_summary():
+        summary.add(
+            message,
+            extra.get("turn"),
+            extra.get("player"),
+            {name: extra[name] for name in values},
+        )
+    else:
+        logger.info(message, extra=extra)
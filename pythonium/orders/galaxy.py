@@ -1,14 +1,157 @@
 import logging
-from itertools import groupby
+from typing import Dict, Iterable
 
 import attr
 import numpy as np
 
+from .. import cfg
 from ..explosion import Explosion
+from ..galaxy import NO_PLAYER
+from ..planet import Planet
+from ..state import PlanetsTable
+from . import events
 from .core import GalaxyOrder
+from .events import log_event
 
 logger = logging.getLogger("game")
 
+RESOURCES_CHANGES = (
+    ("dhappypoints", "happypoints", "Happypoints change"),
+    ("dmegacredits", "megacredits", "Megacredits change"),
+    ("dpythonium", "pythonium", "Pythonium change"),
+    ("dclans", "clans", "Population change"),
+)
+"""
+Deltas computed by :func:`produce_resources`, in order of application, with the
+column they change and the message logged for each change
+"""
+
+
+def produce_resources(planets: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Vectorized version of the production of resources of :class:`Planet`.
+
+    Apply one turn of production to the ``planets`` columns in place (see
+    :attr:`GalaxyState.planets`), and return the applied deltas indexed by name
+    (``dhappypoints``, ``dmegacredits``, ``dpythonium`` and ``dclans``).
+
+    Follows the formulas of :class:`Planet` operation by operation, in the same
+    order, so the results are identical to the ones of the planets properties.
+    """
+    happypoints = planets["happypoints"]
+    clans = planets["clans"]
+
+    unbounded_dhappypoints = cfg.tolerable_taxes - planets["taxes"]
+    dhappypoints = np.where(
+        unbounded_dhappypoints < 0,
+        np.maximum(unbounded_dhappypoints, -happypoints),
+        np.minimum(
+            unbounded_dhappypoints, planets["max_happypoints"] - happypoints
+        ),
+    )
+    happypoints += dhappypoints
+
+    # Happypoints change first, the rest of the deltas see the new rioting index
+    rioting_index = np.minimum(happypoints / cfg.happypoints_tolerance, 1)
+
+    taxes = (
+        planets["taxes_collection_factor"]
+        * clans
+        * planets["taxes"]
+        / 100
+        * rioting_index
+    )
+    dmegacredits = np.trunc(taxes).astype(np.int64)
+    planets["megacredits"] += dmegacredits
+
+    mines_extraction = (
+        planets["mines"] * planets["concentration"] * rioting_index
+    )
+    dpythonium = np.maximum(
+        np.trunc(mines_extraction).astype(np.int64), -planets["pythonium"]
+    )
+    planets["pythonium"] += dpythonium
+
+    growth_rate = cfg.max_population_rate * rioting_index
+    dclans = np.minimum(
+        cfg.max_clans_in_planet - clans,
+        np.maximum(np.trunc(clans * growth_rate).astype(np.int64), -clans),
+    )
+    clans += dclans
+
+    return {
+        "dhappypoints": dhappypoints,
+        "dmegacredits": dmegacredits,
+        "dpythonium": dpythonium,
+        "dclans": dclans,
+    }
+
+
+def fast_forward(
+    galaxy, turns: int, planets: Iterable[Planet] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Advance the economy of the ``planets`` by ``turns`` turns, as if no orders
+    touched them.
+
+    The result is the same of running :class:`ProduceResources` ``turns`` times,
+    but the planets are read from the :attr:`Galaxy.state` once,
+    :func:`produce_resources` runs over the columns, and the planets are updated
+    once at the end. Planets that stop changing are left out of the following
+    turns. No events are logged and the turn of the galaxy does not change.
+
+    :param galaxy: The galaxy of the planets
+    :param turns: Amount of turns to advance
+    :param planets: Planets of the galaxy to advance. All the occupied planets by \
+        default, in the order of :attr:`Galaxy.planets`. Raise ``ValueError`` if \
+        any of them is not in the galaxy.
+
+    Return the deltas accumulated in all the turns (see :func:`produce_resources`),
+    aligned with the advanced planets.
+    """
+    table = galaxy.state.planets
+    if planets is None:
+        rows = np.flatnonzero(table.owner != NO_PLAYER)
+    else:
+        rows = []
+        for planet in planets:
+            row = table.get_row(planet)
+            if row is None:
+                raise ValueError(f"Planet {planet.id} is not in the galaxy")
+            rows.append(row)
+        rows = np.array(rows, dtype=np.intp)
+    columns = table.select(rows)
+    totals = {
+        delta_name: np.zeros(len(rows), dtype=np.int64)
+        for delta_name, _, _ in RESOURCES_CHANGES
+    }
+
+    active = np.arange(len(rows))
+    active_columns = columns
+    for _ in range(turns):
+        if not len(active):
+            break
+        deltas = produce_resources(active_columns)
+        changed = np.zeros(len(active), dtype=bool)
+        for delta_name, delta in deltas.items():
+            totals[delta_name][active] += delta
+            changed |= delta != 0
+
+        if active_columns is not columns:
+            for name, column in active_columns.items():
+                columns[name][active] = column
+        if not changed.all():
+            # Planets without changes are in a fixed point, they will not
+            # change in the following turns
+            active = active[changed]
+            active_columns = {
+                name: column[active] for name, column in columns.items()
+            }
+
+    table.update(rows, columns)
+    table.commit()
+    return totals
+
 
 @attr.s()
 class ProduceResources(GalaxyOrder):
@@ -16,65 +159,78 @@ class ProduceResources(GalaxyOrder):
     name = "produce_resources"
 
     def execute(self) -> None:
-        for planet in self.galaxy.get_ocuped_planets():
-            self._produce_resources(planet)
-
-    def _produce_resources(self, planet):
-        dhappypoints = planet.dhappypoints
-        if dhappypoints:
-            planet.happypoints += dhappypoints
-            logger.info(
-                "Happypoints change",
-                extra={
-                    "turn": self.galaxy.turn,
-                    "player": planet.player,
-                    "planet": planet.id,
-                    "dhappypoints": dhappypoints,
-                    "happypoints": planet.happypoints,
-                },
-            )
-
-        dmegacredits = planet.dmegacredits
-        if dmegacredits:
-            planet.megacredits += dmegacredits
-            logger.info(
-                "Megacredits change",
-                extra={
-                    "turn": self.galaxy.turn,
-                    "player": planet.player,
-                    "planet": planet.id,
-                    "dmegacredits": dmegacredits,
-                    "megacredits": planet.megacredits,
-                },
-            )
+        planets = self.galaxy.state.planets
+        rows = np.flatnonzero(planets.owner != NO_PLAYER)
+        columns = planets.select(rows)
+        deltas = produce_resources(columns)
+        planets.update(rows, columns)
+        planets.commit()
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        if events.is_summary():
+            self._summarize_changes(planets, rows, deltas)
+        else:
+            self._log_changes(planets, rows, deltas)
 
-        dpythonium = planet.dpythonium
-        if dpythonium:
-            planet.pythonium += dpythonium
-            logger.info(
-                "Pythonium change",
-                extra={
-                    "turn": self.galaxy.turn,
-                    "player": planet.player,
-                    "planet": planet.id,
-                    "dpythonium": dpythonium,
-                    "pythonium": planet.pythonium,
-                },
-            )
+    def _summarize_changes(
+        self,
+        planets: PlanetsTable,
+        planets_rows: np.ndarray,
+        deltas: Dict[str, np.ndarray],
+    ):
+        owner = planets.owner[planets_rows]
+        for delta_name, _, message in RESOURCES_CHANGES:
+            delta = deltas[delta_name]
+            rows = np.flatnonzero(delta)
+            if not len(rows):
+                continue
+            # Sort the changes by owner to aggregate them by player at once
+            rows = rows[np.argsort(owner[rows], kind="stable")]
+            owners, starts = np.unique(owner[rows], return_index=True)
+            changes = delta[rows]
+            counts = np.diff(np.append(starts, len(rows)))
+            for handle, count, total, min_change, max_change in zip(
+                owners.tolist(),
+                counts.tolist(),
+                np.add.reduceat(changes, starts).tolist(),
+                np.minimum.reduceat(changes, starts).tolist(),
+                np.maximum.reduceat(changes, starts).tolist(),
+            ):
+                events.summary.add_aggregates(
+                    message,
+                    self.galaxy.turn,
+                    self.galaxy.get_player(handle),
+                    count,
+                    totals={delta_name: total},
+                    mins={delta_name: min_change},
+                    maxs={delta_name: max_change},
+                )
 
-        dclans = planet.dclans
-        if dclans:
-            planet.clans += dclans
-            logger.info(
-                "Population change",
-                extra={
-                    "turn": self.galaxy.turn,
-                    "player": planet.player,
-                    "planet": planet.id,
-                    "dclans": dclans,
-                    "clans": planet.clans,
-                },
-            )
+    def _log_changes(
+        self,
+        planets: PlanetsTable,
+        planets_rows: np.ndarray,
+        deltas: Dict[str, np.ndarray],
+    ):
+        for delta_name, column_name, message in RESOURCES_CHANGES:
+            delta = deltas[delta_name]
+            rows = np.flatnonzero(delta)
+            for row, change, value in zip(
+                planets_rows[rows].tolist(),
+                delta[rows].tolist(),
+                planets[column_name][planets_rows[rows]].tolist(),
+            ):
+                planet = planets.entities[row]
+                logger.info(
+                    message,
+                    extra={
+                        "turn": self.galaxy.turn,
+                        "player": planet.player,
+                        "planet": planet.id,
+                        delta_name: change,
+                        column_name: value,
+                    },
+                )
 
 
 @attr.s()
@@ -82,30 +238,59 @@ class ResolveShipsConflicts(GalaxyOrder):
 
     name = "resolve_ships_conflicts"
     tenacity: float = attr.ib()
+    rng: np.random.Generator = attr.ib(factory=np.random.default_rng)
+    """
+    Random numbers generator for the combats scores
+    """
 
     def execute(self) -> None:
-        ships_in_conflict = self.galaxy.get_ships_conflicts()
-        for ships in ships_in_conflict:
-            self._resolve_ships_conflicts(ships)
+        ships_in_conflict = list(self.galaxy.get_ships_conflicts_attacks())
+        scores = self._draw_scores(ships_in_conflict)
+        for (ships, attacks), conflict_scores in zip(
+            ships_in_conflict, scores
+        ):
+            self._resolve_ships_conflicts(ships, attacks, conflict_scores)
         self.galaxy.remove_destroyed_ships()
 
-    def _compute_winner(self, ships, total_attack):
+    def _draw_scores(self, ships_in_conflict):
         """
-        Due to the randomness of the fighting process, this method is not tested
+        Draw the score of every player in every conflict of the turn at once.
+
+        The score of each player follows a normal distribution centered in the
+        percentage of the conflict total attack that belongs to the player.
+
+        Return a list with the scores of each conflict, aligned with its attacks.
         """
-        groups = groupby(ships, lambda s: s.player)
+        shapes = []
+        for _, attacks in ships_in_conflict:
+            total_attack = sum(attacks.values())
+            shapes.extend(
+                100 * (attack / total_attack) for attack in attacks.values()
+            )
+        draws = self.rng.normal(shapes, self.tenacity).tolist()
 
+        scores = []
+        start = 0
+        for _, attacks in ships_in_conflict:
+            end = start + len(attacks)
+            scores.append(draws[start:end])
+            start = end
+        return scores
+
+    def _compute_winner(self, ships, total_attack, attacks, scores):
+        """
+        Due to the randomness of the fighting process, this method is not tested
+
+        :param attacks: Total attack of each player in the conflict
+        :param scores: Score of each player in the conflict, in the same order \
+            as ``attacks``. See :meth:`_draw_scores`
+        """
         max_score = 0
         winner = None
-        for player, player_ships in groups:
-            player_attack = sum((s.attack for s in player_ships))
+        for (player, player_attack), score in zip(attacks.items(), scores):
             attack_fraction = player_attack / total_attack
 
-            # Compute score probability distribution
-            shape = 100 * attack_fraction
-            score = np.random.normal(shape, self.tenacity)
-
-            logger.info(
+            log_event(
                 "Score in conflict",
                 extra={
                     "turn": self.galaxy.turn,
@@ -114,12 +299,13 @@ class ResolveShipsConflicts(GalaxyOrder):
                     "attack_fraction": attack_fraction,
                     "score": score,
                 },
+                values=("player_attack", "score"),
             )
             if score > max_score:
                 winner = player
                 max_score = score
 
-        logger.info(
+        log_event(
             "Conflict resolved",
             extra={
                 "turn": self.galaxy.turn,
@@ -128,17 +314,18 @@ class ResolveShipsConflicts(GalaxyOrder):
                 "total_attack": total_attack,
                 "total_ships": len(ships),
             },
+            values=("max_score", "total_attack", "total_ships"),
         )
         return winner
 
-    def _resolve_ships_conflicts(self, ships):
-        total_attack = sum(s.attack for s in ships)
-        winner = self._compute_winner(ships, total_attack)
+    def _resolve_ships_conflicts(self, ships, attacks, scores):
+        total_attack = sum(attacks.values())
+        winner = self._compute_winner(ships, total_attack, attacks, scores)
         # Destroy defeated ships
         for ship in ships:
             if ship.player == winner:
                 continue
-            logger.info(
+            log_event(
                 "Explosion",
                 extra={
                     "turn": self.galaxy.turn,
@@ -186,7 +373,7 @@ class ResolvePlanetsConflicts(GalaxyOrder):
 
         # If is not of his own, the winner conquer the planet.
         if planet.player != winner:
-            logger.info(
+            log_event(
                 "Planet conquered by force",
                 extra={
                     "turn": self.galaxy.turn,
@@ -194,8 +381,9 @@ class ResolvePlanetsConflicts(GalaxyOrder):
                     "planet": planet.id,
                     "clans": planet.clans,
                 },
+                values=("clans",),
             )
-            planet.player = winner
+            self.galaxy.set_planet_player(planet, winner)
             planet.clans = 1
             planet.mines = 0
             planet.taxes = 0
@@ -1,13 +1,20 @@
 import logging
+from typing import Any, Dict, List, Tuple
 
 import attr
+import numpy as np
 
+from .. import cfg
 from ..ship import Ship
 from ..ship_type import ShipType
-from .core import PlanetOrder
+from ..state import PlanetsTable
+from .core import GalaxyOrder, PlanetOrder
+from .events import log_event
 
 logger = logging.getLogger("game")
 
+INT64 = np.iinfo(np.int64)
+
 
 @attr.s()
 class PlanetBuildMinesOrder(PlanetOrder):
@@ -39,7 +46,7 @@ class PlanetBuildMinesOrder(PlanetOrder):
         )
         self.planet.pythonium -= new_mines * self.planet.mine_cost.pythonium
 
-        logger.info(
+        log_event(
             "New mines",
             extra={
                 "turn": galaxy.turn,
@@ -47,6 +54,7 @@ class PlanetBuildMinesOrder(PlanetOrder):
                 "planet": self.planet.id,
                 "new_mines": new_mines,
             },
+            values=("new_mines",),
         )
 
 
@@ -86,7 +94,7 @@ class PlanetBuildShipOrder(PlanetOrder):
 
         galaxy.add_ship(ship)
 
-        logger.info(
+        log_event(
             "New ship built",
             extra={
                 "turn": galaxy.turn,
@@ -108,7 +116,7 @@ class PlanetSetTaxesOrder(PlanetOrder):
             return
 
         self.planet.taxes = min(max(0, self.taxes), 100)
-        logger.info(
+        log_event(
             "Taxes updated",
             extra={
                 "turn": galaxy.turn,
@@ -116,4 +124,213 @@ class PlanetSetTaxesOrder(PlanetOrder):
                 "planet": self.planet.id,
                 "taxes": self.taxes,
             },
+            values=("taxes",),
+        )
+
+
+def buildable_mines(
+    planets: Dict[str, np.ndarray],
+    mine_cost_pythonium: np.ndarray,
+    mine_cost_megacredits: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized version of :meth:`Planet.can_build_mines`.
+
+    Return the amount of mines that can be built in each planet of the ``planets``
+    columns (see :attr:`GalaxyState.planets`), given the cost of a mine in each
+    one of them.
+    """
+    max_mines = np.minimum(planets["clans"], cfg.planet_max_mines)
+    return np.trunc(
+        np.minimum(
+            np.minimum(
+                planets["pythonium"] / mine_cost_pythonium,
+                planets["megacredits"] / mine_cost_megacredits,
+            ),
+            max_mines - planets["mines"],
+        )
+    ).astype(np.int64)
+
+
+@attr.s()
+class PlanetsOrder(GalaxyOrder):
+    """
+    Run all the orders of one kind given to the planets in a turn at once.
+
+    Orders that can not run in batch are left in :attr:`pending`, to run one by
+    one with the :class:`PlanetOrder` of its kind. These are the orders with
+    unexpected params (including values that do not fit in an ``int64``), for
+    unknown planets or planets that belong to other player, and the second and
+    following orders for the same planet.
+    """
+
+    orders: List[Tuple[Any, tuple]] = attr.ib()
+    """
+    Orders as ``(player, params)``, where ``params`` is the id of the planet
+    followed by the value of the order
+    """
+
+    pending: List[Tuple[Any, tuple]] = attr.ib(init=False, factory=list)
+    """
+    Orders that were not executed, in the order they were given
+    """
+
+    _rows_orders: np.ndarray = attr.ib(init=False, default=None, repr=False)
+    _pending_orders: List[int] = attr.ib(init=False, factory=list, repr=False)
+
+    def _load(self) -> Tuple[PlanetsTable, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find the rows of the planets of the orders in the :attr:`Galaxy.state`.
+
+        Return the planets table, the row of each order, the value of each order,
+        and a mask with the orders given by the player that owns the planet. The
+        orders for other players planets are left as pending, so they are warned
+        one by one.
+        """
+        table = self.galaxy.state.planets
+        search_planet = self.galaxy.search_planet
+        rows = []
+        players = []
+        values = []
+        rows_orders = []
+        loaded = set()
+        for index, (player, params) in enumerate(self.orders):
+            if (
+                len(params) == 2
+                and type(params[0]) is int
+                and type(params[1]) is int
+                and INT64.min <= params[1] <= INT64.max
+            ):
+                planet = search_planet(params[0])
+                if planet is not None and planet.id not in loaded:
+                    loaded.add(planet.id)
+                    rows.append(table.get_row(planet))
+                    players.append(player.name)
+                    values.append(params[1])
+                    rows_orders.append(index)
+                    continue
+            self._pending_orders.append(index)
+        self._rows_orders = np.array(rows_orders, dtype=np.intp)
+
+        rows = np.array(rows, dtype=np.intp)
+        players_handles = np.fromiter(
+            (self.galaxy.get_player_handle(p) for p in players),
+            dtype=np.int64,
+            count=len(players),
         )
+        owned = table.owner[rows] == players_handles
+        self._defer(~owned)
+        return table, rows, np.array(values, dtype=np.int64), owned
+
+    def _defer(self, rows: np.ndarray):
+        """
+        Leave the orders of the ``rows`` (a mask) in :attr:`pending`
+        """
+        self._pending_orders.extend(self._rows_orders[rows].tolist())
+        self.pending = [
+            self.orders[index] for index in sorted(self._pending_orders)
+        ]
+
+
+@attr.s()
+class PlanetsSetTaxesOrder(PlanetsOrder):
+    """
+    Run all the ``planet_set_taxes`` orders of a turn at once, with the same rules
+    than :class:`PlanetSetTaxesOrder`.
+    """
+
+    name = "planets_set_taxes"
+
+    def execute(self) -> None:
+        planets, rows, taxes, owned = self._load()
+        changed = owned & (planets["taxes"][rows] != taxes)
+        planets["taxes"][rows[changed]] = np.clip(taxes[changed], 0, 100)
+        planets.commit()
+
+        for row, new_taxes in zip(
+            rows[changed].tolist(), taxes[changed].tolist()
+        ):
+            planet = planets.entities[row]
+            log_event(
+                "Taxes updated",
+                extra={
+                    "turn": self.galaxy.turn,
+                    "player": planet.player,
+                    "planet": planet.id,
+                    "taxes": new_taxes,
+                },
+                values=("taxes",),
+            )
+
+
+@attr.s()
+class PlanetsBuildMinesOrder(PlanetsOrder):
+    """
+    Run all the ``planet_build_mines`` orders of a turn at once, with the same
+    rules than :class:`PlanetBuildMinesOrder`.
+
+    Orders for planets with free mines are also left as pending.
+    """
+
+    name = "planets_build_mines"
+
+    def execute(self) -> None:
+        planets, rows, requested_mines, owned = self._load()
+        entities = [planets.entities[row] for row in rows.tolist()]
+        count = len(entities)
+        mine_cost_pythonium = np.fromiter(
+            (p.mine_cost.pythonium for p in entities),
+            dtype=np.int64,
+            count=count,
+        )
+        mine_cost_megacredits = np.fromiter(
+            (p.mine_cost.megacredits for p in entities),
+            dtype=np.int64,
+            count=count,
+        )
+        free = (mine_cost_pythonium == 0) | (mine_cost_megacredits == 0)
+        self._defer(owned & free)
+        selected = owned & ~free
+
+        columns = planets.select(rows)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buildable = buildable_mines(
+                columns, mine_cost_pythonium, mine_cost_megacredits
+            )
+        new_mines = np.where(
+            selected, np.minimum(requested_mines, buildable), 0
+        )
+        columns["mines"] += new_mines
+        columns["megacredits"] -= new_mines * mine_cost_megacredits
+        columns["pythonium"] -= new_mines * mine_cost_pythonium
+        planets.update(rows, columns)
+        planets.commit()
+
+        for index in np.flatnonzero(selected & (new_mines == 0)).tolist():
+            planet = entities[index]
+            logger.warning(
+                "No mines to build",
+                extra={
+                    "turn": self.galaxy.turn,
+                    "planet": planet.id,
+                    "pythonium": planet.pythonium,
+                    "megacredits": planet.megacredits,
+                    "mines": planet.mines,
+                    "max_mines": planet.max_mines,
+                    "new_mines": int(requested_mines[index]),
+                },
+            )
+
+        built = np.flatnonzero(new_mines)
+        for index, mines in zip(built.tolist(), new_mines[built].tolist()):
+            planet = entities[index]
+            log_event(
+                "New mines",
+                extra={
+                    "turn": self.galaxy.turn,
+                    "player": planet.player,
+                    "planet": planet.id,
+                    "new_mines": mines,
+                },
+                values=("new_mines",),
+            )
@@ -1,13 +1,54 @@
 import logging
-from typing import Tuple
+from collections import Counter
+from typing import List, Tuple
 
 import attr
+import numpy as np
 
+from ..ship import Ship
 from ..vectors import Transfer
-from .core import ShipOrder
+from . import events
+from .core import GalaxyOrder, ShipOrder
+from .events import log_event
 
 logger = logging.getLogger("game")
 
+MAX_COORDINATE = 2**31
+"""
+Largest absolute coordinate that :class:`ShipsMoveOrder` computes in batch.
+Beyond it the ``int64`` arithmetic of :func:`compute_moves` could overflow.
+"""
+
+
+def compute_moves(
+    positions: np.ndarray, targets: np.ndarray, speeds: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized version of :meth:`ShipMoveOrder.execute`.
+
+    Compute where each ship ends after moving towards its target, with the same
+    operations and truncation than :class:`ShipMoveOrder`.
+
+    :param positions: Array of shape ``(N, 2)`` with the integer position of \
+        each ship
+    :param targets: Array of shape ``(N, 2)`` with the integer target of each ship
+    :param speeds: Array of shape ``(N,)`` with the speed of each ship
+
+    Return an array of shape ``(N, 2)`` with the new position of each ship, and
+    a boolean array of shape ``(N,)`` that indicates which ships reached its target.
+    """
+    delta = (targets - positions).astype(float)
+    distances = np.sqrt(np.sum(delta * delta, axis=1))
+    arrived = distances <= speeds
+
+    new_positions = np.array(targets, dtype=np.int64)
+    moving = ~arrived
+    if moving.any():
+        directions = delta[moving] / distances[moving, np.newaxis]
+        steps = positions[moving] + directions * speeds[moving, np.newaxis]
+        new_positions[moving] = np.trunc(steps).astype(np.int64)
+    return new_positions, arrived
+
 
 @attr.s()
 class ShipMoveOrder(ShipOrder):
@@ -37,9 +78,9 @@ class ShipMoveOrder(ShipOrder):
             )
             new_target = self.target
 
-        self.ship.position = to
+        galaxy.move_ship(self.ship, to)
         self.ship.target = new_target
-        logger.info(
+        log_event(
             "Ship moved",
             extra={
                 "turn": galaxy.turn,
@@ -52,6 +93,108 @@ class ShipMoveOrder(ShipOrder):
         )
 
 
+@attr.s()
+class ShipsMoveOrder(GalaxyOrder):
+    """
+    Run all the ``ship_move`` orders of a turn at once.
+
+    Equivalent to execute one :class:`ShipMoveOrder` for each move, but the new
+    positions are computed for all the ships together with :func:`compute_moves`.
+
+    Moves that can not be computed in batch (positions or targets that are not
+    tuples of two integers up to :data:`MAX_COORDINATE`, or more than one move
+    for the same ship) are left in :attr:`pending`, in the same order, to be
+    executed one by one after.
+    """
+
+    name = "ships_move"
+    moves: List[Tuple[Ship, Tuple[int, int]]] = attr.ib()
+
+    pending: List[Tuple[Ship, Tuple[int, int]]] = attr.ib(
+        init=False, factory=list
+    )
+    """
+    Moves that were not executed
+    """
+
+    @staticmethod
+    def _is_point(point) -> bool:
+        return (
+            type(point) is tuple
+            and len(point) == 2
+            and type(point[0]) is int
+            and type(point[1]) is int
+            and -MAX_COORDINATE <= point[0] <= MAX_COORDINATE
+            and -MAX_COORDINATE <= point[1] <= MAX_COORDINATE
+        )
+
+    def execute(self) -> None:
+        ships = []
+        targets = []
+        seen_ships = set()
+        pending_ships = set()
+        for ship, target in self.moves:
+            if (
+                id(ship) in seen_ships
+                or id(ship) in pending_ships
+                or not self._is_point(target)
+                or not self._is_point(ship.position)
+                or type(ship.speed) is not int
+            ):
+                # The ship is moved one move at a time after the batch, in order
+                self.pending.append((ship, target))
+                pending_ships.add(id(ship))
+                continue
+            seen_ships.add(id(ship))
+            ships.append(ship)
+            targets.append(target)
+
+        if not ships:
+            return
+
+        origins = [ship.position for ship in ships]
+        new_positions, arrived = compute_moves(
+            np.array(origins, dtype=np.int64),
+            np.array(targets, dtype=np.int64),
+            np.fromiter((s.speed for s in ships), dtype=np.int64),
+        )
+        positions = [
+            target if ship_arrived else tuple(position)
+            for target, ship_arrived, position in zip(
+                targets, arrived.tolist(), new_positions.tolist()
+            )
+        ]
+        self.galaxy.move_ships(ships, positions)
+        for ship, target, ship_arrived in zip(
+            ships, targets, arrived.tolist()
+        ):
+            ship.target = None if ship_arrived else target
+
+        self._log_moves(ships, origins)
+
+    def _log_moves(self, ships: List[Ship], origins: List[Tuple[int, int]]):
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        if events.is_summary():
+            for player, count in Counter(s.player for s in ships).items():
+                events.summary.add_aggregates(
+                    "Ship moved", self.galaxy.turn, player, count, {}, {}, {}
+                )
+            return
+        for ship, _from in zip(ships, origins):
+            log_event(
+                "Ship moved",
+                extra={
+                    "turn": self.galaxy.turn,
+                    "player": ship.player,
+                    "ship": ship.id,
+                    "from": _from,
+                    "to": ship.position,
+                    "target": ship.target,
+                },
+            )
+
+
 @attr.s()
 class ShipTransferOrder(ShipOrder):
 
@@ -61,14 +204,17 @@ class ShipTransferOrder(ShipOrder):
     def execute(self, galaxy):
         planet = galaxy.planets.get(self.ship.position)
 
-        logger.info(
+        log_event(
             "Attempt to transfer",
             extra={
+                "turn": galaxy.turn,
+                "player": self.ship.player,
                 "ship": self.ship.id,
                 "clans": self.transfer.clans,
                 "pythonium": self.transfer.pythonium,
                 "megacredits": self.transfer.megacredits,
             },
+            values=("clans", "pythonium", "megacredits"),
         )
 
         if not planet:
@@ -124,7 +270,7 @@ class ShipTransferOrder(ShipOrder):
         self.ship.pythonium += self.transfer.pythonium
         self.ship.megacredits += self.transfer.megacredits
 
-        logger.info(
+        log_event(
             "Ship transfer to planet",
             extra={
                 "turn": galaxy.turn,
@@ -134,6 +280,7 @@ class ShipTransferOrder(ShipOrder):
                 "pythonium": self.transfer.pythonium,
                 "megacredits": self.transfer.megacredits,
             },
+            values=("clans", "pythonium", "megacredits"),
         )
 
         planet.clans -= self.transfer.clans
@@ -142,8 +289,8 @@ class ShipTransferOrder(ShipOrder):
 
         if not planet.clans:
             # If nobody stays in the planet the player doesn't own it anymore
-            planet.player = None
-            logger.info(
+            galaxy.set_planet_player(planet, None)
+            log_event(
                 "Planet abandoned",
                 extra={
                     "turn": galaxy.turn,
@@ -154,8 +301,8 @@ class ShipTransferOrder(ShipOrder):
         elif planet.player is None and planet.clans > 0:
             # If nobody owns the planet and the ship download clans the player
             # conquer the planet
-            planet.player = self.ship.player
-            logger.info(
+            galaxy.set_planet_player(planet, self.ship.player)
+            log_event(
                 "Planet conquered",
                 extra={
                     "turn": galaxy.turn,
@@ -165,3 +312,173 @@ class ShipTransferOrder(ShipOrder):
             )
 
         return
+
+
+@attr.s()
+class ShipsTransferOrder(GalaxyOrder):
+    """
+    Run all the ``ship_transfer`` orders of a turn, grouped by planet.
+
+    The transfers of each planet are resolved in order with the same rules than
+    :class:`ShipTransferOrder`, over local copies of the planet and ships cargo.
+    The results are written back once per planet and ship.
+
+    Transfers in deep space, and the ones of planets with any non integer
+    amount, are left in :attr:`pending` to run one by one with
+    :class:`ShipTransferOrder`.
+    """
+
+    name = "ships_transfer"
+    transfers: List[Tuple[Ship, Transfer]] = attr.ib()
+    pending: List[Tuple[Ship, Transfer]] = attr.ib(init=False, factory=list)
+    """
+    Transfers that were not executed, in the order they were given
+    """
+
+    @staticmethod
+    def _is_integer(transfer: Transfer) -> bool:
+        return (
+            type(transfer.clans) is int
+            and type(transfer.pythonium) is int
+            and type(transfer.megacredits) is int
+        )
+
+    def execute(self) -> None:
+        transfers_by_position = {}
+        for ship, transfer in self.transfers:
+            transfers_by_position.setdefault(ship.position, []).append(
+                (ship, transfer)
+            )
+
+        for position, transfers in transfers_by_position.items():
+            planet = self.galaxy.planets.get(position)
+            if planet is None or not all(
+                self._is_integer(t) for _, t in transfers
+            ):
+                self.pending.extend(transfers)
+                continue
+            self._transfer_in_planet(planet, transfers)
+
+    def _transfer_in_planet(self, planet, transfers):
+        turn = self.galaxy.turn
+        player = planet.player
+        planet_clans = planet.clans
+        planet_pythonium = planet.pythonium
+        planet_megacredits = planet.megacredits
+        # Cargo of each ship: [clans, pythonium, megacredits]
+        cargos = {}
+
+        for ship, transfer in transfers:
+            log_event(
+                "Attempt to transfer",
+                extra={
+                    "turn": turn,
+                    "player": ship.player,
+                    "ship": ship.id,
+                    "clans": transfer.clans,
+                    "pythonium": transfer.pythonium,
+                    "megacredits": transfer.megacredits,
+                },
+                values=("clans", "pythonium", "megacredits"),
+            )
+
+            if player is not None and player != ship.player:
+                logger.warning(
+                    "Can not transfer to an enemy planet",
+                    extra={"turn": turn, "ship": ship.id, "planet": planet.id},
+                )
+                continue
+
+            cargo = cargos.get(ship.id)
+            if cargo is None:
+                cargo = cargos[ship.id] = [
+                    ship.clans,
+                    ship.pythonium,
+                    ship.megacredits,
+                ]
+            ship_clans, ship_pythonium, ship_megacredits = cargo
+
+            # Same rules than `ShipTransferOrder`
+            available_cargo = ship.max_cargo - (ship_pythonium + ship_clans)
+            clans = (
+                min(transfer.clans, planet_clans, available_cargo)
+                if transfer.clans > 0
+                else max(transfer.clans, -ship_clans)
+            )
+            pythonium = (
+                min(
+                    transfer.pythonium,
+                    planet_pythonium,
+                    available_cargo - clans,
+                )
+                if transfer.pythonium > 0
+                else max(transfer.pythonium, -ship_pythonium)
+            )
+            megacredits = (
+                min(
+                    transfer.megacredits,
+                    planet_megacredits,
+                    ship.max_mc - ship_megacredits,
+                )
+                if transfer.megacredits > 0
+                else max(transfer.megacredits, -ship_megacredits)
+            )
+            transfer.clans = clans
+            transfer.pythonium = pythonium
+            transfer.megacredits = megacredits
+
+            cargo[0] += clans
+            cargo[1] += pythonium
+            cargo[2] += megacredits
+
+            log_event(
+                "Ship transfer to planet",
+                extra={
+                    "turn": turn,
+                    "player": ship.player,
+                    "ship": ship.id,
+                    "clans": clans,
+                    "pythonium": pythonium,
+                    "megacredits": megacredits,
+                },
+                values=("clans", "pythonium", "megacredits"),
+            )
+
+            planet_clans -= clans
+            planet_pythonium -= pythonium
+            planet_megacredits -= megacredits
+
+            if not planet_clans:
+                player = None
+                log_event(
+                    "Planet abandoned",
+                    extra={
+                        "turn": turn,
+                        "player": ship.player,
+                        "planet": planet.id,
+                    },
+                )
+            elif player is None and planet_clans > 0:
+                player = ship.player
+                log_event(
+                    "Planet conquered",
+                    extra={
+                        "turn": turn,
+                        "player": ship.player,
+                        "planet": planet.id,
+                    },
+                )
+
+        for ship, _ in transfers:
+            cargo = cargos.pop(ship.id, None)
+            if cargo is not None:
+                ship.clans, ship.pythonium, ship.megacredits = cargo
+
+        if planet.clans != planet_clans:
+            planet.clans = planet_clans
+        if planet.pythonium != planet_pythonium:
+            planet.pythonium = planet_pythonium
+        if planet.megacredits != planet_megacredits:
+            planet.megacredits = planet_megacredits
+        if planet.player != player:
+            self.galaxy.set_planet_player(planet, player)
@@ -3,10 +3,123 @@ import attr
 from . import cfg, validators
 from .core import Position, StellarThing
 from .ship_type import ShipType
-from .vectors import Transfer
+from .vectors import FrozenTransfer, Transfer
+
+DERIVED_INPUTS = frozenset(
+    (
+        "pythonium",
+        "megacredits",
+        "clans",
+        "mines",
+        "happypoints",
+        "taxes",
+        "taxes_collection_factor",
+    )
+)
+"""
+Attributes of :class:`Planet` that its derived properties depend on.
+Changing any of them invalidates the cached values. The derived properties also
+depend on the :class:`PlanetStatic` attributes, that never change.
+"""
+
+
+class derived_property:
+    """
+    Property of a :class:`Planet` derived from other attributes.
 
+    The value is computed the first time is requested, and cached in the planet
+    until one of the attributes it depends on changes (see :data:`DERIVED_INPUTS`).
+    Changes in :mod:`cfg` are not tracked. The uncached function is available as
+    ``compute``.
+    """
+
+    def __init__(self, compute):
+        self.compute = compute
+        self.name = compute.__name__
+        self.__doc__ = compute.__doc__
+
+    def __get__(self, planet, owner=None):
+        if planet is None:
+            return self
+        derived = planet._derived
+        if derived is None:
+            derived = {}
+            object.__setattr__(planet, "_derived", derived)
+        elif self.name in derived:
+            return derived[self.name]
+        value = derived[self.name] = self.compute(planet)
+        return value
+
+
+def _is_set(obj, name: str) -> bool:
+    try:
+        object.__getattribute__(obj, name)
+    except AttributeError:
+        return False
+    return True
+
+
+@attr.s(auto_attribs=True, frozen=True, slots=True, weakref_slot=False)
+class PlanetStatic:
+    """
+    Attributes of a :class:`Planet` that never change during the game.
 
-@attr.s(auto_attribs=True, repr=False)
+    The planet keeps them apart from the state that changes every turn, so the
+    copies and views of the planet can share them.
+    """
+
+    position: Position = attr.ib(converter=Position)
+    """
+    Position of the planet in (x, y) coordinates.
+    """
+
+    temperature: int = attr.ib(validator=validators.number_between_zero_100)
+    """
+    The temperature of the planet. It is always between zero and 100.
+    """
+
+    concentration: float = attr.ib(validator=[validators.is_valid_ratio])
+    """
+    Indicates how much pythonium extract one mine. It is always between zero and 1.
+    """
+
+    mine_cost: Transfer = attr.ib(
+        validator=[attr.validators.instance_of(Transfer)],
+        converter=FrozenTransfer.intern,
+    )
+    """
+    Indicates the cost of building one mine.
+    """
+
+    max_happypoints: int = attr.ib(init=False)
+    """
+    The maximum level of happypoints that the population of the planet can reach.
+    See :attr:`Planet.max_happypoints`
+    """
+
+    @max_happypoints.default
+    def _max_happypoints(self):
+        # `max_happypoints` will decay as long as `temperature` differ from
+        # `cfg.optimal_temperature`. `max_happypoints` can't be less than
+        # `cfg.happypoints_tolerance`
+        return int(
+            max(
+                100 - abs(self.temperature - cfg.optimal_temperature),
+                cfg.optimal_temperature,
+            )
+        )
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Nothing in the record can change, so the copies share it
+        return self
+
+
+@attr.s(
+    auto_attribs=True, init=False, repr=False, slots=True, weakref_slot=False
+)
 class Planet(StellarThing):
     """
     A planet that belongs to a :class:`Galaxy`
@@ -26,13 +139,18 @@ class Planet(StellarThing):
     The lower the ``happypoints`` are over ``cfg.happypoints_tolerance``, the lower the
     planet production of ``clans``, ``pythonium``, and ``megacredits`` will be
     (in proportion of ``rioting_index``).
+
+    The attributes that never change are kept in :attr:`static`. They can be given
+    one by one (``position``, ``temperature``, ``concentration`` and ``mine_cost``),
+    or as a :class:`PlanetStatic` shared with other planets. They are read-only,
+    ``position`` included.
     """
 
-    temperature: int = attr.ib(
-        validator=validators.number_between_zero_100, kw_only=True
+    static: PlanetStatic = attr.ib(
+        validator=[attr.validators.instance_of(PlanetStatic)], kw_only=True
     )
     """
-    The temperature of the planet. It is always between zero and 100.
+    Attributes of the planet that never change during the game
     """
 
     underground_pythonium: int = attr.ib(
@@ -43,13 +161,6 @@ class Planet(StellarThing):
     mines.
     """
 
-    concentration: float = attr.ib(
-        validator=[validators.is_valid_ratio], kw_only=True
-    )
-    """
-    Indicates how much pythonium extract one mine. It is always between zero and 1.
-    """
-
     pythonium: int = attr.ib(
         validator=[attr.validators.instance_of(int)], kw_only=True
     )
@@ -57,17 +168,14 @@ class Planet(StellarThing):
     Pythonium in the surface of the planet. The available resource to build things.
     """
 
-    mine_cost: Transfer = attr.ib(
-        validator=[attr.validators.instance_of(Transfer)], kw_only=True
-    )
-    """
-    Indicates the cost of building one mine.
-    """
-
     # State in turn
     player: str = attr.ib(default=None, kw_only=True)
     """
     The owner of the planet or ``None`` if no one owns it.
+
+    Once the planet is in a :class:`Galaxy`, the owner must be changed with
+    :meth:`Galaxy.set_planet_player`. Assigning it directly leaves the galaxy
+    indexes out of date.
     """
 
     megacredits: int = attr.ib(converter=int, default=0, kw_only=True)
@@ -85,16 +193,6 @@ class Planet(StellarThing):
     Amount of mines on the planet
     """
 
-    max_happypoints: int = attr.ib(converter=int, init=False, kw_only=True)
-    """
-    The maximum level of happypoints that the population of this planet can reach.
-
-    It is based on the planet's temperature.
-
-    Its maximum value (100) is reached when the planet's temperature is equal \
-    to ``cfg.optimal_temperature``
-    """
-
     happypoints: int = attr.ib(converter=int, init=False, kw_only=True)
     """
     The level of happyness on the planet.
@@ -150,30 +248,102 @@ class Planet(StellarThing):
         init=False,
     )
 
+    _derived: dict = attr.ib(
+        default=None, init=False, repr=False, eq=False, kw_only=True
+    )
+    """
+    Cache of the values of the derived properties (see :class:`derived_property`).
+    ``None`` when it is empty.
+    """
+
+    _changes_tracker: set = attr.ib(
+        default=None, init=False, repr=False, eq=False, kw_only=True
+    )
+    """
+    Set where the planet adds its id every time one of its attributes changes,
+    or ``None`` if nobody tracks the planet. See :attr:`Galaxy.state`
+    """
+
+    def __init__(
+        self,
+        position: Position = None,
+        *,
+        temperature: int = None,
+        concentration: float = None,
+        mine_cost: Transfer = None,
+        static: PlanetStatic = None,
+        **kwargs,
+    ):
+        if static is None:
+            static = PlanetStatic(
+                position=position,
+                temperature=temperature,
+                concentration=concentration,
+                mine_cost=mine_cost,
+            )
+        object.__setattr__(self, "_changes_tracker", None)
+        self.__attrs_init__(position=static.position, static=static, **kwargs)
+
     def __attrs_post_init__(self):
-        # `max_happypoints` will decay as long as `temperature` differ from
-        # `cfg.optimal_temperature`. `max_happypoints` can't be less than
-        # `cfg.happypoints_tolerance`
-        self.max_happypoints = max(
-            100 - abs(self.temperature - cfg.optimal_temperature),
-            cfg.optimal_temperature,
-        )
         self.happypoints = self.max_happypoints
 
+    @property
+    def temperature(self) -> int:
+        """
+        The temperature of the planet. It is always between zero and 100.
+        """
+        return self.static.temperature
+
+    @property
+    def concentration(self) -> float:
+        """
+        Indicates how much pythonium extract one mine. It is always between zero and 1.
+        """
+        return self.static.concentration
+
+    @property
+    def mine_cost(self) -> Transfer:
+        """
+        Indicates the cost of building one mine.
+        """
+        return self.static.mine_cost
+
+    @property
+    def max_happypoints(self) -> int:
+        """
+        The maximum level of happypoints that the population of this planet can reach.
+
+        It is based on the planet's temperature.
+
+        Its maximum value (100) is reached when the planet's temperature is equal \
+        to ``cfg.optimal_temperature``
+        """
+        return self.static.max_happypoints
+
+    def __setattr__(self, name, value):
+        if name == "position" and _is_set(self, "position"):
+            # The position is taken from ``static`` by the constructor
+            raise AttributeError("The position of a planet can not change")
+        if name in DERIVED_INPUTS:
+            object.__setattr__(self, "_derived", None)
+        object.__setattr__(self, name, value)
+        if self._changes_tracker is not None:
+            self._changes_tracker.add(self.id)
+
     def __str__(self):
         return f"Planet(id={self.id}, position={self.position}, player={self.player})"
 
     def __repr__(self):
         return self.__str__()
 
-    @property
+    @derived_property
     def max_mines(self) -> int:
         """
         The maximum number of mines that can be build in the planet
         """
         return min(self.clans, cfg.planet_max_mines)
 
-    @property
+    @derived_property
     def rioting_index(self) -> float:
         """
         If the ``happypoints`` are less than ``cfg.happypoints_tolerance`` this \
@@ -184,7 +354,7 @@ class Planet(StellarThing):
         """
         return min(self.happypoints / cfg.happypoints_tolerance, 1)
 
-    @property
+    @derived_property
     def dpythonium(self) -> int:
         """
         Absolute change in pythonium for the next turn considering:
@@ -199,7 +369,7 @@ class Planet(StellarThing):
 
         return max(int(mines_extraction), -self.pythonium)
 
-    @property
+    @derived_property
     def dmegacredits(self) -> int:
         """
         Absolute change in megacredits for the next turn considering:
@@ -221,7 +391,7 @@ class Planet(StellarThing):
 
         return int(taxes)
 
-    @property
+    @derived_property
     def dhappypoints(self) -> int:
         """
         Absolute change on happypoints for the next turn
@@ -234,7 +404,7 @@ class Planet(StellarThing):
                 unbounded_dhappypoints, self.max_happypoints - self.happypoints
             )
 
-    @property
+    @derived_property
     def dclans(self) -> int:
         """
         Aditional clans for the next turn. The absolute change
@@ -271,6 +441,10 @@ class Planet(StellarThing):
         Computes the number of mines that can be built on the planet based \
         on available resources and ``max_mines``
         """
+        return self._buildable_mines
+
+    @derived_property
+    def _buildable_mines(self) -> int:
         return int(
             min(
                 self.pythonium / self.mine_cost.pythonium,
@@ -1,4 +1,5 @@
 import attr
+import numpy as np
 
 from .galaxy import Galaxy
 
@@ -12,6 +13,15 @@ class AbstractPlayer:
     gif and reports.
     """
 
+    rng: np.random.Generator = attr.ib(
+        init=False, factory=np.random.default_rng, repr=False
+    )
+    """
+    Random numbers generator of the player. Each :class:`Game` gives its players
+    a stream derived from the game seed, so the games can be reproduced. Use it
+    instead of the :mod:`random` module.
+    """
+
     def next_turn(self, galaxy: Galaxy, context: dict) -> Galaxy:
         """
         Compute the player strategy based on the available information in the ``galaxy``
@@ -35,6 +45,20 @@ class AbstractPlayer:
 
         The player won't know the attributes of enemy ships or planets but the position.
 
+        The player gets the same ``galaxy`` object every turn, updated with what
+        happened in the last turn. The values written by the player in the previous
+        turn are discarded. Its containers are read-only (``galaxy.planets`` is a
+        read-only mapping and ``galaxy.ships`` a tuple): copy them to filter or sort
+        them in place.
+
+        The planets and ships in the ``galaxy`` are views of the game state, not
+        copies (see :class:`PlanetView` and :class:`ShipView`). Values written in
+        them are kept in the view, and never reach the game. The game trusts the
+        players to use only the public attributes: the private ones (starting with
+        ``_``, like ``_entity``) give access to the state of the game itself.
+        Reading them reveals what the player is not supposed to see, and writing
+        them corrupts the game. Run untrusted players in their own process.
+
         ``context`` has the following keys:
 
           * ``ship_types``: A dictionary with all the ship types that the player can \
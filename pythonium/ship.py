@@ -5,7 +5,7 @@ from .ship_type import ShipType
 from .vectors import Transfer
 
 
-@attr.s(auto_attribs=True, repr=False)
+@attr.s(auto_attribs=True, repr=False, slots=True, weakref_slot=False)
 class Ship(StellarThing):
     """
     A ship that belongs to a race.
@@ -1,12 +1,15 @@
 import attr
 
-from .vectors import Transfer
+from .vectors import FrozenTransfer, Transfer
 
 
-@attr.s
+@attr.s(frozen=True, slots=True, weakref_slot=False)
 class ShipType:
     """
     Defines the attributes of a ship that the player can built.
+
+    Ship types can not change. Each one is shared by all the ships of the type, and
+    by the views of those ships, instead of being copied.
     """
 
     name: str = attr.ib()
@@ -14,7 +17,7 @@ class ShipType:
     A descriptive name for the ship type. i.e: 'war', 'carrier'
     """
 
-    cost: Transfer = attr.ib()
+    cost: Transfer = attr.ib(converter=FrozenTransfer.intern)
     """
     :class:`Transfer` instance that represents the cost of a ship of this type.
     """
@@ -54,3 +57,9 @@ class ShipType:
 
     def __repr__(self):
         return self.name
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
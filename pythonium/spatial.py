@@ -0,0 +1,97 @@
+import math
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .core import Position
+
+Cell = Tuple[int, int]
+
+
+class SpatialGrid:
+    """
+    Uniform grid over a fixed set of points.
+
+    Every point is assigned to the square cell that contains it, so a radius query
+    only needs to check the points in the cells overlapped by the query circle.
+
+    :param points: Array of shape ``(N, 2)`` with the points to index. Queries \
+        return row indices of this array.
+    :param cell_size: Width and height of each cell of the grid
+    """
+
+    def __init__(self, points: np.ndarray, cell_size: float):
+        self.points: np.ndarray = points
+        """
+        The indexed points
+        """
+
+        self.cell_size: float = cell_size
+        """
+        Width and height of each cell of the grid
+        """
+
+        cells: Dict[Cell, List[int]] = defaultdict(list)
+        for index, (x, y) in enumerate(points.tolist()):
+            cells[self.get_cell((x, y))].append(index)
+
+        self._cells: Dict[Cell, np.ndarray] = {
+            cell: np.array(indices, dtype=np.intp)
+            for cell, indices in cells.items()
+        }
+        """
+        Indices of the points located in each cell
+        """
+
+    def __len__(self):
+        return len(self.points)
+
+    def get_cell(self, point: Position) -> Cell:
+        """
+        Return the cell that contains the ``point``
+        """
+        return (
+            math.floor(point[0] / self.cell_size),
+            math.floor(point[1] / self.cell_size),
+        )
+
+    def get_cells_in_box(self, point: Position, radius: float) -> List[Cell]:
+        """
+        Return the non empty cells overlapped by the square of side ``2 * radius``
+        centered in ``point``
+        """
+        min_x, min_y = self.get_cell((point[0] - radius, point[1] - radius))
+        max_x, max_y = self.get_cell((point[0] + radius, point[1] + radius))
+        cells_in_box = (max_x - min_x + 1) * (max_y - min_y + 1)
+        if cells_in_box > len(self._cells):
+            # The box is bigger than the populated area of the grid.
+            # It is cheaper to check the non empty cells.
+            return [
+                (x, y)
+                for x, y in self._cells.keys()
+                if min_x <= x <= max_x and min_y <= y <= max_y
+            ]
+        return [
+            (x, y)
+            for x in range(min_x, max_x + 1)
+            for y in range(min_y, max_y + 1)
+            if (x, y) in self._cells
+        ]
+
+    def query_radius(self, point: Position, radius: float) -> np.ndarray:
+        """
+        Return the sorted indices of all the points that are ``radius`` or less away
+        from ``point``
+        """
+        if radius < 0 or not self._cells:
+            return np.empty(0, dtype=np.intp)
+
+        cells = self.get_cells_in_box(point, radius)
+        if not cells:
+            return np.empty(0, dtype=np.intp)
+
+        candidates = np.concatenate([self._cells[cell] for cell in cells])
+        delta = self.points[candidates] - np.asarray(point, dtype=float)
+        distances = np.sqrt(np.sum(delta * delta, axis=1))
+        return np.sort(candidates[distances <= radius])
@@ -0,0 +1,422 @@
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from .core import StellarThing
+from .planet import Planet
+from .ship import Ship
+
+PLANET_COLUMNS = {
+    "clans": np.int64,
+    "pythonium": np.int64,
+    "underground_pythonium": np.int64,
+    "megacredits": np.int64,
+    "mines": np.int64,
+    "taxes": np.int64,
+    "happypoints": np.int64,
+    "max_happypoints": np.int64,
+    "concentration": np.float64,
+    "taxes_collection_factor": np.float64,
+}
+"""
+Planet attributes stored as columns in :class:`GalaxyState`
+"""
+
+PLANET_STATIC_COLUMNS = frozenset(("max_happypoints", "concentration"))
+"""
+Columns of :data:`PLANET_COLUMNS` taken from :class:`PlanetStatic`. They never
+change, so they are read-only.
+"""
+
+SHIP_COLUMNS = {
+    "clans": np.int64,
+    "pythonium": np.int64,
+    "megacredits": np.int64,
+    "max_cargo": np.int64,
+    "max_mc": np.int64,
+    "attack": np.int64,
+    "speed": np.int64,
+}
+"""
+Ship attributes stored as columns in :class:`GalaxyState`
+"""
+
+
+class EntityTable:
+    """
+    Struct-of-arrays representation of a group of entities: one NumPy array per
+    attribute (a column) and one row per entity.
+
+    :param state: The :class:`GalaxyState` that owns the table
+    :param entities: Entities to load in the table. The row of each entity is its \
+        position in this iterable.
+    :param columns: Attributes to load as columns and their dtypes
+    """
+
+    row_class = None
+
+    static_columns = frozenset()
+    """
+    Columns that can not change. Their arrays are read-only, and they are never
+    written back to the entities.
+    """
+
+    def __init__(
+        self,
+        state: "GalaxyState",
+        entities: Iterable[StellarThing],
+        columns: Dict[str, Any],
+    ):
+        self.state = state
+
+        self.entities: List[StellarThing] = list(entities)
+        """
+        Entities in the table, in row order
+        """
+
+        self.rows: Dict[int, int] = {
+            entity.id: row for row, entity in enumerate(self.entities)
+        }
+        """
+        Row of each entity indexed by the entity id
+        """
+
+        count = len(self.entities)
+        self.columns: Dict[str, np.ndarray] = {
+            name: np.fromiter(
+                (getattr(e, name) for e in self.entities),
+                dtype=dtype,
+                count=count,
+            )
+            for name, dtype in columns.items()
+        }
+        """
+        One array per attribute, aligned with :attr:`entities`
+        """
+
+        self.positions: np.ndarray = np.array(
+            [e.position for e in self.entities], dtype=float
+        ).reshape(-1, 2)
+        """
+        Array of shape ``(N, 2)`` with the position of each entity
+        """
+
+        self.owner: np.ndarray = np.fromiter(
+            (state.get_player_handle(e.player) for e in self.entities),
+            dtype=np.int64,
+            count=count,
+        )
+        """
+        Handle of the player that owns each entity.
+        See :meth:`GalaxyState.get_player_handle`
+        """
+
+        for name in self.static_columns:
+            self.columns[name].setflags(write=False)
+
+        self._committed = {
+            name: column.copy()
+            for name, column in self.columns.items()
+            if name not in self.static_columns
+        }
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __iter__(self):
+        return (self.row_class(self, row) for row in range(len(self)))
+
+    def get_row(self, entity: StellarThing) -> Optional[int]:
+        """
+        Return the row of the ``entity`` or ``None`` if it is not in the table
+        """
+        return self.rows.get(entity.id)
+
+    def view(self, row: int):
+        """
+        Return a view of the entity in the ``row``.
+        See :class:`PlanetRow` and :class:`ShipRow`
+        """
+        return self.row_class(self, row)
+
+    def set_owner(self, row: int, player: Optional[str]):
+        """
+        Change the owner of the entity in ``row``
+        """
+        raise AttributeError(
+            f"{self.row_class.__name__} owner can not be changed"
+        )
+
+    def select(self, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Return a copy of the columns with only the given ``rows``, in the same
+        order. Changes to the copy are written back with :meth:`update`.
+        """
+        return {name: column[rows] for name, column in self.columns.items()}
+
+    def update(self, rows: np.ndarray, columns: Dict[str, np.ndarray]):
+        """
+        Write the ``columns`` returned by :meth:`select` back to the ``rows``
+        """
+        for name, column in columns.items():
+            if name not in self.static_columns:
+                self.columns[name][rows] = column
+
+    def refresh(self, ids: Iterable[int]) -> np.ndarray:
+        """
+        Read again the attributes of the entities with id in ``ids``, for the
+        entities that changed outside the table. Ids of entities not loaded in the
+        table are ignored.
+
+        The cost is proportional to the number of entities to read, and not to the
+        size of the table. Return the rows that were read.
+        """
+        rows = np.fromiter(
+            (self.rows[_id] for _id in ids if _id in self.rows),
+            dtype=np.intp,
+        )
+        for row in rows.tolist():
+            entity = self.entities[row]
+            for name in self._committed:
+                self.columns[name][row] = getattr(entity, name)
+            self.owner[row] = self.state.get_player_handle(entity.player)
+        for name, committed in self._committed.items():
+            committed[rows] = self.columns[name][rows]
+        return rows
+
+    def changed_rows(self, name: str) -> np.ndarray:
+        """
+        Return the rows where the column ``name`` changed since the last commit
+        """
+        if name in self.static_columns:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(self.columns[name] != self._committed[name])
+
+    def commit(self) -> np.ndarray:
+        """
+        Write the changed values of every column back to the entities.
+
+        Only the changed cells are written, so the cost is proportional to the number
+        of changes and not to the size of the table.
+
+        Return the rows that changed.
+        """
+        changed = []
+        for name, committed in self._committed.items():
+            column = self.columns[name]
+            rows = self.changed_rows(name)
+            if not len(rows):
+                continue
+            for row, value in zip(rows.tolist(), column[rows].tolist()):
+                setattr(self.entities[row], name, value)
+            committed[rows] = column[rows]
+            changed.append(rows)
+        if not changed:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(changed))
+
+
+class EntityRow:
+    """
+    Thin view over one row of an :class:`EntityTable`.
+
+    Columns are read from and written to the table. The rest of the attributes are
+    delegated to the entity.
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: EntityTable, row: int):
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_row", row)
+
+    @property
+    def entity(self) -> StellarThing:
+        """
+        The entity in the row
+        """
+        return self._table.entities[self._row]
+
+    def __getattr__(self, name):
+        table = self._table
+        if name in table.columns:
+            return table.columns[name][self._row].item()
+        if name == "player":
+            return table.state.get_player(table.owner[self._row])
+        return getattr(table.entities[self._row], name)
+
+    def __setattr__(self, name, value):
+        table = self._table
+        if name in table.static_columns:
+            raise AttributeError(f"{name} can not be changed")
+        if name in table.columns:
+            table.columns[name][self._row] = value
+        elif name == "player":
+            table.set_owner(self._row, value)
+        else:
+            setattr(table.entities[self._row], name, value)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.entity}, row={self._row})"
+
+
+class PlanetRow(EntityRow):
+    """
+    View of a :class:`Planet` stored in a :class:`GalaxyState`.
+
+    Supports the same attributes and methods than :class:`Planet`.
+    """
+
+    __slots__ = ()
+
+    # The planet caches its derived values, the view computes them from the row
+    max_mines = property(Planet.max_mines.compute)
+    rioting_index = property(Planet.rioting_index.compute)
+    dpythonium = property(Planet.dpythonium.compute)
+    dmegacredits = property(Planet.dmegacredits.compute)
+    dhappypoints = property(Planet.dhappypoints.compute)
+    dclans = property(Planet.dclans.compute)
+    _buildable_mines = property(Planet._buildable_mines.compute)
+    get_orders = Planet.get_orders
+    can_build_mines = Planet.can_build_mines
+    can_build_ship = Planet.can_build_ship
+
+
+class ShipRow(EntityRow):
+    """
+    View of a :class:`Ship` stored in a :class:`GalaxyState`.
+
+    Supports the same attributes and methods than :class:`Ship`.
+    """
+
+    __slots__ = ()
+
+    get_orders = Ship.get_orders
+
+
+class PlanetsTable(EntityTable):
+    row_class = PlanetRow
+    static_columns = PLANET_STATIC_COLUMNS
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._committed_owner = self.owner.copy()
+
+    def set_owner(self, row: int, player: Optional[str]):
+        self.owner[row] = self.state.get_player_handle(player)
+
+    def refresh(self, ids: Iterable[int]) -> np.ndarray:
+        rows = super().refresh(ids)
+        self._committed_owner[rows] = self.owner[rows]
+        return rows
+
+    def commit(self) -> np.ndarray:
+        """
+        Write the changed values of every column back to the planets.
+
+        Changes of owner go through :meth:`Galaxy.set_planet_player`, so the
+        galaxy indexes stay updated.
+
+        Return the rows that changed.
+        """
+        changes = self.state.changes
+        reported = set(changes) if changes else set()
+        changed = super().commit()
+        owner_changed = np.flatnonzero(self.owner != self._committed_owner)
+        for row, handle in zip(
+            owner_changed.tolist(), self.owner[owner_changed].tolist()
+        ):
+            self.state.galaxy.set_planet_player(
+                self.entities[row], self.state.get_player(handle)
+            )
+        self._committed_owner[owner_changed] = self.owner[owner_changed]
+        changed = np.union1d(changed, owner_changed)
+        if changes:
+            # The table already has the values it wrote, only the changes
+            # reported before the commit need to be read again
+            changes -= {
+                self.entities[row].id for row in changed.tolist()
+            } - reported
+        return changed
+
+
+class ShipsTable(EntityTable):
+    row_class = ShipRow
+
+
+class GalaxyState:
+    """
+    Columnar (struct-of-arrays) backend for the state of a :class:`Galaxy`.
+
+    Loads the planets and ships of the galaxy in NumPy arrays, one per attribute, so
+    the engine phases can operate on whole columns at once instead of iterating
+    over the entities.
+
+    The entities are still the authoritative state of the galaxy. Changes done
+    to the columns, or through the row views, are written back to them with
+    :meth:`commit`. Changes done to the entities are read again with
+    :meth:`EntityTable.refresh`.
+
+    The galaxy keeps a state of all its planets across turns, that is refreshed
+    every time it is requested. See :attr:`Galaxy.state`
+
+    :param galaxy: The galaxy to load
+    :param planets: Planets to load. All the planets in the galaxy by default.
+    :param ships: Ships to load. All the ships in the galaxy by default.
+    :param changes: Set where the loaded planets report their changes (see \
+        :attr:`Galaxy.state`). The changes written by :meth:`commit` are not \
+        kept in it.
+    """
+
+    def __init__(
+        self,
+        galaxy,
+        planets: Iterable[Planet] = None,
+        ships: Iterable[Ship] = None,
+        changes: Set[int] = None,
+    ):
+        self.galaxy = galaxy
+
+        self.changes: Optional[Set[int]] = changes
+        """
+        Ids of the loaded planets that changed outside the state
+        """
+
+        self.planets = PlanetsTable(
+            self,
+            galaxy.planets.values() if planets is None else planets,
+            PLANET_COLUMNS,
+        )
+        """
+        Columns of the loaded planets
+        """
+
+        self.ships = ShipsTable(
+            self, galaxy.ships if ships is None else ships, SHIP_COLUMNS
+        )
+        """
+        Columns of the loaded ships
+        """
+
+    def get_player_handle(self, player: Optional[str]) -> int:
+        """
+        Return the integer handle of the ``player``.
+        See :meth:`Galaxy.get_player_handle`
+        """
+        return self.galaxy.get_player_handle(player)
+
+    def get_player(self, handle: int) -> Optional[str]:
+        """
+        Return the name of the player with the given ``handle``
+        """
+        return self.galaxy.get_player(handle)
+
+    def commit(self):
+        """
+        Write the changes in the columns back to the planets and ships of the galaxy.
+        """
+        self.planets.commit()
+        self.ships.commit()
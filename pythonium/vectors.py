@@ -1,7 +1,9 @@
+import weakref
+
 import attr
 
 
-@attr.s
+@attr.s(slots=True, weakref_slot=False)
 class Transfer:
     """
     Represent the transfer of resources from a ship
@@ -64,7 +66,7 @@ class Transfer:
     """
 
     def __neg__(self):
-        return self.__class__(
+        return Transfer(
             megacredits=-self.megacredits,
             clans=-self.clans,
             pythonium=-self.pythonium,
@@ -77,7 +79,7 @@ class Transfer:
                 "Can not sum Transfer class and {}".format(type(obj))
             )
 
-        return self.__class__(
+        return Transfer(
             megacredits=self.megacredits + obj.megacredits,
             clans=self.clans + obj.clans,
             pythonium=self.pythonium + obj.pythonium,
@@ -92,7 +94,7 @@ class Transfer:
             msg = "Can not apply multiplication to {}".format(type(factor))
             raise ValueError(msg)
 
-        return self.__class__(
+        return Transfer(
             megacredits=self.megacredits * factor,
             clans=self.clans * factor,
             pythonium=self.pythonium * factor,
@@ -104,7 +106,7 @@ class Transfer:
             msg = "Can not apply division to {}".format(type(denom))
             raise ValueError(msg)
 
-        return self.__class__(
+        return Transfer(
             self.megacredits / denom,
             self.clans / denom,
             self.pythonium / denom,
@@ -115,3 +117,54 @@ class Transfer:
 
     def __repr__(self):
         return f"({self.clans}, {self.megacredits}, {self.pythonium})"
+
+
+@attr.s(frozen=True, slots=True, weakref_slot=True, eq=False)
+class FrozenTransfer(Transfer):
+    """
+    A :class:`Transfer` that can not change, like the cost of ships and mines.
+
+    Equal amounts of resources share the same instance while it is in use (see
+    :meth:`intern`), so they are shared instead of copied. They are still
+    compared by value, with any :class:`Transfer`.
+
+    The arithmetic operations return a regular :class:`Transfer`.
+    """
+
+    _interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+    """
+    Frozen transfers in use, indexed by their amounts. Unused ones are dropped.
+    """
+
+    @classmethod
+    def intern(cls, transfer: Transfer) -> "FrozenTransfer":
+        """
+        Return the frozen transfer with the same amounts than ``transfer``
+        """
+        if isinstance(transfer, cls) or not isinstance(transfer, Transfer):
+            return transfer
+        key = (transfer.megacredits, transfer.pythonium, transfer.clans)
+        frozen = cls._interned.get(key)
+        if frozen is None:
+            frozen = cls._interned[key] = cls(*key)
+        return frozen
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Transfer):
+            return NotImplemented
+        return (
+            self.megacredits == other.megacredits
+            and self.pythonium == other.pythonium
+            and self.clans == other.clans
+        )
+
+    def __hash__(self):
+        return hash((self.megacredits, self.pythonium, self.clans))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
@@ -0,0 +1,229 @@
+import copy
+from typing import Any, Dict, FrozenSet, List, Optional
+
+from .core import StellarThing
+from .planet import DERIVED_INPUTS, Planet
+from .ship import Ship
+
+NO_FIELDS: FrozenSet[str] = frozenset()
+
+
+class ViewsJournal:
+    """
+    State shared by the views of one player galaxy: the copies of the values that
+    can be changed in place, and the views written by the player.
+
+    It allows to reuse the views from one turn to the next. See :meth:`reset`.
+    """
+
+    __slots__ = ("copies", "written")
+
+    def __init__(self):
+        self.copies: Dict[int, Any] = {}
+        """
+        ``copy.deepcopy`` memo shared by the views
+        """
+
+        self.written: List["EntityView"] = []
+        """
+        Views with written values
+        """
+
+    def reset(self):
+        """
+        Discard the written values and the copies of all the views, so they show
+        their entities again.
+
+        The cost depends on the amount of written views, not on the amount of views.
+        """
+        for view in self.written:
+            object.__setattr__(view, "_overrides", None)
+            view._forget_derived()
+        self.written.clear()
+        self.copies.clear()
+
+
+class EntityView:
+    """
+    Copy-on-write view of a :class:`StellarThing`, as one player sees it.
+
+    Attributes are read from the entity until they are written. Written values are
+    kept in the view, so the entity never changes. Hidden attributes read as
+    ``None``.
+
+    Values that can be changed in place (see :attr:`mutable_fields`) are copied
+    the first time they are read, so they can not be used to change the entity
+    either. Views that share ``journal`` share those copies too, the same way a
+    single ``copy.deepcopy`` of the galaxy would.
+
+    The view API never writes to the entity, but the entity is kept in the
+    private ``_entity`` slot. Players are trusted to not use it. See
+    :meth:`AbstractPlayer.next_turn`
+
+    :param entity: The entity to view
+    :param hidden: Name of the attributes that the player can not see
+    :param journal: State shared by the views of one galaxy
+    """
+
+    __slots__ = ("_entity", "_hidden", "_overrides", "_journal")
+
+    mutable_fields: FrozenSet[str] = NO_FIELDS
+    """
+    Attributes with values that can be changed in place
+    """
+
+    derived_inputs: FrozenSet[str] = NO_FIELDS
+    """
+    Attributes that the cached derived values of the view depend on
+    """
+
+    def __init__(
+        self,
+        entity: StellarThing,
+        hidden: FrozenSet[str] = NO_FIELDS,
+        journal: Optional[ViewsJournal] = None,
+    ):
+        object.__setattr__(self, "_entity", entity)
+        object.__setattr__(self, "_hidden", hidden)
+        object.__setattr__(self, "_overrides", None)
+        object.__setattr__(
+            self, "_journal", ViewsJournal() if journal is None else journal
+        )
+
+    def __getattr__(self, name):
+        overrides = self._overrides
+        if overrides is not None and name in overrides:
+            return overrides[name]
+        if name in self._hidden:
+            return None
+        value = getattr(self._entity, name)
+        if name in self.mutable_fields:
+            value = copy.deepcopy(value, self._journal.copies)
+            self.__setattr__(name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        overrides = self._overrides
+        if overrides is None:
+            overrides = {}
+            object.__setattr__(self, "_overrides", overrides)
+            self._journal.written.append(self)
+        overrides[name] = value
+        if name in self.derived_inputs:
+            self._forget_derived()
+
+    def _forget_derived(self):
+        """
+        Discard the cached derived values of the view, if it has any
+        """
+
+    def __copy__(self):
+        view = self.__class__(self._entity, self._hidden, self._journal)
+        if self._overrides is not None:
+            object.__setattr__(view, "_overrides", dict(self._overrides))
+            self._journal.written.append(view)
+        return view
+
+    def __deepcopy__(self, memo):
+        # The entity is never changed through the view, so the copy can share it
+        view = self.__class__(self._entity, self._hidden)
+        if self._overrides is not None:
+            object.__setattr__(
+                view, "_overrides", copy.deepcopy(self._overrides, memo)
+            )
+            view._journal.written.append(view)
+        return view
+
+
+def hide(view: EntityView, hidden: FrozenSet[str]):
+    """
+    Change the attributes of the entity that ``view`` does not show.
+    """
+    object.__setattr__(view, "_hidden", hidden)
+    view._forget_derived()
+
+
+class derived_view_property:
+    """
+    Derived property of a :class:`PlanetView`. See :class:`derived_property`.
+
+    The value is computed from the attributes of the view, so hidden and written
+    values are taken into account. It is cached in the view until the planet
+    changes (its own cache is discarded), or an attribute it depends on is
+    written in the view.
+    """
+
+    def __init__(self, derived):
+        self.compute = derived.compute
+        self.name = derived.name
+        self.__doc__ = derived.__doc__
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        entity = view._entity
+        source = entity._derived
+        if source is None:
+            # The planet discards this dict when it changes
+            source = {}
+            object.__setattr__(entity, "_derived", source)
+        derived = view._derived
+        if derived is None or view._derived_source is not source:
+            derived = {}
+            object.__setattr__(view, "_derived", derived)
+            object.__setattr__(view, "_derived_source", source)
+        elif self.name in derived:
+            return derived[self.name]
+        value = derived[self.name] = self.compute(view)
+        return value
+
+
+class PlanetView(EntityView):
+    """
+    Copy-on-write view of a :class:`Planet`.
+
+    Supports the same attributes and methods than :class:`Planet`.
+    """
+
+    __slots__ = ("_derived", "_derived_source")
+
+    derived_inputs = DERIVED_INPUTS
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        object.__setattr__(self, "_derived", None)
+        object.__setattr__(self, "_derived_source", None)
+
+    def _forget_derived(self):
+        object.__setattr__(self, "_derived", None)
+
+    max_mines = derived_view_property(Planet.max_mines)
+    rioting_index = derived_view_property(Planet.rioting_index)
+    dpythonium = derived_view_property(Planet.dpythonium)
+    dmegacredits = derived_view_property(Planet.dmegacredits)
+    dhappypoints = derived_view_property(Planet.dhappypoints)
+    dclans = derived_view_property(Planet.dclans)
+    _buildable_mines = derived_view_property(Planet._buildable_mines)
+    get_orders = Planet.get_orders
+    can_build_mines = Planet.can_build_mines
+    can_build_ship = Planet.can_build_ship
+    move = Planet.move
+    __str__ = Planet.__str__
+    __repr__ = Planet.__repr__
+
+
+class ShipView(EntityView):
+    """
+    Copy-on-write view of a :class:`Ship`.
+
+    Supports the same attributes and methods than :class:`Ship`.
+    """
+
+    __slots__ = ()
+
+    mutable_fields = frozenset(("transfer",))
+
+    get_orders = Ship.get_orders
+    move = Ship.move
+    __str__ = Ship.__str__
+    __repr__ = Ship.__repr__
@@ -1,6 +1,5 @@
 import math
 import random
-import uuid
 
 import pytest
 
@@ -129,8 +128,8 @@ def random_position(galaxy_size):
 
 
 @pytest.fixture
-def fake_id():
-    return uuid.uuid4()
+def fake_id(galaxy):
+    return len(galaxy.stellar_things) + 1
 
 
 @pytest.fixture
@@ -39,7 +39,7 @@ class SandboxGameMode(GameMode):
         galaxy = Galaxy(name=name, size=map_size, things=things)
 
         homeworld = galaxy.planets[(10, 10)]
-        homeworld.player = player.name
+        galaxy.set_planet_player(homeworld, player.name)
         homeworld.clans = 1000
         homeworld.pythonium = 1000
         homeworld.megacredits = 1000
@@ -0,0 +1,103 @@
+import copy
+
+import pytest
+
+from pythonium import cfg
+from pythonium.orders import events
+from pythonium.orders.galaxy import ProduceResources
+
+
+@pytest.fixture
+def summary_mode(monkeypatch):
+    monkeypatch.setattr(cfg, "events_granularity", events.SUMMARY)
+
+
+@pytest.fixture
+def events_logger(mocker):
+    return mocker.patch.object(events, "logger")
+
+
+class TestEventsSummary:
+    @pytest.fixture
+    def summary(self):
+        return events.EventsSummary()
+
+    def test_aggregate_values(self, summary, events_logger, faker):
+        player = faker.word()
+        values = [faker.pyint() for _ in range(10)]
+        for value in values:
+            summary.add("Event", 1, player, {"value": value})
+        summary.flush()
+        events_logger.info.assert_called_once_with(
+            "Event",
+            extra={
+                "turn": 1,
+                "player": player,
+                "count": len(values),
+                "value_total": sum(values),
+                "value_min": min(values),
+                "value_max": max(values),
+            },
+        )
+
+    def test_one_summary_per_turn_and_player(
+        self, summary, events_logger, expected_players
+    ):
+        for turn in range(3):
+            for player in expected_players:
+                summary.add("Event", turn, player, {})
+                summary.add("Event", turn, player, {})
+        assert len(summary) == 3 * len(expected_players)
+        summary.flush()
+        assert events_logger.info.call_count == 3 * len(expected_players)
+        assert not len(summary)
+
+
+class TestLogEvent:
+    def test_entity_event(self, events_logger):
+        events.log_event("Event", extra={"turn": 1, "value": 2})
+        events_logger.info.assert_called_once_with(
+            "Event", extra={"turn": 1, "value": 2}
+        )
+
+    def test_summary_event(self, summary_mode, events_logger, mocker):
+        summary = mocker.patch.object(events, "summary")
+        events.log_event(
+            "Event",
+            extra={"turn": 1, "player": "a", "ship": 3, "value": 2},
+            values=("value",),
+        )
+        assert not events_logger.info.called
+        summary.add.assert_called_once_with("Event", 1, "a", {"value": 2})
+
+
+class TestProduceResourcesSummary:
+    @pytest.fixture
+    def expected_totals(self, galaxy):
+        totals = {}
+        for planet in copy.deepcopy(galaxy).get_ocuped_planets():
+            dhappypoints = planet.dhappypoints
+            planet.happypoints += dhappypoints
+            changes = {
+                "dhappypoints": dhappypoints,
+                "dmegacredits": planet.dmegacredits,
+            }
+            for name, change in changes.items():
+                if change:
+                    key = (planet.player, name)
+                    totals[key] = totals.get(key, 0) + change
+        return totals
+
+    def test_summary_totals(
+        self, summary_mode, galaxy, expected_totals, mocker
+    ):
+        summary = mocker.patch.object(events, "summary")
+        ProduceResources(galaxy=galaxy).execute()
+        totals = {}
+        for call in summary.add_aggregates.call_args_list:
+            _, turn, player, _ = call.args
+            assert turn == galaxy.turn
+            for name, total in call.kwargs["totals"].items():
+                totals[(player, name)] = total
+        for key, total in expected_totals.items():
+            assert totals[key] == total
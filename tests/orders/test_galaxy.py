@@ -1,36 +1,80 @@
+import copy
 import random
 
+import numpy as np
 import pytest
 
 from pythonium.orders.galaxy import (
     ProduceResources,
     ResolvePlanetsConflicts,
     ResolveShipsConflicts,
+    fast_forward,
+    produce_resources,
+)
+from pythonium.state import PLANET_COLUMNS, GalaxyState
+from tests.factories import (
+    GalaxyFactory,
+    PlanetFactory,
+    ShipFactory,
+    fake_positions,
 )
 
 
-class TestProduceResources:
-    @pytest.fixture()
-    def player_planets_count(self, galaxy, faker):
-        return len(list(galaxy.get_ocuped_planets()))
+def produce_planet_resources(planet):
+    """
+    Apply one turn of production to a single planet with the :class:`Planet`
+    properties. Reference implementation of :func:`produce_resources`.
+    """
+    planet.happypoints += planet.dhappypoints
+    planet.megacredits += planet.dmegacredits
+    planet.pythonium += planet.dpythonium
+    planet.clans += planet.dclans
+
 
+class TestProduceResources:
     @pytest.fixture()
     def order(self, galaxy):
         return ProduceResources(galaxy=galaxy)
 
-    def test_produce_in_occuped_planets(
-        self, order, mocker, galaxy, player_planets_count
-    ):
-        spy = mocker.spy(order, "_produce_resources")
+    def test_produce_in_occuped_planets(self, order, galaxy):
+        expected_galaxy = copy.deepcopy(galaxy)
+        for planet in expected_galaxy.get_ocuped_planets():
+            produce_planet_resources(planet)
         order.execute()
-        assert spy.call_count == player_planets_count
+        assert list(galaxy.planets.values()) == list(
+            expected_galaxy.planets.values()
+        )
+
+    def test_vectorized_production(self, order, faker):
+        planets = [
+            PlanetFactory(
+                position=(0, 0),
+                clans=faker.pyint(min_value=0, max_value=12000),
+                mines=faker.pyint(min_value=0, max_value=500),
+                taxes=faker.pyint(min_value=0, max_value=100),
+                pythonium=faker.pyint(min_value=0, max_value=1000),
+            )
+            for _ in range(500)
+        ]
+        for planet in planets:
+            planet.happypoints = faker.pyint(min_value=0, max_value=100)
+        state = GalaxyState(order.galaxy, planets=copy.deepcopy(planets))
+        columns = state.planets.columns
+        deltas = produce_resources(columns)
+        for planet in planets:
+            produce_planet_resources(planet)
+        for name in PLANET_COLUMNS:
+            assert columns[name].tolist() == [
+                getattr(p, name) for p in planets
+            ]
+        assert all(d.dtype == np.int64 for d in deltas.values())
 
     def test_produce_happypoints(
         self, order, colonized_planet, happypoints_tolerance
     ):
         dhappypoints = colonized_planet.dhappypoints
         happypoints = colonized_planet.happypoints
-        order._produce_resources(colonized_planet)
+        order.execute()
         assert colonized_planet.happypoints == happypoints + dhappypoints
         assert colonized_planet.happypoints > happypoints_tolerance
 
@@ -39,7 +83,7 @@ class TestProduceResources:
     ):
         dmegacredits = colonized_planet.dmegacredits
         megacredits = colonized_planet.megacredits
-        order._produce_resources(colonized_planet)
+        order.execute()
         assert colonized_planet.megacredits == megacredits + dmegacredits
         assert colonized_planet.happypoints > happypoints_tolerance
 
@@ -48,7 +92,7 @@ class TestProduceResources:
     ):
         dpythonium = colonized_planet.dpythonium
         pythonium = colonized_planet.pythonium
-        order._produce_resources(colonized_planet)
+        order.execute()
         assert colonized_planet.pythonium == pythonium + dpythonium
         assert colonized_planet.happypoints > happypoints_tolerance
 
@@ -57,11 +101,53 @@ class TestProduceResources:
     ):
         dclans = colonized_planet.dclans
         clans = colonized_planet.clans
-        order._produce_resources(colonized_planet)
+        order.execute()
         assert colonized_planet.clans == clans + dclans
         assert colonized_planet.happypoints > happypoints_tolerance
 
 
+class TestFastForward:
+    @pytest.fixture
+    def economy_galaxy(self, galaxy, faker):
+        for planet in galaxy.planets.values():
+            planet.clans = faker.pyint(min_value=0, max_value=12000)
+            planet.mines = faker.pyint(min_value=0, max_value=500)
+            planet.taxes = faker.pyint(min_value=0, max_value=100)
+            planet.happypoints = faker.pyint(min_value=0, max_value=100)
+        return galaxy
+
+    @pytest.fixture
+    def turns(self, faker):
+        return faker.pyint(min_value=1, max_value=150)
+
+    def test_as_produce_resources(self, economy_galaxy, turns):
+        expected_galaxy = copy.deepcopy(economy_galaxy)
+        for _ in range(turns):
+            ProduceResources(expected_galaxy).execute()
+        fast_forward(economy_galaxy, turns)
+        assert economy_galaxy.planets == expected_galaxy.planets
+
+    def test_total_deltas(self, economy_galaxy, turns):
+        planets = list(economy_galaxy.get_ocuped_planets())
+        clans = [p.clans for p in planets]
+        deltas = fast_forward(economy_galaxy, turns, planets=planets)
+        assert [p.clans for p in planets] == [
+            c + d for c, d in zip(clans, deltas["dclans"].tolist())
+        ]
+
+    def test_only_given_planets(self, economy_galaxy, turns):
+        planets = list(economy_galaxy.get_ocuped_planets())
+        expected_planets = copy.deepcopy(planets[1:])
+        fast_forward(economy_galaxy, turns, planets=planets[:1])
+        assert planets[1:] == expected_planets
+
+    def test_planet_not_in_galaxy(self, economy_galaxy, turns):
+        planet = PlanetFactory(position=(0, 0))
+        planet.id = 10**9
+        with pytest.raises(ValueError):
+            fast_forward(economy_galaxy, turns, planets=[planet])
+
+
 class TestResolveShipsConflicts:
     @pytest.fixture()
     def winner_ships(self, ships_in_conflict, winner):
@@ -112,6 +198,52 @@ class TestResolveShipsConflicts:
         assert all(s in ships_in_conflict_galaxy.ships for s in winner_ships)
 
 
+class TestDrawScores:
+    @pytest.fixture
+    def conflicts_galaxy(self, expected_players, galaxy_size, faker):
+        ships = []
+        for position in fake_positions(galaxy_size, 3):
+            for player in expected_players:
+                ships.append(
+                    ShipFactory(
+                        position=position,
+                        player=player,
+                        attack=faker.pyint(min_value=1),
+                    )
+                )
+        return GalaxyFactory(size=galaxy_size, things=ships)
+
+    def test_scores_of_the_turn(self, conflicts_galaxy, tenacity, faker):
+        seed = faker.pyint()
+        ships_in_conflict = list(
+            conflicts_galaxy.get_ships_conflicts_attacks()
+        )
+        order = ResolveShipsConflicts(
+            conflicts_galaxy, tenacity, rng=np.random.default_rng(seed)
+        )
+        shapes = [
+            [
+                100 * (attack / sum(attacks.values()))
+                for attack in attacks.values()
+            ]
+            for _, attacks in ships_in_conflict
+        ]
+        expected_scores = np.random.default_rng(seed).normal(shapes, tenacity)
+        scores = order._draw_scores(ships_in_conflict)
+        assert scores == expected_scores.tolist()
+
+    def test_same_seed_same_combats(self, conflicts_galaxy, tenacity, faker):
+        seed = faker.pyint()
+        explosions = []
+        for _ in range(2):
+            galaxy = copy.deepcopy(conflicts_galaxy)
+            ResolveShipsConflicts(
+                galaxy, tenacity, rng=np.random.default_rng(seed)
+            ).execute()
+            explosions.append([e.ship.id for e in galaxy.explosions])
+        assert explosions[0] == explosions[1]
+
+
 class TestResolvePlanetsConflicts:
     @pytest.fixture()
     def winner(self, planet_conflict_galaxy):
@@ -140,6 +272,9 @@ class TestResolvePlanetsConflicts:
             conquered_planet_id
         )
         assert conquered_planet.player == winner
+        assert conquered_planet in planet_conflict_galaxy.get_player_planets(
+            winner
+        )
 
     def test_conquered_planet_state(
         self, planet_conflict_galaxy, conquered_planet_id
@@ -1,4 +1,6 @@
+import copy
 import random
+from types import SimpleNamespace
 
 import pytest
 from mockito import verify
@@ -7,7 +9,9 @@ from pythonium import Galaxy, cfg
 from pythonium.orders.planet import (
     PlanetBuildMinesOrder,
     PlanetBuildShipOrder,
+    PlanetsBuildMinesOrder,
     PlanetSetTaxesOrder,
+    PlanetsSetTaxesOrder,
 )
 from tests.factories import (
     PlanetFactory,
@@ -189,3 +193,119 @@ class TestPlanetSetTaxesOrder:
         order = PlanetSetTaxesOrder(planet=self.planet, taxes=new_taxes)
         order.execute(galaxy)
         assert self.planet.taxes == 100
+
+
+def run_one_by_one(galaxy, order_class, orders):
+    """
+    Run the ``orders`` one by one, as the game does with the orders of the
+    players, and skip the ones for other players planets.
+    """
+    for player, (pid, value) in orders:
+        planet = galaxy.search_planet(pid)
+        if planet is None or planet.player != player.name:
+            continue
+        try:
+            order_class(planet, value).execute(galaxy)
+        except ZeroDivisionError:
+            pass
+
+
+class TestPlanetsOrders:
+    @pytest.fixture
+    def players(self, expected_players):
+        return [SimpleNamespace(name=name) for name in expected_players]
+
+    @pytest.fixture
+    def orders_galaxy(self, galaxy, faker):
+        for planet in galaxy.planets.values():
+            planet.clans = faker.pyint(max_value=cfg.planet_max_mines * 2)
+            planet.megacredits = faker.pyint(max_value=1000)
+            planet.taxes = faker.pyint(max_value=100)
+        return galaxy
+
+    @pytest.fixture
+    def make_orders(self, orders_galaxy, players, faker):
+        def make_orders(value):
+            orders = []
+            for planet in orders_galaxy.planets.values():
+                orders.append((random.choice(players), (planet.id, value())))
+            # Some planets receive more than one order
+            orders += random.sample(orders, len(orders) // 2)
+            random.shuffle(orders)
+            return orders
+
+        return make_orders
+
+    def assert_as_one_by_one(self, galaxy, order_class, batch_class, orders):
+        expected_galaxy = copy.deepcopy(galaxy)
+        run_one_by_one(expected_galaxy, order_class, orders)
+
+        order = batch_class(galaxy, orders)
+        order.execute()
+        run_one_by_one(galaxy, order_class, order.pending)
+        assert galaxy.planets == expected_galaxy.planets
+
+    def test_set_taxes_as_one_by_one(self, orders_galaxy, make_orders, faker):
+        orders = make_orders(lambda: faker.pyint(min_value=-50, max_value=150))
+        self.assert_as_one_by_one(
+            orders_galaxy, PlanetSetTaxesOrder, PlanetsSetTaxesOrder, orders
+        )
+
+    def test_build_mines_as_one_by_one(
+        self, orders_galaxy, make_orders, faker
+    ):
+        orders = make_orders(lambda: faker.pyint(max_value=100))
+        self.assert_as_one_by_one(
+            orders_galaxy,
+            PlanetBuildMinesOrder,
+            PlanetsBuildMinesOrder,
+            orders,
+        )
+
+    @pytest.mark.parametrize(
+        "order_class, batch_class",
+        (
+            (PlanetSetTaxesOrder, PlanetsSetTaxesOrder),
+            (PlanetBuildMinesOrder, PlanetsBuildMinesOrder),
+        ),
+    )
+    def test_huge_values_as_one_by_one(
+        self, orders_galaxy, make_orders, order_class, batch_class
+    ):
+        orders = make_orders(lambda: random.choice((10**20, -(10**20))))
+        order = batch_class(copy.deepcopy(orders_galaxy), orders)
+        order.execute()
+        assert order.pending == orders
+        self.assert_as_one_by_one(
+            orders_galaxy, order_class, batch_class, orders
+        )
+
+    def test_pending_orders(self, orders_galaxy, players, faker):
+        planet = next(iter(orders_galaxy.planets.values()))
+        owner = next((p for p in players if p.name == planet.player), None)
+        stranger = SimpleNamespace(name=faker.uuid4())
+        orders = [
+            (stranger, (planet.id, 10)),
+            (players[0], (planet.id, 10.5)),
+            (players[0], (-1, 10)),
+            (players[0], (planet.id, 10, 20)),
+        ]
+        if owner is not None:
+            # The first order of the owner runs in batch
+            orders.insert(0, (owner, (planet.id, 20)))
+        order = PlanetsSetTaxesOrder(orders_galaxy, orders)
+        order.execute()
+        assert order.pending == orders[-4:]
+
+    def test_free_mines_are_pending(self, galaxy, players):
+        player = players[0]
+        planet = PlanetFactory(
+            player=player.name,
+            clans=10,
+            mine_cost=PositiveTransferVectorFactory(pythonium=0),
+        )
+        galaxy = Galaxy(name="test", size=galaxy.size, things=[planet])
+        orders = [(player, (planet.id, 1))]
+        order = PlanetsBuildMinesOrder(galaxy, orders)
+        order.execute()
+        assert order.pending == orders
@@ -1,8 +1,31 @@
+import copy
+import random
+
 import numpy as np
 import pytest
 
 from pythonium.core import Position
-from pythonium.orders.ship import ShipMoveOrder
+from pythonium.orders.ship import (
+    ShipMoveOrder,
+    ShipsMoveOrder,
+    ShipsTransferOrder,
+    ShipTransferOrder,
+    compute_moves,
+)
+from pythonium.vectors import Transfer
+from tests.factories import (
+    GalaxyFactory,
+    PlanetFactory,
+    ShipFactory,
+    fake_positions,
+)
+
+
+def ships_ids_by_position(galaxy):
+    return {
+        position: [s.id for s in ships]
+        for position, ships in galaxy.get_ships_by_position().items()
+    }
 
 
 class TestShipMoveOrder:
@@ -46,6 +69,7 @@ class TestShipMoveOrder:
         order.execute(galaxy)
         assert random_ship.position == short_target
         assert random_ship.target is None
+        assert random_ship in galaxy.get_ships_in_position(short_target)
 
     def test_ship_long_move_order(
         self, galaxy, random_ship, long_target, long_movement_expected_stop
@@ -53,4 +77,188 @@ class TestShipMoveOrder:
         order = ShipMoveOrder(ship=random_ship, target=long_target)
         order.execute(galaxy)
         assert random_ship.target == long_target
-        assert np.all(np.isclose(random_ship.position, long_movement_expected_stop, atol=1))
+        assert np.all(
+            np.isclose(
+                random_ship.position, long_movement_expected_stop, atol=1
+            )
+        )
+
+
+class TestShipsMoveOrder:
+    @pytest.fixture
+    def moves(self, galaxy, galaxy_size, faker):
+        moves = []
+        for ship in galaxy.ships:
+            if faker.pybool():
+                # Short move
+                delta = (
+                    faker.pyint(min_value=-ship.speed, max_value=ship.speed)
+                    // 2
+                )
+                target = (ship.position[0] + delta, ship.position[1] - delta)
+            else:
+                target = (
+                    faker.pyint(max_value=galaxy_size[0]),
+                    faker.pyint(max_value=galaxy_size[1]),
+                )
+            moves.append((ship, target))
+        return moves
+
+    @pytest.fixture
+    def expected_galaxy(self, galaxy, moves):
+        expected_galaxy = copy.deepcopy(galaxy)
+        for ship, target in moves:
+            ShipMoveOrder(
+                ship=expected_galaxy.search_ship(ship.id), target=target
+            ).execute(expected_galaxy)
+        return expected_galaxy
+
+    def test_batch_moves_as_sequential_moves(
+        self, galaxy, moves, expected_galaxy
+    ):
+        order = ShipsMoveOrder(galaxy=galaxy, moves=moves)
+        order.execute()
+        assert not order.pending
+        assert galaxy.ships == expected_galaxy.ships
+        assert ships_ids_by_position(galaxy) == ships_ids_by_position(
+            expected_galaxy
+        )
+
+    def test_repeated_ship_is_pending(self, galaxy, random_ship, faker):
+        moves = [
+            (random_ship, (faker.pyint(), faker.pyint())),
+            (random_ship, (faker.pyint(), faker.pyint())),
+        ]
+        order = ShipsMoveOrder(galaxy=galaxy, moves=moves)
+        order.execute()
+        assert order.pending == moves[1:]
+
+    def test_not_integer_target_is_pending(self, galaxy, random_ship, faker):
+        moves = [(random_ship, (faker.pyfloat(), faker.pyfloat()))]
+        order = ShipsMoveOrder(galaxy=galaxy, moves=moves)
+        order.execute()
+        assert order.pending == moves
+
+    def test_huge_target_is_pending(self, galaxy, random_ship):
+        moves = [(random_ship, (10**20, 0))]
+        order = ShipsMoveOrder(galaxy=galaxy, moves=moves)
+        order.execute()
+        assert order.pending == moves
+
+    def test_compute_moves(self, faker):
+        positions = np.array([(0, 0), (10, 10)])
+        targets = np.array([(3, 4), (110, 10)])
+        speeds = np.array([5, 50])
+        new_positions, arrived = compute_moves(positions, targets, speeds)
+        assert new_positions.tolist() == [[3, 4], [60, 10]]
+        assert arrived.tolist() == [True, False]
+
+
+class TestShipsTransferOrder:
+    @pytest.fixture
+    def transfers_galaxy(self, faker, planets, expected_players, galaxy_size):
+        ships = []
+        for planet in planets:
+            if planet.player is not None:
+                planet.clans = faker.pyint(min_value=1, max_value=100)
+            planet.megacredits = faker.pyint(max_value=100)
+            # A few ships of the owner, and some enemies, in each planet
+            for _ in range(faker.pyint(min_value=1, max_value=4)):
+                ship = ShipFactory(
+                    position=planet.position,
+                    player=planet.player or random.choice(expected_players),
+                    max_cargo=faker.pyint(max_value=200),
+                    max_mc=faker.pyint(max_value=200),
+                )
+                ship.clans = faker.pyint(max_value=ship.max_cargo)
+                ships.append(ship)
+            ships.append(
+                ShipFactory(position=planet.position, player=faker.uuid4())
+            )
+        return GalaxyFactory(size=galaxy_size, things=planets + ships)
+
+    @pytest.fixture
+    def transfers(self, transfers_galaxy, faker):
+        def amount():
+            return faker.pyint(min_value=-150, max_value=150)
+
+        ships = list(transfers_galaxy.ships)
+        # Some ships transfer more than once
+        ships += random.sample(ships, len(ships) // 2)
+        random.shuffle(ships)
+        return [
+            (
+                ship,
+                Transfer(
+                    clans=amount(), pythonium=amount(), megacredits=amount()
+                ),
+            )
+            for ship in ships
+        ]
+
+    @pytest.fixture
+    def expected_galaxy(self, transfers_galaxy, transfers):
+        expected_galaxy = copy.deepcopy(transfers_galaxy)
+        for ship, transfer in transfers:
+            ShipTransferOrder(
+                ship=expected_galaxy.search_ship(ship.id),
+                transfer=copy.copy(transfer),
+            ).execute(expected_galaxy)
+        return expected_galaxy
+
+    def test_batch_transfers_as_sequential_transfers(
+        self, transfers_galaxy, transfers, expected_galaxy, expected_players
+    ):
+        order = ShipsTransferOrder(
+            galaxy=transfers_galaxy, transfers=transfers
+        )
+        order.execute()
+        assert not order.pending
+        assert transfers_galaxy.ships == expected_galaxy.ships
+        assert transfers_galaxy.planets == expected_galaxy.planets
+        for player in expected_players:
+            assert {
+                p.id for p in transfers_galaxy.get_player_planets(player)
+            } == {p.id for p in expected_galaxy.get_player_planets(player)}
+
+    def test_planet_abandoned(self, galaxy_size, faker):
+        player = faker.word()
+        position = next(fake_positions(galaxy_size))
+        ship = ShipFactory(position=position, player=player, max_cargo=100)
+        planet = PlanetFactory(position=position, player=player, clans=10)
+        galaxy = GalaxyFactory(size=galaxy_size, things=[planet, ship])
+        transfers = [
+            (ship, Transfer(clans=5)),
+            (ship, Transfer(clans=20)),
+        ]
+        ShipsTransferOrder(galaxy=galaxy, transfers=transfers).execute()
+        assert [t.clans for _, t in transfers] == [5, 5]
+        assert ship.clans == 10
+        assert not planet.clans
+        assert planet.player is None
+        assert not list(galaxy.get_player_planets(player))
+
+    def test_deep_space_transfer_is_pending(self, galaxy, faker):
+        ship = ShipFactory(position=(-1, -1), player=faker.word())
+        galaxy.add_ship(ship)
+        transfers = [(ship, Transfer(clans=faker.pyint()))]
+        order = ShipsTransferOrder(galaxy=galaxy, transfers=transfers)
+        order.execute()
+        assert order.pending == transfers
+
+    def test_not_integer_transfer_is_pending(
+        self, transfers_galaxy, transfers, faker
+    ):
+        ship, _ = transfers[0]
+        in_planet = [
+            (s, t) for s, t in transfers if s.position == ship.position
+        ]
+        transfer = Transfer()
+        # The converters only run when the transfer is created
+        transfer.clans = faker.pyfloat()
+        transfers.append((ship, transfer))
+        order = ShipsTransferOrder(
+            galaxy=transfers_galaxy, transfers=transfers
+        )
+        order.execute()
+        assert order.pending == in_planet + transfers[-1:]
@@ -1,9 +1,12 @@
 import math
 import random
+from collections import Counter
 
+import numpy as np
 import pytest
 
 from pythonium import Galaxy
+from pythonium.galaxy import NO_PLAYER, group_ships
 from tests.factories import ExplosionFactory, ShipFactory, fake_positions
 
 
@@ -33,7 +36,20 @@ class TestGalaxyBasics:
             assert galaxy.planets[planet.position] is planet
 
     def test_ship_index(self, ships, galaxy):
-        assert galaxy.ships == ships
+        assert list(galaxy.ships) == ships
+
+    def test_containers_are_read_only(self, galaxy, random_planet):
+        with pytest.raises(TypeError):
+            galaxy.planets[random_planet.position] = None
+        with pytest.raises(AttributeError):
+            galaxy.ships.append(galaxy.ships[0])
+
+    def test_ships_updated(self, galaxy, ships):
+        removed = galaxy.ships[0]
+        galaxy.remove_ships({removed.id})
+        assert removed not in galaxy.ships
+        galaxy.add_ship(removed)
+        assert galaxy.ships[-1] is removed
 
     def test_compute_distance(
         self,
@@ -53,16 +69,13 @@ class TestGalaxyBasics:
 
 class TestDistancesToPlanets:
     @pytest.fixture
-    def expected_distances(self, faker, when, random_position, planets):
-        expected_distances = {}
-        for planet in planets:
-            random_distance = faker.pyint(min_value=0)
-            when(Galaxy).compute_distance(
-                planet.position,
-                random_position,
-            ).thenReturn(random_distance)
-            expected_distances[planet.position] = random_distance
-        return expected_distances
+    def expected_distances(self, random_position, planets):
+        return {
+            planet.position: Galaxy.compute_distance(
+                planet.position, random_position
+            )
+            for planet in planets
+        }
 
     def test_distances_to_planets(
         self, expected_distances, random_position, galaxy
@@ -72,6 +85,36 @@ class TestDistancesToPlanets:
         )
 
 
+class TestDistancesMatrix:
+    @pytest.fixture
+    def points(self, galaxy_size):
+        return list(fake_positions(galaxy_size, 5))
+
+    def test_planets_positions(self, galaxy):
+        assert galaxy.planets_positions.shape == (len(galaxy.planets), 2)
+        for planet, position in zip(
+            galaxy.planets_by_index, galaxy.planets_positions.tolist()
+        ):
+            assert planet.position == tuple(position)
+
+    def test_distances_matrix(self, galaxy, points):
+        distances = galaxy.distances_matrix(points)
+        assert distances.shape == (len(points), len(galaxy.planets))
+        for i, point in enumerate(points):
+            for j, planet in enumerate(galaxy.planets_by_index):
+                assert distances[i, j] == galaxy.compute_distance(
+                    point, planet.position
+                )
+
+    def test_compute_distances(self, points, random_position):
+        distances = Galaxy.compute_distances(points, [random_position])
+        assert distances.shape == (len(points), 1)
+        for i, point in enumerate(points):
+            assert distances[i, 0] == Galaxy.compute_distance(
+                point, random_position
+            )
+
+
 class TestNearbyPlanets:
     @pytest.fixture
     def speed(self, faker):
@@ -88,6 +131,24 @@ class TestNearbyPlanets:
                 <= turns * speed
             )
 
+    @pytest.mark.parametrize("turns", list(range(1, 6)))
+    def test_all_nearby_planets(self, galaxy, random_position, turns, speed):
+        expected_planets = [
+            planet
+            for planet in galaxy.planets.values()
+            if galaxy.compute_distance(planet.position, random_position)
+            <= turns * speed
+        ]
+        nearby_planets = galaxy.nearby_planets(
+            point=random_position, neighborhood=turns * speed
+        )
+        assert nearby_planets == expected_planets
+
+    def test_no_nearby_planets(self, galaxy, random_position):
+        assert not galaxy.nearby_planets(
+            point=random_position, neighborhood=-1
+        )
+
 
 class TestGetPlayerPlanets:
     @pytest.fixture
@@ -102,6 +163,33 @@ class TestGetPlayerPlanets:
     def test_get_player_planets_fake_player(self, galaxy, faker):
         assert not list(galaxy.get_player_planets(faker.word()))
 
+    def test_count_player_planets(
+        self, galaxy, expected_planets, random_player
+    ):
+        assert galaxy.count_player_planets(random_player) == len(
+            expected_planets
+        )
+
+
+class TestSetPlanetPlayer:
+    @pytest.fixture
+    def new_player(self, faker):
+        return faker.uuid4()
+
+    def test_set_planet_player(self, galaxy, random_planet, new_player):
+        old_player = random_planet.player
+        galaxy.set_planet_player(random_planet, new_player)
+        assert random_planet.player == new_player
+        assert list(galaxy.get_player_planets(new_player)) == [random_planet]
+        assert random_planet not in galaxy.get_player_planets(old_player)
+        assert random_planet in galaxy.get_ocuped_planets()
+        assert new_player in galaxy.known_races
+
+    def test_abandon_planet(self, galaxy, random_planet):
+        galaxy.set_planet_player(random_planet, None)
+        assert random_planet.player is None
+        assert random_planet not in galaxy.get_ocuped_planets()
+
 
 class TestSearchPlanet:
     def test_search_planet(self, galaxy, random_planet):
@@ -110,6 +198,9 @@ class TestSearchPlanet:
     def test_planet_not_found(self, galaxy, fake_id):
         assert galaxy.search_planet(fake_id) is None
 
+    def test_unhashable_id(self, galaxy, random_planet):
+        assert galaxy.search_planet([random_planet.id]) is None
+
 
 class TestOcupedPlanets:
     @pytest.fixture
@@ -133,6 +224,116 @@ class TestAddShip:
         galaxy.add_ship(new_ship)
         assert new_ship in galaxy.ships
 
+    def test_add_ship_to_stellar_things(self, galaxy, new_ship):
+        assert new_ship not in galaxy.stellar_things
+        galaxy.add_ship(new_ship)
+        assert new_ship in galaxy.stellar_things
+
+    def test_add_ship_assigns_id(self, galaxy, new_ship):
+        expected_id = len(galaxy.stellar_things)
+        galaxy.add_ship(new_ship)
+        assert new_ship.id == expected_id
+
+
+class TestIds:
+    def test_dense_ids(self, galaxy):
+        ids = sorted(t.id for t in galaxy.stellar_things)
+        assert ids == list(range(len(galaxy.stellar_things)))
+
+    def test_keep_assigned_ids(self, galaxy, galaxy_size):
+        copy = Galaxy(
+            name=galaxy.name, size=galaxy_size, things=galaxy.ships[::2]
+        )
+        assert [s.id for s in copy.ships] == [s.id for s in galaxy.ships[::2]]
+        ship = ShipFactory(position=galaxy.ships[0].position)
+        copy.add_ship(ship)
+        assert ship.id == max(s.id for s in galaxy.ships[::2]) + 1
+
+    def test_uuid_label(self, random_ship):
+        assert random_ship.uuid == random_ship.uuid
+
+
+class TestPlayerHandles:
+    def test_known_players_handles(self, galaxy):
+        handles = [galaxy.get_player_handle(p) for p in galaxy.known_races]
+        assert sorted(handles) == list(range(len(galaxy.players)))
+
+    def test_get_player(self, galaxy, random_player):
+        handle = galaxy.get_player_handle(random_player)
+        assert galaxy.get_player(handle) == random_player
+
+    def test_no_player(self, galaxy):
+        assert galaxy.get_player_handle(None) == NO_PLAYER
+        assert galaxy.get_player(NO_PLAYER) is None
+
+    def test_new_player(self, galaxy, faker):
+        player = faker.uuid4()
+        handle = galaxy.get_player_handle(player)
+        assert handle == len(galaxy.players) - 1
+        assert galaxy.get_player_handle(player) == handle
+
+
+class TestGeneration:
+    def test_add_ship(self, galaxy, random_position):
+        generation = galaxy.generation
+        galaxy.add_ship(ShipFactory(position=random_position))
+        assert galaxy.generation > generation
+
+    def test_move_ship(self, galaxy, random_ship, random_position):
+        generation = galaxy.generation
+        galaxy.move_ship(random_ship, random_position)
+        assert galaxy.generation > generation
+
+    def test_set_planet_player(self, galaxy, random_planet):
+        generation = galaxy.generation
+        galaxy.set_planet_player(random_planet, None)
+        assert galaxy.generation > generation
+
+    def test_remove_destroyed_ships(self, galaxy, random_ship):
+        generation = galaxy.generation
+        galaxy.explosions = [ExplosionFactory(ship=random_ship)]
+        galaxy.remove_destroyed_ships()
+        assert galaxy.generation > generation
+
+    def test_queries_do_not_mutate(self, galaxy, random_player):
+        generation = galaxy.generation
+        list(galaxy.get_player_ships(random_player))
+        galaxy.get_ships_by_position()
+        galaxy.stellar_things
+        assert galaxy.generation == generation
+
+
+class TestTrackChanges:
+    def test_add_ship(self, galaxy, random_position):
+        changes = galaxy.track_changes()
+        galaxy.add_ship(ShipFactory(position=random_position))
+        assert changes == {random_position}
+
+    def test_move_ships(self, galaxy, random_ship, random_position):
+        old_position = random_ship.position
+        changes = galaxy.track_changes()
+        galaxy.move_ships([random_ship], [random_position])
+        assert changes == {old_position, random_position}
+
+    def test_set_planet_player(self, galaxy, random_planet):
+        changes = galaxy.track_changes()
+        galaxy.set_planet_player(random_planet, None)
+        assert changes == {random_planet.position}
+
+    def test_remove_ships(self, galaxy, random_ship):
+        changes = galaxy.track_changes()
+        galaxy.remove_ships({random_ship.id})
+        assert changes == {random_ship.position}
+        assert galaxy.search_ship(random_ship.id) is None
+
+    def test_each_tracker_has_its_changes(self, galaxy, random_planet):
+        changes = galaxy.track_changes()
+        galaxy.set_planet_player(random_planet, None)
+        other_changes = galaxy.track_changes()
+        changes.clear()
+        galaxy.set_planet_player(random_planet, None)
+        assert changes == other_changes == {random_planet.position}
+
 
 class TestGetPlayerShips:
     @pytest.fixture
@@ -145,6 +346,39 @@ class TestGetPlayerShips:
     def test_get_player_ships_fake_player(self, galaxy, faker):
         assert not list(galaxy.get_player_ships(faker.word()))
 
+    def test_count_player_ships(self, galaxy, expected_ships, random_player):
+        assert galaxy.count_player_ships(random_player) == len(expected_ships)
+
+    def test_destroyed_ship_is_not_owned(self, galaxy, random_ship):
+        galaxy.explosions = [ExplosionFactory(ship=random_ship)]
+        galaxy.remove_destroyed_ships()
+        assert random_ship not in galaxy.get_player_ships(random_ship.player)
+
+    def test_count_player_ships_by_type(
+        self, galaxy, expected_ships, random_player
+    ):
+        expected_count = Counter(s.type.name for s in expected_ships)
+        assert galaxy.count_player_ships_by_type(random_player) == dict(
+            expected_count
+        )
+
+    def test_count_by_type_after_build_and_explosion(
+        self, galaxy, random_ship
+    ):
+        player = random_ship.player
+        ship = ShipFactory(
+            player=player, type=random_ship.type, position=random_ship.position
+        )
+        galaxy.add_ship(ship)
+        galaxy.explosions = [ExplosionFactory(ship=random_ship)]
+        galaxy.remove_destroyed_ships()
+        expected_count = Counter(
+            s.type.name for s in galaxy.get_player_ships(player)
+        )
+        assert galaxy.count_player_ships_by_type(player) == dict(
+            expected_count
+        )
+
 
 class TestSearchShip:
     def test_search_ship(self, galaxy, random_ship):
@@ -153,6 +387,19 @@ class TestSearchShip:
     def test_ship_not_found(self, galaxy, fake_id):
         assert galaxy.search_ship(fake_id) is None
 
+    def test_unhashable_id(self, galaxy, random_ship):
+        assert galaxy.search_ship([random_ship.id]) is None
+
+    def test_search_added_ship(self, galaxy, random_position):
+        ship = ShipFactory(position=random_position)
+        galaxy.add_ship(ship)
+        assert galaxy.search_ship(ship.id) is ship
+
+    def test_search_destroyed_ship(self, galaxy, random_ship):
+        galaxy.explosions = [ExplosionFactory(ship=random_ship)]
+        galaxy.remove_destroyed_ships()
+        assert galaxy.search_ship(random_ship.id) is None
+
 
 class TestRemoveDestroyedShips:
     @pytest.fixture
@@ -166,6 +413,21 @@ class TestRemoveDestroyedShips:
         assert random_ship not in galaxy.ships
         galaxy.add_ship(random_ship)
 
+    def test_remove_ships_in_battle(self, galaxy, random_position):
+        battle = [ShipFactory(position=random_position) for _ in range(200)]
+        for ship in battle:
+            galaxy.add_ship(ship)
+        destroyed_ships = battle[::2]
+        galaxy.explosions = [
+            ExplosionFactory(ship=ship) for ship in destroyed_ships
+        ]
+        galaxy.remove_destroyed_ships()
+        survivors = list(galaxy.get_ships_in_position(random_position))
+        assert survivors == battle[1::2]
+        assert all(
+            galaxy.search_ship(ship.id) is None for ship in destroyed_ships
+        )
+
 
 class TestGetPlanetsConflicts:
     @pytest.fixture
@@ -187,6 +449,52 @@ class TestGetShipsConflicts:
         conflicts = ships_in_conflict_galaxy.get_ships_conflicts()
         assert [ships_in_conflict] == list(conflicts)
 
+    def test_ships_conflicts_attacks(
+        self, ships_in_conflict_galaxy, ships_in_conflict
+    ):
+        conflicts = ships_in_conflict_galaxy.get_ships_conflicts_attacks()
+        expected_attacks = {s.player: s.attack for s in ships_in_conflict}
+        assert [(ships_in_conflict, expected_attacks)] == list(conflicts)
+
+    def test_not_contiguous_ships(self, galaxy_size, expected_players):
+        first_player, second_player = expected_players
+        a, b = fake_positions(galaxy_size, 2)
+        ships = [
+            ShipFactory(position=a, player=first_player, attack=1),
+            ShipFactory(position=b, player=first_player, attack=10),
+            ShipFactory(position=a, player=second_player, attack=2),
+            ShipFactory(position=a, player=first_player, attack=4),
+        ]
+        galaxy = Galaxy(name="test", size=galaxy_size, things=ships)
+        conflicts = list(galaxy.get_ships_conflicts_attacks())
+        assert conflicts == [
+            (
+                [ships[0], ships[2], ships[3]],
+                {first_player: 5, second_player: 2},
+            )
+        ]
+
+
+class TestGroupShips:
+    def test_group_ships(self):
+        positions = np.array([(5, 5), (1, 1), (5, 5), (1, 1), (5, 5)])
+        owners = np.array([1, 0, NO_PLAYER, 0, 1])
+        attacks = np.array([1, 2, 4, 8, 16])
+        groups = group_ships(positions, owners, attacks)
+        assert groups["group"].tolist() == [0, 1, 0, 1, 0]
+        assert groups["first"].tolist() == [0, 1]
+        assert groups["players"].tolist() == [1, 1]
+        assert groups["attack"].tolist() == [21, 10]
+        assert groups["pairs_group"].tolist() == [0, 0, 1]
+        assert groups["pairs_owner"].tolist() == [1, NO_PLAYER, 0]
+        assert groups["pairs_attack"].tolist() == [17, 4, 10]
+
+    def test_no_ships(self):
+        empty = np.empty(0, dtype=np.int64)
+        groups = group_ships(empty.reshape(0, 2), empty, empty)
+        assert not len(groups["group"])
+        assert not len(groups["players"])
+
 
 class TestGetShipsInPlanets:
     @pytest.fixture
@@ -212,13 +520,49 @@ class TestGetShipsByPosition:
             for ships_group in ships_by_position.values()
             for s in ships_group
         ]
-        assert all_ships == galaxy.ships
+        assert all_ships == list(galaxy.ships)
 
     def test_ships_by_position(self, ships_by_position):
         for position, ships in ships_by_position.items():
             for ship in ships:
                 assert ship.position == position
 
+    def test_non_contiguous_ships_are_grouped(self, galaxy, random_ship):
+        ship = ShipFactory(position=random_ship.position)
+        galaxy.add_ship(ship)
+        ships_by_position = galaxy.get_ships_by_position()
+        assert ships_by_position[random_ship.position] == [random_ship, ship]
+        assert len(ships_by_position) == len(galaxy.ships) - 1
+
+
+class TestMoveShip:
+    def test_move_ship(self, galaxy, random_ship, random_position):
+        old_position = random_ship.position
+        galaxy.move_ship(random_ship, random_position)
+        assert random_ship.position == random_position
+        assert random_ship not in galaxy.get_ships_in_position(old_position)
+        assert list(galaxy.get_ships_in_position(random_position)) == [
+            random_ship
+        ]
+        assert old_position not in galaxy.get_ships_by_position()
+
+    def test_move_ships(self, galaxy, galaxy_size):
+        ships = galaxy.ships[::2]
+        positions = list(fake_positions(galaxy_size, len(ships)))
+        galaxy.move_ships(ships, positions)
+        assert [s.position for s in ships] == positions
+        ships_by_position = galaxy.get_ships_by_position()
+        assert sum(len(s) for s in ships_by_position.values()) == len(
+            galaxy.ships
+        )
+        for position, ships_in_position in ships_by_position.items():
+            assert all(s.position == position for s in ships_in_position)
+
+    def test_destroyed_ship_leaves_position(self, galaxy, random_ship):
+        galaxy.explosions = [ExplosionFactory(ship=random_ship)]
+        galaxy.remove_destroyed_ships()
+        assert not list(galaxy.get_ships_in_position(random_ship.position))
+
 
 class TestGetShipsInPosition:
     @pytest.fixture
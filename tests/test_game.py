@@ -0,0 +1,93 @@
+import pytest
+
+from pythonium import AbstractPlayer, Game
+from pythonium.bots import pacific_player, standard_player
+from pythonium.game_modes import ClassicMode
+
+
+class TestGameSeed:
+    @pytest.fixture
+    def build_game(self, mocker):
+        def build_game(seed):
+            return Game(
+                "test_sector",
+                [standard_player.Player(), pacific_player.Player()],
+                ClassicMode(),
+                renderer=mocker.Mock(),
+                seed=seed,
+            )
+
+        return build_game
+
+    def test_same_seed_same_galaxy(self, build_game, faker):
+        seed = faker.pyint()
+        galaxy = build_game(seed).galaxy
+        another_galaxy = build_game(seed).galaxy
+        assert galaxy.planets == another_galaxy.planets
+        assert galaxy.ships == another_galaxy.ships
+
+    def test_same_seed_same_players_streams(self, build_game, faker):
+        seed = faker.pyint()
+        streams = [
+            [player.rng.random() for player in build_game(seed).players]
+            for _ in range(2)
+        ]
+        assert streams[0] == streams[1]
+        # Each player has its own stream
+        assert len(set(streams[0])) == len(streams[0])
+
+    def test_game_mode_gets_map_stream(self, build_game, faker):
+        game = build_game(faker.pyint())
+        assert game.gmode.rng is game.map_rng
+
+    def test_random_seed_is_kept(self, build_game):
+        game = build_game(None)
+        assert game.seed_sequence.entropy is not None
+
+
+class MisbehavingPlayer(AbstractPlayer):
+
+    name = "Misbehaving"
+
+    def __init__(self, misbehave):
+        self.misbehave = misbehave
+
+    def next_turn(self, galaxy, context):
+        self.misbehave(self, galaxy)
+        return galaxy
+
+
+def huge_targets(player, galaxy):
+    for ship in galaxy.get_player_ships(player.name):
+        ship.target = (10**20, 0)
+
+
+def unhashable_ids(player, galaxy):
+    for ship in galaxy.get_player_ships(player.name):
+        ship.id = [ship.id]
+        ship.target = (0, 0)
+    for planet in galaxy.get_player_planets(player.name):
+        planet.id = [planet.id]
+        planet.taxes = 10
+
+
+def huge_planet_values(player, galaxy):
+    for planet in galaxy.get_player_planets(player.name):
+        planet.taxes = 10**20
+        planet.new_mines = 10**20
+
+
+class TestMisbehavingPlayer:
+    @pytest.mark.parametrize(
+        "misbehave", (huge_targets, huge_planet_values, unhashable_ids)
+    )
+    def test_game_goes_on(self, mocker, misbehave):
+        game = Game(
+            "test_sector",
+            [MisbehavingPlayer(misbehave), standard_player.Player()],
+            ClassicMode(max_turn=3),
+            renderer=mocker.Mock(),
+            seed=1,
+        )
+        game.play()
+        assert game.galaxy.turn == 3
@@ -0,0 +1,187 @@
+import pytest
+
+from pythonium import AbstractPlayer, Galaxy
+from pythonium.core import Position
+from pythonium.game_modes import ClassicMode
+from tests.factories import PlanetFactory, ShipFactory
+
+ENEMY = "enemy"
+
+
+class Player(AbstractPlayer):
+
+    name = "player"
+
+    def next_turn(self, galaxy, context):
+        return galaxy
+
+
+@pytest.fixture
+def player():
+    return Player()
+
+
+@pytest.fixture
+def planets(player):
+    return {
+        "own": PlanetFactory(position=Position((10, 10)), player=player.name),
+        "enemy": PlanetFactory(position=Position((50, 50)), player=ENEMY),
+        "watched": PlanetFactory(position=Position((90, 90)), player=ENEMY),
+        "free": PlanetFactory(position=Position((30, 30)), player=None),
+    }
+
+
+@pytest.fixture
+def ships(player):
+    return {
+        "own": ShipFactory(position=Position((90, 90)), player=player.name),
+        "in_own_planet": ShipFactory(
+            position=Position((10, 10)), player=ENEMY
+        ),
+        "in_enemy_planet": ShipFactory(
+            position=Position((50, 50)), player=ENEMY
+        ),
+        "in_free_planet": ShipFactory(
+            position=Position((30, 30)), player=ENEMY
+        ),
+        "in_deep_space": ShipFactory(
+            position=Position((70, 20)), player=ENEMY
+        ),
+    }
+
+
+@pytest.fixture
+def galaxy(planets, ships):
+    return Galaxy(
+        name="fog",
+        size=(100, 100),
+        things=list(planets.values()) + list(ships.values()),
+    )
+
+
+@pytest.fixture
+def game_mode():
+    return ClassicMode()
+
+
+@pytest.fixture
+def player_galaxy(game_mode, galaxy, player):
+    return game_mode.galaxy_for_player(galaxy, player)
+
+
+class TestGalaxyForPlayer:
+    @pytest.mark.parametrize(
+        "name, visible",
+        (
+            ("own", True),
+            ("in_own_planet", True),
+            ("in_enemy_planet", False),
+            ("in_free_planet", False),
+            ("in_deep_space", True),
+        ),
+    )
+    def test_visible_ships(self, player_galaxy, ships, name, visible):
+        ship = ships[name]
+        assert (player_galaxy.search_ship(ship.id) is not None) == visible
+
+    @pytest.mark.parametrize(
+        "name, hidden",
+        (("own", False), ("enemy", True), ("watched", False), ("free", False)),
+    )
+    def test_hidden_planets(self, player_galaxy, planets, name, hidden):
+        planet = planets[name]
+        planet_view = player_galaxy.planets[planet.position]
+        assert (planet_view.player is None) == (
+            hidden or planet.player is None
+        )
+        assert (planet_view.clans is None) == hidden
+
+
+class TestUpdatePlayerGalaxy:
+    @staticmethod
+    def describe(galaxy, player):
+        ships = sorted(
+            (s.id, s.position, s.player, s.clans) for s in galaxy.ships
+        )
+        planets = sorted(
+            (p.id, p.player, p.clans) for p in galaxy.planets.values()
+        )
+        by_position = {
+            position: sorted(
+                s.id for s in galaxy.get_ships_in_position(position)
+            )
+            for position, _ in galaxy.get_ships_by_position().items()
+        }
+        player_things = (
+            sorted(p.id for p in galaxy.get_player_planets(player.name)),
+            sorted(s.id for s in galaxy.get_player_ships(player.name)),
+            sorted(p.id for p in galaxy.get_ocuped_planets()),
+        )
+        return ships, planets, by_position, player_things
+
+    @pytest.fixture
+    def assert_updated(self, game_mode, galaxy, player, player_galaxy):
+        def assert_updated():
+            updated_galaxy = game_mode.galaxy_for_player(galaxy, player)
+            built_galaxy = ClassicMode().galaxy_for_player(galaxy, player)
+            assert updated_galaxy is player_galaxy
+            assert self.describe(updated_galaxy, player) == self.describe(
+                built_galaxy, player
+            )
+
+        return assert_updated
+
+    def test_move_ships(self, galaxy, ships, planets, assert_updated):
+        galaxy.move_ship(ships["own"], planets["enemy"].position)
+        galaxy.move_ship(ships["in_deep_space"], planets["free"].position)
+        galaxy.move_ship(ships["in_enemy_planet"], planets["own"].position)
+        assert_updated()
+
+    def test_planet_conquered(self, galaxy, planets, player, assert_updated):
+        galaxy.set_planet_player(planets["enemy"], player.name)
+        galaxy.set_planet_player(planets["own"], ENEMY)
+        assert_updated()
+
+    def test_add_and_remove_ships(self, galaxy, ships, player, assert_updated):
+        galaxy.remove_ships({ships["own"].id, ships["in_own_planet"].id})
+        galaxy.add_ship(
+            ShipFactory(position=Position((50, 50)), player=player.name)
+        )
+        galaxy.add_ship(ShipFactory(position=Position((40, 40)), player=ENEMY))
+        assert_updated()
+
+    def test_writes_are_discarded(
+        self, game_mode, galaxy, player, player_galaxy, planets
+    ):
+        planet = planets["own"]
+        player_galaxy.planets[planet.position].taxes = planet.taxes + 1
+        game_mode.galaxy_for_player(galaxy, player)
+        assert player_galaxy.planets[planet.position].taxes == planet.taxes
+
+
+class TestPlayerGalaxyConflicts:
+    def test_planets_conflicts(self, player_galaxy, planets, ships):
+        conflicts = [
+            (planet.id, [s.id for s in conflict_ships])
+            for planet, conflict_ships in player_galaxy.get_planets_conflicts()
+        ]
+        assert sorted(conflicts) == sorted(
+            (
+                (planets["own"].id, [ships["in_own_planet"].id]),
+                (planets["watched"].id, [ships["own"].id]),
+            )
+        )
+
+    def test_hidden_attack_is_zero(self, galaxy, ships, player, game_mode):
+        galaxy.move_ship(ships["own"], ships["in_deep_space"].position)
+        player_galaxy = game_mode.galaxy_for_player(galaxy, player)
+        conflicts = list(player_galaxy.get_ships_conflicts_attacks())
+        assert [
+            (sorted(s.id for s in conflict_ships), attacks)
+            for conflict_ships, attacks in conflicts
+        ] == [
+            (
+                sorted((ships["own"].id, ships["in_deep_space"].id)),
+                {player.name: ships["own"].attack, ENEMY: 0},
+            )
+        ]
@@ -0,0 +1,50 @@
+import io
+
+import pytest
+
+from pythonium.metrics_collector import MetricsCollector
+
+LOG_LINES = (
+    "Initializing galaxy - players=2; galaxy_name=test; seed=1",
+    "Turn started - turn=0",
+    "Player orders computed - turn=0; player=A; orders=1",
+    "Player orders computed - turn=0; player=B; orders=1",
+    "Pythonium change - turn=0; player=A; count=3; dpythonium_total=30; "
+    "dpythonium_min=5; dpythonium_max=15",
+    "Turn started - turn=1",
+    "Pythonium change - turn=1; player=A; planet=1; dpythonium=4; "
+    "pythonium=4",
+    "Pythonium change - turn=1; player=A; planet=2; dpythonium=6; "
+    "pythonium=6",
+    "Turn started - turn=2",
+)
+
+
+@pytest.fixture
+def metrics():
+    logfile = io.StringIO(
+        "".join(
+            f"2021-06-19 00:00:00,000 [INFO] logger:_log {line}\n"
+            for line in LOG_LINES
+        )
+    )
+    return MetricsCollector(logfile)
+
+
+class TestSummariesForPlayers:
+    def test_summarized_and_single_events(self, metrics):
+        summaries = metrics.get_summaries_for_players(
+            "Pythonium change", "dpythonium"
+        )
+        assert summaries["turn"] == [0, 1, 2]
+        assert summaries["A"] == [
+            {"count": 0, "total": 0},
+            {"count": 3, "total": 30},
+            {"count": 2, "total": 10},
+        ]
+        assert summaries["B"] == [{"count": 0, "total": 0}] * 3
+
+    def test_without_key(self, metrics):
+        summaries = metrics.get_summaries_for_players("Pythonium change")
+        assert [s["count"] for s in summaries["A"]] == [0, 3, 2]
+        assert [s["total"] for s in summaries["A"]] == [0, 0, 0]
@@ -1,6 +1,8 @@
+import attr
 import pytest
 
-from pythonium import Transfer, cfg
+from pythonium import Planet, cfg
+from pythonium.vectors import FrozenTransfer
 
 from .factories import PlanetFactory, ShipTypeFactory
 
@@ -127,6 +129,32 @@ class TestPlanet:
         assert str(planet) == planet.__repr__()
 
 
+class TestPlanetStatic:
+    def test_static_attributes(self, planet):
+        assert planet.position == planet.static.position
+        assert planet.temperature == planet.static.temperature
+        assert planet.concentration == planet.static.concentration
+        assert planet.mine_cost is planet.static.mine_cost
+        assert planet.max_happypoints == planet.static.max_happypoints
+
+    def test_static_attributes_can_not_change(self, planet):
+        with pytest.raises(AttributeError):
+            planet.temperature = 0
+        with pytest.raises(AttributeError):
+            planet.position = (0, 0)
+        assert planet.position == planet.static.position
+        with pytest.raises(attr.exceptions.FrozenInstanceError):
+            planet.static.concentration = 0
+
+    def test_shared_static(self, planet):
+        another_planet = Planet(
+            static=planet.static, underground_pythonium=0, pythonium=0
+        )
+        assert another_planet.static is planet.static
+        assert another_planet.position == planet.position
+        assert another_planet.happypoints == planet.max_happypoints
+
+
 class TestPlanetHappyPoints:
     def test_max_hp_in_optimal_temperature(self, optimal_temperature_planet):
         assert optimal_temperature_planet.max_happypoints == 100
@@ -235,7 +263,7 @@ class TestPlanetMines:
         assert type(planet.can_build_mines()) is int
 
     def test_mine_cost_is_transfer(self, planet):
-        assert type(planet.mine_cost) is Transfer
+        assert type(planet.mine_cost) is FrozenTransfer
 
     def test_mines_init_is_zero(self, planet):
         assert not planet.mines
@@ -417,3 +445,52 @@ class TestPlanetOrders:
         orders = colonized_planet.get_orders()
         order_names = [o[0] for o in orders]
         assert "planet_build_ship" not in order_names
+
+
+class TestPlanetDerivedCache:
+    derived = (
+        "max_mines",
+        "rioting_index",
+        "dpythonium",
+        "dmegacredits",
+        "dhappypoints",
+        "dclans",
+    )
+
+    def compute(self, planet):
+        return {
+            name: getattr(Planet, name).compute(planet)
+            for name in self.derived
+        }
+
+    def test_derived_values_are_cached(self, colonized_planet):
+        dclans = colonized_planet.dclans
+        assert colonized_planet._derived["dclans"] == dclans
+
+    @pytest.mark.parametrize(
+        "attribute", ["clans", "taxes", "happypoints", "mines", "pythonium"]
+    )
+    def test_input_change_invalidates_cache(self, colonized_planet, attribute):
+        for name in self.derived:
+            getattr(colonized_planet, name)
+        setattr(
+            colonized_planet,
+            attribute,
+            getattr(colonized_planet, attribute) // 2,
+        )
+        assert colonized_planet._derived is None
+        assert {
+            name: getattr(colonized_planet, name) for name in self.derived
+        } == self.compute(colonized_planet)
+
+    def test_can_build_mines_invalidated(self, colonized_planet):
+        can_build_mines = colonized_planet.can_build_mines()
+        colonized_planet.megacredits = 0
+        assert colonized_planet.can_build_mines() == 0
+        assert can_build_mines >= 0
+
+    def test_other_changes_keep_cache(self, colonized_planet, ship_type):
+        colonized_planet.dclans
+        colonized_planet.new_ship = ship_type
+        colonized_planet.new_mines = 1
+        assert "dclans" in colonized_planet._derived
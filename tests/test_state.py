@@ -0,0 +1,112 @@
+import pytest
+
+from pythonium.galaxy import NO_PLAYER
+from pythonium.state import PLANET_COLUMNS, PLANET_STATIC_COLUMNS, GalaxyState
+
+
+@pytest.fixture
+def state(galaxy):
+    return GalaxyState(galaxy)
+
+
+class TestGalaxyStateColumns:
+    def test_planets_columns(self, state, galaxy):
+        assert len(state.planets) == len(galaxy.planets)
+        for name in PLANET_COLUMNS:
+            assert state.planets[name].tolist() == [
+                getattr(p, name) for p in galaxy.planets.values()
+            ]
+
+    def test_ships_positions(self, state, galaxy):
+        assert [tuple(p) for p in state.ships.positions.tolist()] == [
+            s.position for s in galaxy.ships
+        ]
+
+    def test_owner(self, state, galaxy):
+        for planet, handle in zip(
+            galaxy.planets.values(), state.planets.owner.tolist()
+        ):
+            assert state.get_player(handle) == planet.player
+            if planet.player is None:
+                assert handle == NO_PLAYER
+
+    def test_get_row(self, state, random_planet):
+        row = state.planets.get_row(random_planet)
+        assert state.planets.entities[row] is random_planet
+
+
+class TestEntityRow:
+    @pytest.fixture
+    def planet_row(self, state, random_planet):
+        return state.planets.view(state.planets.get_row(random_planet))
+
+    def test_read_columns(self, planet_row, random_planet):
+        assert planet_row.clans == random_planet.clans
+        assert planet_row.player == random_planet.player
+        assert planet_row.position == random_planet.position
+
+    def test_derived_attributes(self, planet_row, random_planet):
+        assert planet_row.dpythonium == random_planet.dpythonium
+        assert planet_row.dclans == random_planet.dclans
+        assert planet_row.get_orders() == random_planet.get_orders()
+
+    def test_write_columns(self, state, planet_row, random_planet):
+        clans = random_planet.clans
+        planet_row.clans = clans + 10
+        assert planet_row.clans == clans + 10
+        assert random_planet.clans == clans
+        state.commit()
+        assert random_planet.clans == clans + 10
+
+    @pytest.mark.parametrize("name", sorted(PLANET_STATIC_COLUMNS))
+    def test_static_columns_can_not_change(self, state, planet_row, name):
+        with pytest.raises(AttributeError):
+            setattr(planet_row, name, 0)
+        with pytest.raises(ValueError):
+            state.planets[name][0] = 0
+        assert not len(state.planets.commit())
+
+    def test_ship_owner_can_not_change(self, state, faker):
+        ship_row = state.ships.view(0)
+        with pytest.raises(AttributeError):
+            ship_row.player = faker.word()
+
+
+class TestGalaxyStateCommit:
+    def test_commit_only_changed_rows(self, state, galaxy):
+        state.planets["mines"][0] += 1
+        assert state.planets.commit().tolist() == [0]
+        assert not len(state.planets.commit())
+
+    def test_commit_owner(self, state, galaxy, random_planet, faker):
+        new_player = faker.uuid4()
+        row = state.planets.get_row(random_planet)
+        state.planets.view(row).player = new_player
+        state.commit()
+        assert random_planet.player == new_player
+        assert list(galaxy.get_player_planets(new_player)) == [random_planet]
+
+
+class TestGalaxyPersistentState:
+    def test_kept_across_requests(self, galaxy):
+        assert galaxy.state is galaxy.state
+
+    def test_refresh_changed_planets(self, galaxy, random_planet, faker):
+        state = galaxy.state
+        row = state.planets.get_row(random_planet)
+        random_planet.clans += 10
+        new_player = faker.uuid4()
+        galaxy.set_planet_player(random_planet, new_player)
+        assert galaxy.state.planets["clans"][row] == random_planet.clans
+        assert state.get_player(state.planets.owner[row]) == new_player
+        assert not len(state.planets.commit())
+
+    def test_commit_is_not_read_again(self, galaxy, random_planet, mocker):
+        planets = galaxy.state.planets
+        row = planets.get_row(random_planet)
+        planets["mines"][row] += 1
+        planets.commit()
+        refresh = mocker.spy(planets, "refresh")
+        galaxy.state
+        refresh.assert_not_called()
+        assert random_planet.mines == planets["mines"][row]
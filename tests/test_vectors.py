@@ -0,0 +1,76 @@
+import copy
+import gc
+
+import attr
+import pytest
+
+from pythonium import Transfer
+from pythonium.vectors import FrozenTransfer
+
+from .factories import ShipTypeFactory, TransferVectorFactory
+
+
+class TestFrozenTransfer:
+    @pytest.fixture
+    def transfer(self):
+        return TransferVectorFactory()
+
+    def test_intern_same_amounts(self, transfer):
+        frozen = FrozenTransfer.intern(transfer)
+        same_transfer = Transfer(
+            megacredits=transfer.megacredits,
+            pythonium=transfer.pythonium,
+            clans=transfer.clans,
+        )
+        assert frozen is FrozenTransfer.intern(same_transfer)
+        assert FrozenTransfer.intern(frozen) is frozen
+
+    def test_can_not_change(self, transfer):
+        frozen = FrozenTransfer.intern(transfer)
+        with pytest.raises(attr.exceptions.FrozenInstanceError):
+            frozen.megacredits = 0
+
+    def test_never_copied(self, transfer):
+        frozen = FrozenTransfer.intern(transfer)
+        assert copy.copy(frozen) is frozen
+        assert copy.deepcopy(frozen) is frozen
+
+    def test_compared_by_value(self, transfer):
+        frozen = FrozenTransfer.intern(transfer)
+        same_transfer = transfer * 1
+        assert frozen == same_transfer
+        assert same_transfer == frozen
+        assert not frozen != same_transfer
+        assert frozen != transfer + Transfer(megacredits=1)
+        assert hash(frozen) == hash(FrozenTransfer(*attr.astuple(frozen)))
+
+    def test_unused_are_dropped(self):
+        key = (123457, 7654321, 0)
+        FrozenTransfer.intern(Transfer(*key))
+        gc.collect()
+        assert key not in FrozenTransfer._interned
+
+    def test_operations_return_transfer(self, transfer):
+        frozen = FrozenTransfer.intern(transfer)
+        assert type(-frozen) is Transfer
+        assert type(frozen * 2) is Transfer
+        assert type(frozen + transfer) is Transfer
+
+
+class TestShipType:
+    def test_cost_is_interned(self):
+        ship_type = ShipTypeFactory()
+        another_ship_type = ShipTypeFactory(cost=ship_type.cost * 1)
+        assert another_ship_type.cost is ship_type.cost
+
+    def test_never_copied(self):
+        ship_type = ShipTypeFactory()
+        assert copy.deepcopy(ship_type) is ship_type
+        assert copy.deepcopy([ship_type])[0] is ship_type
+
+    def test_compared_by_value(self):
+        ship_type = ShipTypeFactory()
+        same_ship_type = attr.evolve(ship_type)
+        assert same_ship_type == ship_type
+        assert {ship_type: 1}[same_ship_type] == 1
+        assert attr.evolve(ship_type, attack=ship_type.attack + 1) != ship_type
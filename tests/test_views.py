@@ -0,0 +1,166 @@
+import copy
+
+import attr
+import pytest
+
+from pythonium.galaxy import Galaxy
+from pythonium.game_modes import HIDDEN_PLANET_FIELDS, HIDDEN_SHIP_FIELDS
+from pythonium.planet import Planet
+from pythonium.vectors import FrozenTransfer, Transfer
+from pythonium.views import PlanetView, ShipView, ViewsJournal
+from tests.factories import PlanetFactory, ShipFactory
+
+
+class TestPlanetView:
+    @pytest.fixture
+    def planet(self, faker):
+        return PlanetFactory(player=faker.word())
+
+    @pytest.fixture
+    def view(self, planet):
+        return PlanetView(planet)
+
+    @pytest.fixture
+    def hidden_view(self, planet):
+        return PlanetView(planet, HIDDEN_PLANET_FIELDS)
+
+    def test_read_from_planet(self, view, planet):
+        assert view.id == planet.id
+        assert view.position == planet.position
+        assert view.clans == planet.clans
+        assert view.dmegacredits == planet.dmegacredits
+
+    def test_write_keep_planet(self, view, planet):
+        taxes = planet.taxes
+        view.taxes = taxes + 1
+        assert view.taxes == taxes + 1
+        assert planet.taxes == taxes
+
+    def test_derived_values_use_written_values(self, view, planet):
+        view.taxes = 0
+        planet.taxes = 0
+        expected = planet.dmegacredits
+        planet.taxes = 100
+        assert view.dmegacredits == expected
+
+    def test_derived_values_are_cached(self, view, planet, mocker):
+        compute = mocker.patch.object(
+            PlanetView.dpythonium, "compute", wraps=Planet.dpythonium.compute
+        )
+        expected = planet.dpythonium
+        assert view.dpythonium == expected
+        assert view.dpythonium == expected
+        assert compute.call_count == 1
+
+        view.mines = planet.mines + 1
+        view.dpythonium
+        assert compute.call_count == 2
+
+        planet.pythonium += 1
+        view.dpythonium
+        assert compute.call_count == 3
+
+    def test_journal_reset_discards_derived_values(self, planet):
+        journal = ViewsJournal()
+        view = PlanetView(planet, journal=journal)
+        planet.clans = 1000
+        planet.taxes = 0
+        view.taxes = 100
+        assert view.dmegacredits != planet.dmegacredits
+        journal.reset()
+        assert view.dmegacredits == planet.dmegacredits
+
+    def test_hidden_fields(self, hidden_view, planet):
+        for field in HIDDEN_PLANET_FIELDS:
+            assert getattr(hidden_view, field) is None
+        assert hidden_view.position == planet.position
+
+    def test_constants_are_shared(self, view, planet):
+        assert view.static is planet.static
+        assert view.mine_cost is planet.mine_cost
+        assert not view._journal.written
+
+    def test_journal_reset(self, planet):
+        journal = ViewsJournal()
+        view = PlanetView(planet, journal=journal)
+        view.taxes = planet.taxes + 1
+        journal.reset()
+        assert not journal.written
+        assert view.taxes == planet.taxes
+
+    def test_deepcopy_keep_writes(self, view, planet):
+        view.taxes = planet.taxes + 1
+        view_copy = copy.deepcopy(view)
+        view_copy.taxes = planet.taxes + 2
+        assert view.taxes == planet.taxes + 1
+        assert view_copy.taxes == planet.taxes + 2
+
+
+class TestShipView:
+    @pytest.fixture
+    def ship(self, faker):
+        return ShipFactory(player=faker.word(), position=(10, 10))
+
+    def test_hidden_fields(self, ship):
+        view = ShipView(ship, HIDDEN_SHIP_FIELDS)
+        for field in HIDDEN_SHIP_FIELDS:
+            assert getattr(view, field) is None
+        assert view.player == ship.player
+
+    def test_write_keep_ship(self, ship, faker):
+        view = ShipView(ship)
+        position = ship.position
+        view.target = (position[0] + 1, position[1])
+        view.transfer.megacredits += 1
+        assert ship.target != view.target
+        assert ship.transfer.megacredits + 1 == view.transfer.megacredits
+
+    def test_type_is_shared(self, ship):
+        view = ShipView(ship)
+        assert view.type is ship.type
+
+    def test_shared_journal(self, ship):
+        # Ships share the default empty transfer
+        another_ship = ShipFactory(position=ship.position)
+        journal = ViewsJournal()
+        views = [ShipView(s, journal=journal) for s in (ship, another_ship)]
+        assert views[0].transfer is views[1].transfer
+        assert views[0].transfer is not ship.transfer
+
+    def test_galaxy_with_views(self, ship):
+        planet = PlanetFactory(player=ship.player)
+        galaxy = Galaxy(name="views", size=(100, 100), things=[planet, ship])
+        player_galaxy = Galaxy(
+            name=galaxy.name,
+            size=galaxy.size,
+            things=[PlanetView(planet), ShipView(ship)],
+        )
+        assert player_galaxy.search_ship(ship.id).position == ship.position
+        assert [
+            p.id for p in player_galaxy.get_player_planets(ship.player)
+        ] == [planet.id]
+        assert player_galaxy.count_player_ships_by_type(ship.player) == {
+            ship.type.name: 1
+        }
+
+
+@pytest.mark.parametrize(
+    "entity_factory, view_class",
+    ((PlanetFactory, PlanetView), (ShipFactory, ShipView)),
+)
+def test_view_api_never_writes_entity(entity_factory, view_class):
+    entity = entity_factory(position=(10, 10))
+    expected = copy.deepcopy(entity)
+    view = view_class(entity)
+    for field in attr.fields(type(entity)):
+        if field.name.startswith("_"):
+            continue
+        value = getattr(view, field.name)
+        if isinstance(value, Transfer) and not isinstance(
+            value, FrozenTransfer
+        ):
+            # Values that can change in place are copies
+            value.megacredits += 1
+        setattr(view, field.name, None)
+    view.move((20, 20))
+    assert entity == expected